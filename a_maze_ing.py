@@ -1,8 +1,10 @@
 from mazegen.load_config import load_config
 from mazegen.MazeGenerator import MazeGenerator
 from mazegen.MazeSolver import MazeSolver
-from mazegen.writer import save_maze
+from mazegen.writer import save_maze, save_maze_stream
+from mazegen.eller import eller_rows
 from mazegen.interface.MazeDraw import MazeDraw
+import random
 
 
 def main() -> None:
@@ -11,18 +13,40 @@ def main() -> None:
         config = load_config()
         print(config)
 
-        generator = MazeGenerator(config["HEIGHT"], config["WIDTH"])
+        if config.get("ALGORITHM") == "eller":
+            # Rows go straight to the file, the maze never sits in memory
+            if not config["PERFECT"]:
+                raise ValueError(
+                    "ERROR: ALGORITHM=eller only generates perfect mazes."
+                )
+            rows = eller_rows(
+                config["WIDTH"], config["HEIGHT"],
+                config["ENTRY"], config["EXIT"],
+                random.Random(config.get("SEED"))
+            )
+            save_maze_stream(rows, config)
+            return
+
+        generator = MazeGenerator(
+            config["HEIGHT"], config["WIDTH"], config.get("SEED"),
+            algorithm=config.get("ALGORITHM", "backtracker"),
+            workers=config.get("WORKERS", 1),
+            imperfect_ratio=config.get("IMPERFECT_RATIO", 0.05)
+        )
         generator.generate_maze(
             config["PERFECT"], config["ENTRY"], config["EXIT"]
         )
 
         solver = MazeSolver(generator.grid)
-        path = solver.solve_maze(config["ENTRY"], config["EXIT"])
+        path = solver.solve_maze(
+            config["ENTRY"], config["EXIT"], config.get("SOLVER", "bfs")
+        )
         save_maze(solver.grid, path, config)
         print(solver.grid)
 
         screen = MazeDraw(
-            "A-Maze-Ing", generator.grid, config["ENTRY"], config["EXIT"], path
+            "A-Maze-Ing", generator.grid, config["ENTRY"], config["EXIT"],
+            path, renderer=config.get("RENDERER", "tiles")
         )
         screen.draw()
     except ValueError as e:
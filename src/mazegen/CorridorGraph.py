@@ -0,0 +1,275 @@
+from array import array
+from heapq import heappop, heappush
+from mazegen.MazeGrid import MazeGrid
+
+
+# Directions indexed N, E, S, W: wall bit and the index of the opposite
+WALLS = (1, 2, 4, 8)
+OPPOSITE = (2, 3, 0, 1)
+
+# Number of set bits of every 4-bit mask of open directions
+DEGREE = bytes(bin(mask).count("1") for mask in range(16))
+
+
+class CorridorGraph:
+    """
+    A maze contracted into a weighted graph of junctions.
+
+    Cells with exactly two open walls are corridor cells: a path entering
+    one can only leave through the other. Every other free cell (junctions,
+    dead ends) becomes a node, and each corridor between two nodes becomes
+    a single edge weighted by its length in steps. A corridor closing a
+    loop with no junction on it gets one of its cells as a node.
+
+    Every corridor cell remembers its edge and its distance from the
+    edge's first end, so any cell can be attached to the graph in O(1),
+    and edges are expanded back into cells only for the path returned.
+
+    Attributes:
+        grid (MazeGrid): The contracted maze.
+        width (int): The width of the maze grid.
+        cell_count (int): The number of free (non-pattern) cells.
+        node_count (int): The number of graph nodes.
+        edge_count (int): The number of graph edges.
+        expanded (int): The number of nodes settled by the last query.
+    """
+
+    def __init__(self, grid: MazeGrid) -> None:
+        """Contract the corridors of a maze into a junction graph.
+
+        Args:
+            grid (MazeGrid): The maze to contract. The graph is a snapshot:
+                             build a new one if the grid changes.
+        """
+        self.grid = grid
+        self.width = width = grid.width
+        cells = grid.cells
+        size = len(cells)
+        self.steps = (-width, 1, width, -1)
+
+        # Open directions of every cell, ignoring walls open on the border
+        self.open = open_dirs = bytearray(size)
+        self.cell_count = 0
+        for index, walls in enumerate(cells):
+            if walls == 31:
+                continue
+            self.cell_count += 1
+            x = index % width
+            open_dirs[index] = (
+                (not walls & 1 and index >= width)
+                | (not walls & 2 and x < width - 1) << 1
+                | (not walls & 4 and index + width < size) << 2
+                | (not walls & 8 and x > 0) << 3
+            )
+
+        self.adjacency: dict[int, list[int]] = {}
+        # Per edge: both ends, the direction leaving each end, the length
+        self.ends = array("I")
+        self.dirs = bytearray()
+        self.lengths = array("I")
+        # Per corridor cell: its edge (-1 for nodes) and offset from ends[0]
+        self.cell_edge = array("i", [-1]) * size
+        self.cell_offset = array("I", bytes(4 * size))
+
+        for index, walls in enumerate(cells):
+            if walls != 31 and DEGREE[open_dirs[index]] != 2:
+                self.adjacency[index] = []
+        for node in list(self.adjacency):
+            self._walk_edges(node)
+        # Loops made only of corridor cells
+        for index, walls in enumerate(cells):
+            if (walls != 31 and DEGREE[open_dirs[index]] == 2 and
+                    self.cell_edge[index] < 0 and
+                    index not in self.adjacency):
+                self.adjacency[index] = []
+                self._walk_edges(index)
+
+        self.node_count = len(self.adjacency)
+        self.edge_count = len(self.lengths)
+        self.expanded = 0
+
+    @property
+    def contraction_ratio(self) -> float:
+        """The share of free cells kept as graph nodes (lower is better)."""
+        if not self.cell_count:
+            return 0.0
+        return self.node_count / self.cell_count
+
+    def _walk_edges(self, node: int) -> None:
+        """Creates the edges leaving a node that do not exist yet."""
+        open_dirs = self.open
+        steps = self.steps
+        adjacency = self.adjacency
+        for direction in range(4):
+            if not open_dirs[node] >> direction & 1:
+                continue
+            cell = node + steps[direction]
+            if self.cell_edge[cell] >= 0:
+                continue  # Walked from the other end already
+            if cell in adjacency and (cell < node or cell == node):
+                continue  # Node to node edge, created from the lower one
+
+            edge = len(self.lengths)
+            length = 1
+            heading = direction
+            while cell not in adjacency:
+                self.cell_edge[cell] = edge
+                self.cell_offset[cell] = length
+                # Leave through the open wall we did not come in by
+                mask = open_dirs[cell] & ~(1 << OPPOSITE[heading])
+                heading = (mask & -mask).bit_length() - 1
+                cell += steps[heading]
+                length += 1
+
+            self.ends.extend((node, cell))
+            self.dirs.extend((direction, OPPOSITE[heading]))
+            self.lengths.append(length)
+            adjacency[node].append(edge)
+            if cell != node:
+                adjacency[cell].append(edge)
+
+    def _edge_cells(self, edge: int) -> list[int]:
+        """Expands an edge into its cells, from ends[0] to ends[1]."""
+        steps = self.steps
+        open_dirs = self.open
+        cell = self.ends[2 * edge]
+        heading = self.dirs[2 * edge]
+        path = [cell]
+        for _ in range(self.lengths[edge]):
+            cell += steps[heading]
+            path.append(cell)
+            mask = open_dirs[cell] & ~(1 << OPPOSITE[heading])
+            if mask:
+                heading = (mask & -mask).bit_length() - 1
+        return path
+
+    def _attach(self, index: int) -> list[tuple[int, int, list[int]]]:
+        """Lists the nodes a cell reaches first, with the cells between.
+
+        Returns:
+            list[tuple[int, int, list[int]]]: For each reachable node, the
+            node, its distance from the cell, and the cells from the cell
+            to the node (both included).
+        """
+        if index in self.adjacency:
+            return [(index, 0, [index])]
+        edge = self.cell_edge[index]
+        if edge < 0:
+            return []
+        offset = self.cell_offset[index]
+        cells = self._edge_cells(edge)
+        length = self.lengths[edge]
+        return [
+            (self.ends[2 * edge], offset, cells[offset::-1]),
+            (self.ends[2 * edge + 1], length - offset, cells[offset:]),
+        ]
+
+    def solve(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Finds the shortest path from entry to exit on the graph.
+
+        Runs Dijkstra over the junction nodes, starting from the nodes the
+        entry reaches first and stopping once no shorter way to the exit
+        can remain. Dead ends are never expanded unless they are the
+        target, and only the edges of the chosen route are expanded back
+        into cells.
+
+        Args:
+            entry (tuple[int, int]): The starting coordinates (x, y).
+            exit (tuple[int, int]): The target coordinates (x, y).
+
+        Returns:
+            list[tuple[int, int]]: A list of coordinates representing the
+            path from entry to exit. Returns an empty list if no path is found.
+        """
+        width = self.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        self.expanded = 0
+        sources = self._attach(start)
+        # Both ends of a loop corridor can be the same node: keep the best
+        targets: dict[int, tuple[int, list[int]]] = {}
+        for node, cost, cells in self._attach(goal):
+            if node not in targets or cost < targets[node][0]:
+                targets[node] = (cost, cells[::-1])
+        if not sources or not targets:
+            return []
+
+        best = -1
+        best_path: list[int] = []
+        # Both ends on the same corridor: the direct way along it
+        edge = self.cell_edge[start]
+        if edge >= 0 and edge == self.cell_edge[goal]:
+            a, b = self.cell_offset[start], self.cell_offset[goal]
+            cells = self._edge_cells(edge)
+            best = abs(a - b)
+            best_path = cells[a:b + 1] if a <= b else cells[b:a + 1][::-1]
+        elif start == goal:
+            return [entry]
+
+        dist: dict[int, int] = {}
+        # How each node was reached: (previous node, edge), or (-1, source)
+        came: dict[int, tuple[int, int]] = {}
+        heap: list[tuple[int, int]] = []
+        for number, (node, cost, _) in enumerate(sources):
+            if node not in dist or cost < dist[node]:
+                dist[node] = cost
+                came[node] = (-1, number)
+                heappush(heap, (cost, node))
+
+        done: set[int] = set()
+        while heap:
+            cost, node = heappop(heap)
+            if best >= 0 and cost >= best:
+                break
+            if node in done:
+                continue
+            done.add(node)
+            self.expanded += 1
+            if node in targets:
+                total = cost + targets[node][0]
+                if best < 0 or total < best:
+                    best = total
+                    best_path = self._node_path(node, came, sources)
+                    best_path += targets[node][1][1:]
+            edges = self.adjacency[node]
+            if len(edges) == 1 and node not in targets and came[node][0] >= 0:
+                continue  # A dead end leads nowhere else
+            for edge in edges:
+                a, b = self.ends[2 * edge], self.ends[2 * edge + 1]
+                other = b if a == node else a
+                new_cost = cost + self.lengths[edge]
+                known = dist.get(other)
+                if other in done or (known is not None and known <= new_cost):
+                    continue
+                dist[other] = new_cost
+                came[other] = (node, edge)
+                heappush(heap, (new_cost, other))
+
+        return [(cell % width, cell // width) for cell in best_path]
+
+    def _node_path(
+        self,
+        node: int,
+        came: dict[int, tuple[int, int]],
+        sources: list[tuple[int, int, list[int]]]
+    ) -> list[int]:
+        """Expands the route found by Dijkstra back into cells."""
+        pieces: list[list[int]] = []
+        while True:
+            previous, via = came[node]
+            if previous < 0:
+                pieces.append(sources[via][2])
+                break
+            cells = self._edge_cells(via)
+            if self.ends[2 * via] != previous:
+                cells.reverse()
+            pieces.append(cells[1:])
+            node = previous
+        path: list[int] = []
+        for piece in reversed(pieces):
+            path += piece
+        return path
@@ -0,0 +1,180 @@
+from mazegen.common import Direction
+from mazegen.MazeGrid import MazeGrid
+
+
+# Value of a blocked (PATTERN) cell in half-edge form: both walls closed
+BLOCKED = 16
+
+# From a cell value to its half-edge value: EAST, SOUTH and the blocked flag
+HALF_EDGE = bytes(value & 22 for value in range(256))
+
+# From a half-edge value to the wall it closes on the neighbor's side
+EAST_TO_WEST = bytes(8 if value & 2 else 0 for value in range(256))
+SOUTH_TO_NORTH = bytes(1 if value & 4 else 0 for value in range(256))
+CLOSE_NORTH = bytes(value | 1 for value in range(256))
+CLOSE_WEST = bytes(value | 8 for value in range(256))
+
+# Bit strings (b"0"/b"1") to and from 0/1 flags of one bit each
+FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+# Per-cell flags of each bitset
+EAST_FLAG = bytes(1 if value & 2 else 0 for value in range(256))
+SOUTH_FLAG = bytes(1 if value & 4 else 0 for value in range(256))
+BLOCKED_FLAG = bytes(1 if value & BLOCKED else 0 for value in range(256))
+
+
+def expand_half_edges(halves: bytes | bytearray, width: int) -> bytearray:
+    """Converts half-edge values to the 4-bit cell format.
+
+    The NORTH wall of a cell is the SOUTH wall of the cell above it, and
+    its WEST wall the EAST wall of the cell on its left. Both are moved
+    into place for the whole grid at once, by shifting the flags as one
+    big integer by a row or by a cell; the outer NORTH and WEST walls are
+    then closed. Blocked cells come out as 31.
+
+    Args:
+        halves (bytes | bytearray): One value per cell, holding its EAST
+                                    (2) and SOUTH (4) walls and 16 if the
+                                    cell is blocked, in row-major order.
+        width (int): The width of the grid.
+
+    Returns:
+        bytearray: The cell bitmasks, in row-major order.
+    """
+    size = len(halves)
+    value = int.from_bytes(halves, "big")
+    north = int.from_bytes(halves.translate(SOUTH_TO_NORTH), "big")
+    west = int.from_bytes(halves.translate(EAST_TO_WEST), "big")
+    # Byte i of the result is cell i, so cell i - width is 8 * width
+    # bits further up
+    value |= north >> (8 * width) | west >> 8
+    cells = bytearray(value.to_bytes(size, "big"))
+    cells[:width] = cells[:width].translate(CLOSE_NORTH)
+    cells[::width] = cells[::width].translate(CLOSE_WEST)
+    return cells
+
+
+def _pack_flags(flags: bytes) -> bytearray:
+    """Packs 0/1 flags into a bitset, flag i in bit i % 8 of byte i // 8."""
+    digits = flags.translate(FLAG_DIGITS)[::-1] or b"0"
+    size = (len(flags) + 7) >> 3
+    return bytearray(int(digits, 2).to_bytes(size, "little"))
+
+
+def _unpack_flags(bits: bytes | bytearray, size: int) -> bytes:
+    """Unpacks the first size flags of a bitset as 0/1 bytes."""
+    digits = format(int.from_bytes(bits, "little"), f"0{size}b")
+    return digits[::-1][:size].encode().translate(DIGIT_FLAGS)
+
+
+def _bit(bits: bytearray, index: int) -> int:
+    """Returns bit index of a bitset."""
+    return bits[index >> 3] >> (index & 7) & 1
+
+
+class HalfEdgeGrid:
+    """
+    A maze grid that stores each wall once.
+
+    Every wall between two cells is the EAST or SOUTH wall of exactly one
+    of them, so a cell only keeps those two, in two bitsets; its NORTH and
+    WEST walls are read from its neighbors. Removing a wall clears a
+    single bit instead of updating both cells. A third bitset marks the
+    blocked (PATTERN) cells.
+
+    Attributes:
+        width (int): The width of the maze grid.
+        height (int): The height of the maze grid.
+        east (bytearray): Bit i is set if cell i has its EAST wall closed.
+        south (bytearray): Bit i is set if cell i has its SOUTH wall closed.
+        blocked (bytearray): Bit i is set if cell i is a PATTERN cell.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initialize the grid with every wall closed and no blocked cell.
+
+        Args:
+            width (int): The width of the maze (number of columns).
+            height (int): The height of the maze (number of rows).
+        """
+        self.width = width
+        self.height = height
+        size = (width * height + 7) >> 3
+        self.east = bytearray(b"\xff") * size
+        self.south = bytearray(b"\xff") * size
+        self.blocked = bytearray(size)
+
+    @classmethod
+    def from_grid(cls, grid: MazeGrid) -> "HalfEdgeGrid":
+        """Build a half-edge grid from the walls of a MazeGrid.
+
+        Args:
+            grid (MazeGrid): The grid to convert. Its WEST and NORTH walls
+                             must agree with its neighbors' EAST and SOUTH
+                             walls, as in any carved maze.
+
+        Returns:
+            HalfEdgeGrid: A new grid with the same walls.
+        """
+        edges = cls(grid.width, grid.height)
+        cells = bytes(grid.cells)
+        edges.east[:] = _pack_flags(cells.translate(EAST_FLAG))
+        edges.south[:] = _pack_flags(cells.translate(SOUTH_FLAG))
+        edges.blocked[:] = _pack_flags(
+            cells.translate(HALF_EDGE).translate(BLOCKED_FLAG)
+        )
+        return edges
+
+    def half_edges(self) -> bytearray:
+        """Return one half-edge value per cell (EAST 2, SOUTH 4, 16)."""
+        size = self.width * self.height
+        east = int.from_bytes(_unpack_flags(self.east, size), "big")
+        south = int.from_bytes(_unpack_flags(self.south, size), "big")
+        blocked = int.from_bytes(_unpack_flags(self.blocked, size), "big")
+        value = east << 1 | south << 2 | blocked << 4
+        return bytearray(value.to_bytes(size, "big"))
+
+    def to_cells(self) -> bytearray:
+        """Return the cell bitmasks in the 4-bit format of MazeGrid."""
+        return expand_half_edges(self.half_edges(), self.width)
+
+    def to_grid(self) -> MazeGrid:
+        """Return a new MazeGrid holding the same walls."""
+        grid = MazeGrid(self.width, self.height, 0)
+        grid.cells[:] = self.to_cells()
+        return grid
+
+    def get(self, x: int, y: int) -> int:
+        """Return the 4-bit bitmask of cell (x, y), derived on demand."""
+        index = y * self.width + x
+        if _bit(self.blocked, index):
+            return 31
+        walls = (_bit(self.east, index) * Direction.EAST
+                 | _bit(self.south, index) * Direction.SOUTH)
+        if y == 0 or _bit(self.south, index - self.width):
+            walls |= Direction.NORTH
+        if x == 0 or _bit(self.east, index - 1):
+            walls |= Direction.WEST
+        return walls
+
+    def carve(self, x: int, y: int, direction: Direction) -> None:
+        """Remove the wall of cell (x, y) in the given direction.
+
+        The wall is cleared in the one place it is stored: the cell itself
+        for EAST and SOUTH, the neighbor for NORTH and WEST.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            direction (Direction): The side of the wall to remove.
+        """
+        index = y * self.width + x
+        if direction == Direction.NORTH:
+            bits, index = self.south, index - self.width
+        elif direction == Direction.WEST:
+            bits, index = self.east, index - 1
+        elif direction == Direction.EAST:
+            bits = self.east
+        else:
+            bits = self.south
+        bits[index >> 3] &= ~(1 << (index & 7))
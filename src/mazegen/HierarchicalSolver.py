@@ -0,0 +1,351 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from mazegen.MazeGrid import MazeGrid
+
+
+# A cluster to measure: its cells, width, height, and the local indices of
+# its entrances
+ClusterTask = tuple[bytes, int, int, list[int]]
+
+
+def _tile_field(
+    tile: bytes,
+    width: int,
+    height: int,
+    source: int
+) -> "tuple[array[int], bytearray]":
+    """Runs a BFS that never leaves a cluster.
+
+    Args:
+        tile (bytes): The cells of the cluster, row by row.
+        width (int): The width of the cluster.
+        height (int): The height of the cluster.
+        source (int): The local index of the starting cell.
+
+    Returns:
+        tuple[array[int], bytearray]: The distance of every cell of the
+        cluster (-1 if unreachable inside it), and the direction back to
+        each cell's parent (0 N, 1 E, 2 S, 3 W), one byte per cell.
+    """
+    size = width * height
+    last = width - 1
+    dist = array("i", [-1]) * size
+    parents = bytearray(size)
+    dist[source] = 0
+    layer = [source]
+    depth = 0
+    while layer:
+        depth += 1
+        next_layer: list[int] = []
+        append = next_layer.append
+        for curr in layer:
+            walls = tile[curr]
+            # Unrolled N, E, S, W checks: this loop is the whole build cost
+            if not walls & 1 and curr >= width and dist[curr - width] < 0:
+                dist[curr - width] = depth
+                parents[curr - width] = 2
+                append(curr - width)
+            if not walls & 2 and curr % width < last and dist[curr + 1] < 0:
+                dist[curr + 1] = depth
+                parents[curr + 1] = 3
+                append(curr + 1)
+            if (not walls & 4 and curr + width < size and
+                    dist[curr + width] < 0):
+                dist[curr + width] = depth
+                parents[curr + width] = 0
+                append(curr + width)
+            if not walls & 8 and curr % width and dist[curr - 1] < 0:
+                dist[curr - 1] = depth
+                parents[curr - 1] = 1
+                append(curr - 1)
+        layer = next_layer
+    return dist, parents
+
+
+def _cluster_distances(task: ClusterTask) -> list[list[int]]:
+    """Measures the distances between all entrances of one cluster.
+
+    Runs in a worker process.
+
+    Args:
+        task (ClusterTask): The cluster to measure.
+
+    Returns:
+        list[list[int]]: For each entrance, its distance inside the cluster
+        to every entrance (-1 if they are not connected inside it).
+    """
+    tile, width, height, entrances = task
+    rows = []
+    for source in entrances:
+        dist, _ = _tile_field(tile, width, height, source)
+        rows.append([dist[target] for target in entrances])
+    return rows
+
+
+class HierarchicalSolver:
+    """
+    A hierarchical (HPA*-style) solver for very large mazes.
+
+    The grid is split into square clusters. Every open wall crossing a
+    cluster border makes an entrance on each side, joined by an edge of
+    length 1, and the entrances of a cluster are joined by the lengths of
+    their shortest paths inside it, measured once per cluster in parallel
+    processes. A query only searches this abstract graph, then refines the
+    clusters along the chosen route back into cells.
+
+    Since every border crossing is an entrance, any path splits into
+    segments that stay inside one cluster each, so exact queries return a
+    shortest path.
+
+    Attributes:
+        grid (MazeGrid): The maze to solve.
+        cluster_size (int): The side of a cluster, in cells.
+        graph (dict[int, dict[int, int]]): The abstract graph, from each
+            entrance (flat cell index) to its neighbors and their distance.
+        entrances (dict[int, list[int]]): The entrances of each cluster.
+        expanded (int): The number of abstract nodes expanded by the last
+                        query.
+    """
+
+    def __init__(
+        self,
+        grid: MazeGrid,
+        cluster_size: int = 32,
+        workers: int | None = None
+    ) -> None:
+        """Split the maze into clusters and build the abstract graph.
+
+        Args:
+            grid (MazeGrid): The maze to solve. The graph is a snapshot:
+                             build a new solver if the grid changes.
+            cluster_size (int, optional): The side of a cluster. Larger
+                clusters make a smaller abstract graph but cost more to
+                measure (one BFS of the cluster per entrance).
+                Defaults to 32.
+            workers (int | None, optional): The number of processes
+                measuring clusters, 1 to stay in this process. Defaults to
+                the number of CPUs.
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.clusters_x = (grid.width + cluster_size - 1) // cluster_size
+        self.graph: dict[int, dict[int, int]] = {}
+        self.entrances: dict[int, list[int]] = {}
+        self.expanded = 0
+
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        entrances = self.entrances
+
+        def connect(a: int, b: int) -> None:
+            for node in (a, b):
+                if node not in self.graph:
+                    self.graph[node] = {}
+                    entrances.setdefault(self._cluster(node), []).append(node)
+            self.graph[a][b] = self.graph[b][a] = 1
+
+        for x in range(cluster_size, width, cluster_size):
+            for y in range(height):
+                index = y * width + x - 1
+                if not cells[index] & 2 and cells[index + 1] != 31:
+                    connect(index, index + 1)
+        for y in range(cluster_size, height, cluster_size):
+            for x in range(width):
+                index = (y - 1) * width + x
+                if not cells[index] & 4 and cells[index + width] != 31:
+                    connect(index, index + width)
+
+        clusters = list(entrances)
+        tasks = []
+        for cluster in clusters:
+            tile, x0, y0, tile_w, tile_h = self._tile(cluster)
+            local = [
+                (node // width - y0) * tile_w + node % width - x0
+                for node in entrances[cluster]
+            ]
+            tasks.append((tile, tile_w, tile_h, local))
+
+        if workers == 1:
+            results = list(map(_cluster_distances, tasks))
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                results = list(pool.map(_cluster_distances, tasks,
+                                        chunksize=16))
+
+        for cluster, rows in zip(clusters, results):
+            nodes = entrances[cluster]
+            for a, row in zip(nodes, rows):
+                for b, length in zip(nodes, row):
+                    if length > 0 and b not in self.graph[a]:
+                        self.graph[a][b] = length
+
+    def _cluster(self, index: int) -> int:
+        """Returns the cluster number of a flat cell index."""
+        width = self.grid.width
+        return ((index // width) // self.cluster_size * self.clusters_x +
+                (index % width) // self.cluster_size)
+
+    def _tile(self, cluster: int) -> tuple[bytes, int, int, int, int]:
+        """Copies the cells of a cluster out of the grid.
+
+        Returns:
+            tuple[bytes, int, int, int, int]: The cells, then the x and y
+            of the cluster's top-left cell, its width and its height.
+        """
+        grid = self.grid
+        x0 = cluster % self.clusters_x * self.cluster_size
+        y0 = cluster // self.clusters_x * self.cluster_size
+        tile_w = min(self.cluster_size, grid.width - x0)
+        tile_h = min(self.cluster_size, grid.height - y0)
+        tile = b"".join(
+            grid.cells[y * grid.width + x0:y * grid.width + x0 + tile_w]
+            for y in range(y0, y0 + tile_h)
+        )
+        return tile, x0, y0, tile_w, tile_h
+
+    def _local_search(
+        self,
+        index: int
+    ) -> "tuple[array[int], bytearray, int, int, int]":
+        """Runs a BFS from a cell inside its own cluster.
+
+        Returns:
+            tuple[array[int], bytearray, int, int, int]: The distances and
+            parent codes of the cluster's cells, then the x and y of its
+            top-left cell and its width.
+        """
+        width = self.grid.width
+        tile, x0, y0, tile_w, tile_h = self._tile(self._cluster(index))
+        source = (index // width - y0) * tile_w + index % width - x0
+        dist, parents = _tile_field(tile, tile_w, tile_h, source)
+        return dist, parents, x0, y0, tile_w
+
+    def _refine(self, a: int, b: int) -> list[int]:
+        """Expands a route step inside one cluster into its cells."""
+        width = self.grid.width
+        dist, parents, x0, y0, tile_w = self._local_search(a)
+        steps = (-tile_w, 1, tile_w, -1)
+        node = (b // width - y0) * tile_w + b % width - x0
+        path = []
+        while dist[node] > 0:
+            path.append((node // tile_w + y0) * width + node % tile_w + x0)
+            node += steps[parents[node]]
+        path.append(a)
+        path.reverse()
+        return path
+
+    def solve(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int],
+        exact: bool = True
+    ) -> list[tuple[int, int]]:
+        """Finds a path from entry to exit through the abstract graph.
+
+        The entry and exit are linked to the entrances of their clusters
+        with one local BFS each, then A* with the Manhattan distance runs
+        on the abstract graph. Only the clusters on the chosen route are
+        searched again, to expand it into cells.
+
+        Args:
+            entry (tuple[int, int]): The starting coordinates (x, y).
+            exit (tuple[int, int]): The target coordinates (x, y).
+            exact (bool, optional): If True, return a shortest path. If
+                False, weight the heuristic by 2 (weighted A*): far fewer
+                nodes are expanded, and the path is at most twice as long
+                as the shortest one, usually much closer. Defaults to True.
+
+        Returns:
+            list[tuple[int, int]]: A list of coordinates representing the
+            path from entry to exit. Returns an empty list if no path is found.
+        """
+        width = self.grid.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        goal_x, goal_y = exit
+        weight = 1 if exact else 2
+        graph = self.graph
+        self.expanded = 0
+        if self.grid.cells[start] == 31 or self.grid.cells[goal] == 31:
+            return []
+
+        def local_distances(index: int) -> dict[int, int]:
+            dist, _, x0, y0, tile_w = self._local_search(index)
+            found = {}
+            for node in self.entrances.get(self._cluster(index), []):
+                local = (node // width - y0) * tile_w + node % width - x0
+                if dist[local] >= 0:
+                    found[node] = dist[local]
+            if self._cluster(goal) == self._cluster(index):
+                local = (goal // width - y0) * tile_w + goal % width - x0
+                if dist[local] >= 0:
+                    found[-1] = dist[local]
+            return found
+
+        def estimate(index: int) -> int:
+            if index < 0:  # The exit itself
+                return 0
+            return weight * (abs(index % width - goal_x) +
+                             abs(index // width - goal_y))
+
+        # Node -1 is the exit; the entry is the starting point of the route
+        to_goal = {
+            node: length for node, length in local_distances(goal).items()
+            if node >= 0
+        }
+        costs: dict[int, int] = {}
+        came: dict[int, int] = {}
+        heap: list[tuple[int, int, int]] = []
+        for node, length in local_distances(start).items():
+            costs[node] = length
+            came[node] = start
+            heappush(heap, (length + estimate(node), length, node))
+
+        closed: set[int] = set()
+        while heap:
+            _, cost, node = heappop(heap)
+            if node < 0:
+                return self._expand(start, goal, came)
+            if node in closed or cost > costs[node]:
+                continue
+            closed.add(node)
+            self.expanded += 1
+            moves = list(graph[node].items())
+            if node in to_goal:
+                moves.append((-1, to_goal[node]))
+            for other, length in moves:
+                new_cost = cost + length
+                known = costs.get(other)
+                if other in closed or known is not None and known <= new_cost:
+                    continue
+                costs[other] = new_cost
+                came[other] = node
+                heappush(heap, (new_cost + estimate(other), new_cost, other))
+        return []
+
+    def _expand(
+        self,
+        start: int,
+        goal: int,
+        came: dict[int, int]
+    ) -> list[tuple[int, int]]:
+        """Refines the abstract route into the cells of the maze."""
+        route = [goal]
+        node = came[-1]
+        while node != start:
+            route.append(node)
+            node = came[node]
+        route.append(start)
+        route.reverse()
+
+        width = self.grid.width
+        path = [start]
+        for a, b in zip(route, route[1:]):
+            if a == b:
+                continue
+            if self._cluster(a) == self._cluster(b):
+                path += self._refine(a, b)[1:]
+            else:
+                path.append(b)  # Crossing a cluster border
+        return [(index % width, index // width) for index in path]
@@ -1,6 +1,14 @@
+from array import array
+from itertools import compress
 from typing import Any
 from math import ceil
+from hashlib import blake2b
 from mazegen.common import Direction, DIRECTION_OFFSETS
+from mazegen.common import PATTERN, pattern_origin
+from mazegen.HalfEdgeGrid import HALF_EDGE, expand_half_edges
+from mazegen.MazeGrid import MazeGrid
+from mazegen.engines import backtracker, get_engine
+from mazegen.tiling import carve_tiled
 import random
 
 
@@ -11,27 +19,70 @@ OPPOSITE_DIR = {
     Direction.WEST: Direction.EAST
 }
 
-PATTERN = [
-    [1, 0, 1, 0, 1, 1, 1],
-    [1, 0, 1, 0, 0, 0, 1],
-    [1, 1, 1, 0, 1, 1, 1],
-    [0, 0, 1, 0, 1, 0, 0],
-    [0, 0, 1, 0, 1, 1, 1]
-]
+
+# Translation tables from a cell value to 0/1 flags
+FREE_CELL = bytes(0 if value == 31 else 1 for value in range(256))
+CLOSED_EAST = bytes(
+    1 if value & Direction.EAST and value != 31 else 0 for value in range(256)
+)
+CLOSED_SOUTH = bytes(
+    1 if value & Direction.SOUTH and value != 31 else 0
+    for value in range(256)
+)
+
+
+def _and_masks(a: bytes | bytearray, b: bytes | bytearray) -> bytearray:
+    """Returns the bytewise AND of two equally long 0/1 masks."""
+    both = int.from_bytes(a, "big") & int.from_bytes(b, "big")
+    return bytearray(both.to_bytes(len(a), "big"))
+
+
+def derive_seed(seed: Any, index: int) -> int:
+    """Derives the seed of the index-th maze of a reproducible batch.
+
+    The batch seed and the maze index are hashed together with BLAKE2b and
+    the first 8 bytes of the digest are used as a 64-bit seed. The result
+    only depends on (seed, index), never on which process or in which order
+    the mazes are generated, so a batch can be split freely across workers:
+    maze i is always MazeGenerator(h, w, derive_seed(seed, i)).
+
+    Args:
+        seed (Any): The seed of the whole batch. Its str() form is hashed.
+        index (int): The position of the maze in the batch.
+
+    Returns:
+        int: A 64-bit seed for the maze at that position.
+    """
+    digest = blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
 
 
 class MazeGenerator:
     """
-    A class to generate mazes using the Recursive Backtracker algorithm.
+    A class to generate mazes, using the Recursive Backtracker algorithm
+    by default or any engine registered in mazegen.engines.
 
     Attributes:
         width (int): The width of the maze grid.
         height (int): The height of the maze grid.
-        grid (list[list[int]]): A 2D grid representing the maze, where each
-                                cell value is a bitmask of closed walls.
+        algorithm (str): The name of the generation engine.
+        rng (random.Random): The random source owned by this generator.
+        grid (MazeGrid): A flat byte grid representing the maze, where each
+                         cell value is a bitmask of closed walls.
     """
 
-    def __init__(self, height: int, width: int, seed: Any = None) -> None:
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        seed: Any = None,
+        compat: bool = False,
+        rng: random.Random | None = None,
+        algorithm: str = "backtracker",
+        workers: int = 1,
+        tile_size: int = 512,
+        imperfect_ratio: float = 0.05
+    ) -> None:
         """Initialize the MazeGenerator with dimensions and an optional seed.
 
         Args:
@@ -39,61 +90,162 @@ class MazeGenerator:
             width (int): The width of the maze (number of columns).
             seed (Any, optional): A seed for the random number generator
                                   to ensure reproducibility. Defaults to None.
+            compat (bool, optional): If True, carve with the original
+                                     per-step random.choice and remove loop
+                                     walls with the original rejection
+                                     loop, so a seed gives the same maze
+                                     as earlier releases, perfect or not.
+                                     Defaults to False.
+            rng (random.Random | None, optional): A random source to use
+                                  instead of one seeded from seed, e.g. a
+                                  random.Random subclass with its own bit
+                                  generator. Defaults to None.
+            algorithm (str, optional): The engine that carves the maze, one
+                                       of mazegen.engines.ENGINES.
+                                       Defaults to "backtracker".
+            workers (int, optional): If above 1, split the maze into tiles
+                                     carved by that many processes (see
+                                     mazegen.tiling). Defaults to 1.
+            tile_size (int, optional): The side of a tile, in cells, when
+                                       workers is above 1. Defaults to 512.
+            imperfect_ratio (float, optional): Walls removed to create loops
+                                               in an imperfect maze, as a
+                                               fraction of the number of
+                                               cells. Defaults to 0.05.
+
+        Raises:
+            ValueError: If the algorithm is unknown, or compat or tiling is
+                        requested for an engine other than the backtracker.
         """
+        get_engine(algorithm)
+        if compat and algorithm != "backtracker":
+            raise ValueError(
+                "ERROR: Compatibility mode only applies to the backtracker."
+            )
+        if workers > 1 and (compat or algorithm != "backtracker"):
+            raise ValueError(
+                "ERROR: Tiled generation only uses the backtracker."
+            )
         self.width = width
         self.height = height
+        self.algorithm = algorithm
+        self.compat = compat
+        self.workers = workers
+        self.tile_size = tile_size
+        self.imperfect_ratio = imperfect_ratio
         # Initialize grid with all walls closed (15 = 1111 in binary)
-        self.grid = [
-            [15 for _ in range(width)]
-            for _ in range(height)
-        ]
-        random.seed(seed)
+        self.grid = MazeGrid(width, height, 15)
+        # Each generator owns its random stream, so generators running side
+        # by side (threads, batches) never disturb each other's sequences
+        self.rng = rng if rng is not None else random.Random(seed)
 
     def _make_imperfect(self) -> None:
         """Removes random internal walls to create loops in the maze.
 
-        This method calculates a target number of walls to remove (5% of total
-        cells) and iteratively removes walls between valid neighbors, ensuring
-        connectivity is updated on both sides of the wall.
+        This method calculates a target number of walls to remove
+        (imperfect_ratio of total cells, 5% by default). Every closed wall
+        between two free cells is indexed up front (the outer boundary and
+        the walls around PATTERN cells are never candidates), then that
+        many are sampled without replacement. The target is capped at the
+        number of candidates, so a ratio of 1 opens every wall it can (a
+        perfect maze has about one candidate per cell). Walls are removed
+        from the half-edge form of the grid (see mazegen.HalfEdgeGrid),
+        where each one is a single bit of a single cell. In compat mode,
+        the original rejection loop is used instead (see
+        _make_imperfect_compat).
         """
-        walls_to_remove = ceil((self.width * self.height) * 0.05)
+        walls_to_remove = ceil(
+            (self.width * self.height) * self.imperfect_ratio
+        )
+        if self.compat:
+            self._make_imperfect_compat(walls_to_remove)
+            return
+        cells = self.grid.cells
+        width = self.width
+        size = len(cells)
+
+        # 0/1 masks over the flat grid, combined as big integers
+        free = cells.translate(FREE_CELL)
+        east = _and_masks(
+            cells.translate(CLOSED_EAST), free[1:] + b"\0"
+        )
+        east[width - 1::width] = bytes(self.height)  # Outer boundary
+        south = _and_masks(
+            cells.translate(CLOSED_SOUTH), free[width:] + bytes(width)
+        )
+        east_walls = array("I", compress(range(size), east))
+        south_walls = array("I", compress(range(size), south))
+
+        candidates = len(east_walls) + len(south_walls)
+        walls_to_remove = min(walls_to_remove, candidates)
+
+        halves = cells.translate(HALF_EDGE)
+        for pick in self.rng.sample(range(candidates), walls_to_remove):
+            if pick < len(east_walls):
+                halves[east_walls[pick]] -= Direction.EAST
+            else:
+                halves[south_walls[pick - len(east_walls)]] -= Direction.SOUTH
+        cells[:] = expand_half_edges(halves, width)
+        self.grid.touch()
+
+    def _make_imperfect_compat(self, walls_to_remove: int) -> None:
+        """Removes loop walls with the original rejection loop.
+
+        Draws a random cell and direction until enough closed walls are
+        found, in the same order as earlier releases, so the random stream
+        (and the maze) matches theirs for a seed. Like them, it only spares
+        the outer boundary, not the walls of PATTERN cells. The target is
+        capped at the number of closed internal walls, where the original
+        would loop forever.
+
+        Args:
+            walls_to_remove (int): The number of walls to remove.
+        """
+        cells = self.grid.cells
+        width = self.width
+        closed = sum(
+            1 for index in range(len(cells) - width)
+            if cells[index] & Direction.SOUTH
+        ) + sum(
+            1 for index, value in enumerate(cells)
+            if value & Direction.EAST and (index + 1) % width
+        )
+        walls_to_remove = min(walls_to_remove, closed)
         walls_removed = 0
 
         while walls_removed < walls_to_remove:
-            x = random.randrange(self.width)
-            y = random.randrange(self.height)
-            direction = random.choice([Direction.EAST, Direction.SOUTH])
+            x = self.rng.randrange(self.width)
+            y = self.rng.randrange(self.height)
+            direction = self.rng.choice([Direction.EAST, Direction.SOUTH])
             nx = x + DIRECTION_OFFSETS[direction][0]
             ny = y + DIRECTION_OFFSETS[direction][1]
 
             # Check if the wall exists before trying to break it
-            if self.grid[y][x] & direction:
-                # Prevent breaking the outer boundary walls
-                if nx == self.width or ny == self.height:
-                    continue
-
-                # Remove the wall from the current cell
-                self.grid[y][x] -= direction
-
-                # Remove the corresponding wall from the neighbor
-                self.grid[ny][nx] -= OPPOSITE_DIR[direction]
-
-                walls_removed += 1
-            else:
+            if not self.grid.get(x, y) & direction:
                 continue
+            # Prevent breaking the outer boundary walls
+            if nx == self.width or ny == self.height:
+                continue
+
+            # Remove the wall on both sides
+            self.grid.set(x, y, self.grid.get(x, y) - direction)
+            self.grid.set(
+                nx, ny, self.grid.get(nx, ny) - OPPOSITE_DIR[direction]
+            )
+            walls_removed += 1
 
     def _make_pattern(self) -> None:
-        if self.width < len(PATTERN[0]) + 2 or self.height < len(PATTERN) + 2:
+        origin = pattern_origin(self.width, self.height)
+        if origin is None:
             print("ERROR: Maze too small for 42 pattern.")
             return
 
-        start_x = (self.width - len(PATTERN[0])) // 2
-        start_y = (self.height - len(PATTERN)) // 2
+        start_x, start_y = origin
 
         for r_index, row_list in enumerate(PATTERN):
             for c_index, value in enumerate(row_list):
                 if value == 1:
-                    self.grid[start_y + r_index][start_x + c_index] = 31
+                    self.grid.set(start_x + c_index, start_y + r_index, 31)
 
     def get_unvisited_neighbors(
         self, x: int, y: int
@@ -115,7 +267,7 @@ class MazeGenerator:
             # Check bounds
             if 0 <= nx < self.width and 0 <= ny < self.height:
                 # Check if the neighbor is unvisited (value is still 15)
-                if self.grid[ny][nx] == 15:
+                if self.grid.cells[ny * self.width + nx] == 15:
                     neighbors.append((nx, ny, direction))
         return neighbors
 
@@ -127,7 +279,7 @@ class MazeGenerator:
     ) -> None:
         """Generates the maze structure and displays the result.
 
-        Uses the Recursive Backtracker algorithm to create a perfect maze.
+        Uses the selected engine to carve a perfect maze.
         If is_perfect is False, it subsequently removes random walls to
         create loops. Finally, it delegates visualization to display_maze.
 
@@ -138,26 +290,21 @@ class MazeGenerator:
             exit (tuple[int, int]): Coordinates (x, y) of the exit.
         """
         self._make_pattern()
-        if self.grid[entry[1]][entry[0]] == 31:
+        if self.grid.get(entry[0], entry[1]) == 31:
             raise ValueError("ERROR: Impossible entry coordinates.")
-        elif self.grid[exit[1]][exit[0]] == 31:
+        elif self.grid.get(exit[0], exit[1]) == 31:
             raise ValueError("ERROR: Impossible exit coordinates.")
-        stack = [entry]
-
-        while len(stack):
-            cell = stack[-1]
-            neighbors = self.get_unvisited_neighbors(cell[0], cell[1])
-            if neighbors:
-                nx, ny, direction = random.choice(neighbors)
-                # Break walls between current cell and chosen neighbor
-                self.grid[cell[1]][cell[0]] -= direction
-                self.grid[ny][nx] -= OPPOSITE_DIR[direction]
-                stack.append((nx, ny))  # Move to neighbor
-            else:  # Dead end
-                stack.pop(-1)  # Backtrack
+
+        if self.compat:
+            backtracker(self.grid, entry, self.rng, compat=True)
+        elif self.workers > 1:
+            carve_tiled(self.grid, self.rng, self.tile_size, self.workers)
+        else:
+            get_engine(self.algorithm)(self.grid, entry, self.rng)
 
         if not is_perfect:
             self._make_imperfect()
+        self.grid.touch()
 
         self.display_maze(entry, exit)
         # self.draw_maze or return data to draw maze
@@ -179,24 +326,25 @@ class MazeGenerator:
         print(("+---" * self.width) + "+")
 
         for y in range(self.height):
+            row = self.grid.cells[y * self.width:(y + 1) * self.width]
             top_str = "|"
             for x in range(self.width):
                 if (x, y) == entry:
                     top_str += " E "
                 elif (x, y) == exit:
                     top_str += " X "
-                elif self.grid[y][x] == 31:
+                elif row[x] == 31:
                     top_str += " # "
                 else:
                     top_str += "   "
-                if self.grid[y][x] & Direction.EAST:
+                if row[x] & Direction.EAST:
                     top_str += "|"
                 else:
                     top_str += " "
             print(top_str)
             bot_str = "+"
             for x in range(self.width):
-                if self.grid[y][x] & Direction.SOUTH:
+                if row[x] & Direction.SOUTH:
                     bot_str += "---"
                 else:
                     bot_str += "   "
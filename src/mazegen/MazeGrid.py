@@ -0,0 +1,128 @@
+from typing import Iterator
+
+
+class MazeGrid:
+    """
+    A compact maze grid backed by a single contiguous byte buffer.
+
+    Each cell is stored as one byte holding the bitmask of closed walls,
+    in row-major order, so cell (x, y) lives at flat index y * width + x.
+    Indexing a grid with a row number returns a writable memoryview of that
+    row, which keeps the old ``grid[y][x]`` access pattern working. Handing
+    out a writable view counts as a change (see version).
+
+    Attributes:
+        width (int): The width of the maze grid.
+        height (int): The height of the maze grid.
+        cells (bytearray): The flat buffer of cell bitmasks.
+        version (int): A counter bumped by set(), touch() and row views,
+                       so caches built from the grid can tell when it
+                       changed. Code writing to cells directly must call
+                       touch(), and row views should not be kept across
+                       cached queries.
+    """
+
+    def __init__(self, width: int, height: int, fill: int = 15) -> None:
+        """Initialize the grid with every cell set to the same value.
+
+        Args:
+            width (int): The width of the maze (number of columns).
+            height (int): The height of the maze (number of rows).
+            fill (int, optional): Initial value of every cell.
+                                  Defaults to 15 (all walls closed).
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self.version = 0
+
+    @classmethod
+    def from_rows(cls, rows: list[list[int]]) -> "MazeGrid":
+        """Build a grid from a nested list of cell bitmasks.
+
+        Args:
+            rows (list[list[int]]): The maze grid as a list of rows.
+
+        Returns:
+            MazeGrid: A new grid holding a copy of the given values.
+        """
+        grid = cls(len(rows[0]), len(rows), 0)
+        grid.cells[:] = b"".join(bytes(row) for row in rows)
+        return grid
+
+    def to_rows(self) -> list[list[int]]:
+        """Return a nested list copy of the grid (compatibility view).
+
+        Returns:
+            list[list[int]]: The cell bitmasks as a list of rows.
+        """
+        width = self.width
+        return [
+            list(self.cells[start:start + width])
+            for start in range(0, len(self.cells), width)
+        ]
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat buffer index of cell (x, y)."""
+        return y * self.width + x
+
+    def get(self, x: int, y: int) -> int:
+        """Return the bitmask of cell (x, y)."""
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        """Set the bitmask of cell (x, y)."""
+        self.cells[y * self.width + x] = value
+        self.version += 1
+
+    def touch(self) -> None:
+        """Mark the grid as changed after writing to cells directly."""
+        self.version += 1
+
+    def row(self, y: int) -> memoryview:
+        """Return a writable view of row y without copying it.
+
+        The view may be written to, so the grid is marked as changed.
+        """
+        self.touch()
+        start = y * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    def __getitem__(self, y: int) -> memoryview:
+        if not 0 <= y < self.height:
+            raise IndexError("MazeGrid row index out of range")
+        return self.row(y)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MazeGrid):
+            return (self.width == other.width and
+                    self.height == other.height and
+                    self.cells == other.cells)
+        if isinstance(other, list):
+            return self.to_rows() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MazeGrid({self.to_rows()})"
+
+
+def as_grid(grid: "MazeGrid | list[list[int]]") -> MazeGrid:
+    """Return the given grid as a MazeGrid, converting nested lists.
+
+    Args:
+        grid (MazeGrid | list[list[int]]): A grid or a list of rows.
+
+    Returns:
+        MazeGrid: The same object if it already is a MazeGrid, otherwise
+        a new grid built from the rows.
+    """
+    if isinstance(grid, MazeGrid):
+        return grid
+    return MazeGrid.from_rows(grid)
@@ -1,73 +1,690 @@
-from collections import deque
-from mazegen.common import DIRECTION_OFFSETS
+from array import array
+from heapq import heappop, heappush
+from mazegen.common import Direction
+from mazegen.CorridorGraph import CorridorGraph
+from mazegen.HierarchicalSolver import HierarchicalSolver
+from mazegen.MazeGrid import MazeGrid, as_grid
+
+
+# Shortest path algorithms selectable with the SOLVER config key
+SOLVERS = ("bfs", "bidirectional", "astar", "corridor", "hierarchical")
+
+# Maps a 2-bit parent code (where the parent is: N, E, S, W) to the letter
+# of the move from the parent into the cell
+MOVE_LETTERS = bytes.maketrans(b"\x00\x01\x02\x03", b"SWNE")
+
+# Letter of each single step (dx, dy)
+STEP_LETTERS = {(0, -1): ord("N"), (1, 0): ord("E"),
+                (0, 1): ord("S"), (-1, 0): ord("W")}
+
+
+def path_to_directions(path: list[tuple[int, int]]) -> bytes:
+    """Encodes a path of coordinates as direction letters (N, E, S, W).
+
+    Args:
+        path (list[tuple[int, int]]): The path coordinates, in order.
+
+    Returns:
+        bytes: One ASCII letter per step, empty for paths under two cells.
+    """
+    return bytes(
+        STEP_LETTERS[(x2 - x1, y2 - y1)]
+        for (x1, y1), (x2, y2) in zip(path, path[1:])
+    )
+
+
+def directions_to_path(
+    entry: tuple[int, int],
+    directions: bytes
+) -> list[tuple[int, int]]:
+    """Decodes direction letters (N, E, S, W) back into coordinates.
+
+    Args:
+        entry (tuple[int, int]): The coordinates (x, y) the path starts at.
+        directions (bytes): One ASCII letter per step.
+
+    Returns:
+        list[tuple[int, int]]: The path coordinates, starting at entry.
+
+    Raises:
+        ValueError: If a letter is not a direction.
+    """
+    offsets = {letter: step for step, letter in STEP_LETTERS.items()}
+    x, y = entry
+    path = [entry]
+    for letter in directions:
+        if letter not in offsets:
+            raise ValueError(f"ERROR: Invalid direction '{chr(letter)}'.")
+        dx, dy = offsets[letter]
+        x, y = x + dx, y + dy
+        path.append((x, y))
+    return path
 
 
 class MazeSolver:
     """
-    A class to solve mazes using the Breadth-First Search (BFS) algorithm.
+    A class to solve mazes using the Breadth-First Search (BFS) algorithm,
+    or a bidirectional BFS or A* search returning a path of the same length.
 
     Attributes:
-        grid (list[list[int]]): A 2D grid representing the maze, where each
-                                cell value is a bitmask of closed walls.
+        grid (MazeGrid): A flat byte grid representing the maze, where each
+                         cell value is a bitmask of closed walls.
         width (int): The width of the maze grid.
         height (int): The height of the maze grid.
+        expanded (int): The number of cells expanded by the last search.
     """
 
-    def __init__(self, grid: list[list[int]]):
+    # Cached (grid version, source, distances, parent codes) of the last
+    # distance field, and (grid version, depths, ancestor tables) of the
+    # tree index
+    _field: "tuple[int, int, array[int], bytearray] | None" = None
+    _tree: "tuple[int, array[int], list[array[int]]] | None" = None
+    _graph: tuple[int, CorridorGraph] | None = None
+    _hierarchy: tuple[int, HierarchicalSolver] | None = None
+
+    def __init__(self, grid: MazeGrid | list[list[int]]):
         """Initialize the MazeSolver with a maze grid.
 
         Args:
-            grid (list[list[int]]): The maze grid to solve.
+            grid (MazeGrid | list[list[int]]): The maze grid to solve.
+                Nested lists are converted to a MazeGrid.
         """
-        self.grid = grid
-        self.width = len(grid[0])
-        self.height = len(grid)
+        self.grid = as_grid(grid)
+        self.width = self.grid.width
+        self.height = self.grid.height
+        self.expanded = 0
 
     def solve_maze(
         self,
         entry: tuple[int, int],
-        exit: tuple[int, int]
+        exit: tuple[int, int],
+        solver: str = "bfs"
     ) -> list[tuple[int, int]]:
-        """Finds the shortest path from entry to exit using BFS.
+        """Finds the shortest path from entry to exit.
 
-        Explores the maze layer by layer to guarantee the shortest path.
-        It respects walls defined in the grid and returns the path coordinates.
+        Every solver returns a shortest path. When several exist (imperfect
+        mazes), they may return different paths of the same length.
 
         Args:
             entry (tuple[int, int]): The starting coordinates (x, y).
             exit (tuple[int, int]): The target coordinates (x, y).
+            solver (str, optional): One of SOLVERS: "bfs", "bidirectional",
+                                    "astar", "corridor" or "hierarchical".
+                                    Defaults to "bfs".
 
         Returns:
             list[tuple[int, int]]: A list of coordinates representing the
             path from entry to exit. Returns an empty list if no path is found.
+
+        Raises:
+            ValueError: If the solver name is unknown.
+        """
+        if solver == "bfs":
+            return self._solve_bfs(entry, exit)
+        elif solver == "bidirectional":
+            return self._solve_bidirectional(entry, exit)
+        elif solver == "astar":
+            return self._solve_astar(entry, exit)
+        elif solver == "corridor":
+            graph = self.corridor_graph()
+            path = graph.solve(entry, exit)
+            self.expanded = graph.expanded
+            return path
+        elif solver == "hierarchical":
+            hierarchy = self.hierarchy()
+            path = hierarchy.solve(entry, exit)
+            self.expanded = hierarchy.expanded
+            return path
+        raise ValueError(
+            f"ERROR: Unknown SOLVER '{solver}'. " +
+            f"Expected one of: {', '.join(SOLVERS)}"
+        )
+
+    def corridor_graph(self) -> CorridorGraph:
+        """Returns the corridor-contracted graph of the maze.
+
+        The graph is built on first use and kept until the grid changes,
+        so repeated "corridor" solves only pay for the contraction once.
+
+        Returns:
+            CorridorGraph: The junction graph of the current grid.
+        """
+        if self._graph is None or self._graph[0] != self.grid.version:
+            self._graph = (self.grid.version, CorridorGraph(self.grid))
+        return self._graph[1]
+
+    def hierarchy(
+        self,
+        cluster_size: int = 32,
+        workers: int | None = None
+    ) -> HierarchicalSolver:
+        """Returns the hierarchical (clustered) solver of the maze.
+
+        Like corridor_graph, it is built on first use and kept until the
+        grid changes or another cluster size is asked for.
+
+        Args:
+            cluster_size (int, optional): The side of a cluster.
+                                          Defaults to 32.
+            workers (int | None, optional): The number of processes
+                measuring clusters. Defaults to the number of CPUs.
+
+        Returns:
+            HierarchicalSolver: The hierarchical solver of the current grid.
         """
-        queue: deque[tuple[int, int]] = deque([entry])
-        predecessors: dict[tuple[int, int], tuple[int, int] | None] = {
-            entry: None
-        }
-
-        while (len(queue)):
-            curr_cell = queue.popleft()
-            if curr_cell == exit:
-                break
-            for direction, offset in DIRECTION_OFFSETS.items():
-                nx, ny = curr_cell[0] + offset[0], curr_cell[1] + offset[1]
-                cx, cy = curr_cell
-                if (0 <= nx < self.width and 0 <= ny < self.height and
-                        (nx, ny) not in predecessors):
-                    # Check if wall is OPEN (bitwise AND is 0)
-                    if not self.grid[cy][cx] & direction:
-                        predecessors[(nx, ny)] = (cx, cy)
-                        queue.append((nx, ny))
+        if (self._hierarchy is None or
+                self._hierarchy[0] != self.grid.version or
+                self._hierarchy[1].cluster_size != cluster_size):
+            self._hierarchy = (
+                self.grid.version,
+                HierarchicalSolver(self.grid, cluster_size, workers)
+            )
+        return self._hierarchy[1]
+
+    def _neighbors(self, index: int) -> list[int]:
+        """Returns the cells reachable from a cell through an open wall."""
+        width = self.width
+        walls = self.grid.cells[index]
+        x = index % width
+        return [
+            index + step
+            for direction, step, inside in (
+                (Direction.NORTH, -width, index >= width),
+                (Direction.EAST, 1, x < width - 1),
+                (Direction.SOUTH, width, index + width < len(self.grid.cells)),
+                (Direction.WEST, -1, x > 0),
+            )
+            if inside and not walls & direction
+        ]
 
+    def _build_path(
+        self,
+        predecessors: dict[int, int],
+        node: int
+    ) -> list[tuple[int, int]]:
+        """Follows predecessors back from a cell to the start (-1)."""
+        width = self.width
         path: list[tuple[int, int]] = []
-        if exit in predecessors:
-            curr_node: tuple[int, int] | None = exit
-            # Backtrack from the exit to the entry using the predecessors map
-            while curr_node is not None:
-                path.append(curr_node)
-                curr_node = predecessors[curr_node]
+        while node != -1:
+            path.append((node % width, node // width))
+            node = predecessors[node]
+        path.reverse()
+        return path
+
+    def solve_directions(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int],
+        solver: str = "bfs"
+    ) -> bytes:
+        """Finds the shortest path as a string of direction letters.
+
+        With BFS, the letters are produced straight from the 2-bit parent
+        codes while backtracking, without building coordinate tuples: the
+        codes are collected in a bytearray, reversed and mapped to letters
+        with bytes.translate. Other solvers convert their path.
 
-        path = list(reversed(path))
+        Args:
+            entry (tuple[int, int]): The starting coordinates (x, y).
+            exit (tuple[int, int]): The target coordinates (x, y).
+            solver (str, optional): One of SOLVERS. Defaults to "bfs".
 
+        Returns:
+            bytes: One ASCII letter (N, E, S or W) per step, ready to be
+            written as is. Empty if no path is found or entry is exit.
+        """
+        if solver != "bfs":
+            return path_to_directions(self.solve_maze(entry, exit, solver))
+        width = self.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        parents = self._bfs_parents(start, goal)
+        if parents is None:
+            return b""
+
+        steps = (-width, 1, width, -1)
+        codes = bytearray()
+        node = goal
+        while node != start:
+            code = parents[node >> 2] >> ((node & 3) << 1) & 3
+            codes.append(code)
+            node += steps[code]
+        codes.reverse()
+        return bytes(codes.translate(MOVE_LETTERS))
+
+    def _solve_bfs(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Finds the shortest path from entry to exit using BFS.
+
+        Explores the maze layer by layer to guarantee the shortest path.
+        It respects walls defined in the grid and returns the path coordinates.
+        """
+        width = self.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        parents = self._bfs_parents(start, goal)
+        if parents is None:
+            return []
+        # Backtrack from the exit to the entry using the parent codes
+        return self._trace(parents, start, goal)
+
+    def _bfs_parents(self, start: int, goal: int) -> bytearray | None:
+        """Runs the BFS from start until goal is reached.
+
+        The search state is flat: a visited bitset (1 bit per cell), the
+        direction from each cell back to its parent (2 bits per cell: 0 for
+        NORTH, 1 EAST, 2 SOUTH, 3 WEST), and each layer as an array of
+        32-bit indices. That is under a byte per cell instead of a dict
+        entry per visited cell.
+
+        Returns:
+            bytearray | None: The parent codes, or None if goal cannot be
+            reached.
+        """
+        cells = self.grid.cells
+        width = self.width
+        size = width * self.height
+
+        visited = bytearray((size + 7) >> 3)
+        parents = bytearray((size + 3) >> 2)
+        visited[start >> 3] |= 1 << (start & 7)
+        layer = array("I", [start])
+        found = False
+        self.expanded = 0
+
+        while layer and not found:
+            next_layer = array("I")
+            for curr in layer:
+                self.expanded += 1
+                if curr == goal:
+                    found = True
+                    break
+                walls = cells[curr]
+                x = curr % width
+                # Check if wall is OPEN (bitwise AND is 0) and stays in
+                # bounds. The parent code points back at curr.
+                for direction, step, code, inside in (
+                    (Direction.NORTH, -width, 2, curr >= width),
+                    (Direction.EAST, 1, 3, x < width - 1),
+                    (Direction.SOUTH, width, 0, curr + width < size),
+                    (Direction.WEST, -1, 1, x > 0),
+                ):
+                    if not inside or walls & direction:
+                        continue
+                    nxt = curr + step
+                    bit = 1 << (nxt & 7)
+                    if visited[nxt >> 3] & bit:
+                        continue
+                    visited[nxt >> 3] |= bit
+                    parents[nxt >> 2] |= code << ((nxt & 3) << 1)
+                    next_layer.append(nxt)
+            layer = next_layer
+
+        return parents if found else None
+
+    def _trace(
+        self,
+        parents: bytearray,
+        start: int,
+        node: int
+    ) -> list[tuple[int, int]]:
+        """Follows 2-bit parent codes back from a cell to the start."""
+        width = self.width
+        steps = (-width, 1, width, -1)
+        path = [(node % width, node // width)]
+        while node != start:
+            node += steps[parents[node >> 2] >> ((node & 3) << 1) & 3]
+            path.append((node % width, node // width))
+        path.reverse()
         return path
+
+    def _bfs_field(
+        self,
+        start: int
+    ) -> "tuple[array[int], bytearray, int]":
+        """Runs a full BFS from a cell, without stopping at any goal.
+
+        Returns:
+            tuple[array[int], bytearray, int]: The distance of every cell
+            (-1 if unreachable), the 2-bit parent codes, and the number of
+            loops met (0 when the reachable part of the maze is a tree).
+        """
+        cells = self.grid.cells
+        width = self.width
+        size = width * self.height
+        steps = (-width, 1, width, -1)
+
+        dist = array("i", [-1]) * size
+        parents = bytearray((size + 3) >> 2)
+        dist[start] = 0
+        layer = array("I", [start])
+        depth = 0
+        seen_twice = 0
+
+        while layer:
+            depth += 1
+            next_layer = array("I")
+            for curr in layer:
+                walls = cells[curr]
+                x = curr % width
+                back = -1
+                if curr != start:
+                    code = parents[curr >> 2] >> ((curr & 3) << 1) & 3
+                    back = curr + steps[code]
+                for direction, step, code, inside in (
+                    (Direction.NORTH, -width, 2, curr >= width),
+                    (Direction.EAST, 1, 3, x < width - 1),
+                    (Direction.SOUTH, width, 0, curr + width < size),
+                    (Direction.WEST, -1, 1, x > 0),
+                ):
+                    if not inside or walls & direction:
+                        continue
+                    nxt = curr + step
+                    if dist[nxt] >= 0:
+                        seen_twice += nxt != back
+                        continue
+                    dist[nxt] = depth
+                    parents[nxt >> 2] |= code << ((nxt & 3) << 1)
+                    next_layer.append(nxt)
+            layer = next_layer
+
+        # Every loop is met once from each of its two ends
+        return dist, parents, seen_twice // 2
+
+    def _distance_field(
+        self,
+        entry: tuple[int, int]
+    ) -> "tuple[array[int], bytearray]":
+        """Returns the cached distance field of entry, computing it once."""
+        start = entry[1] * self.width + entry[0]
+        field = self._field
+        if (field is None or field[0] != self.grid.version or
+                field[1] != start):
+            dist, parents, _ = self._bfs_field(start)
+            field = (self.grid.version, start, dist, parents)
+            self._field = field
+        return field[2], field[3]
+
+    def distance(self, entry: tuple[int, int], x: tuple[int, int]) -> int:
+        """Returns the length of the shortest path between two cells.
+
+        The first call for an entry runs one BFS over the whole maze and
+        caches the distances; later calls with the same entry are O(1)
+        until the grid changes.
+
+        Args:
+            entry (tuple[int, int]): The source coordinates (x, y).
+            x (tuple[int, int]): The target coordinates (x, y).
+
+        Returns:
+            int: The number of steps from entry to x, or -1 if x cannot be
+            reached.
+        """
+        dist, _ = self._distance_field(entry)
+        return dist[x[1] * self.width + x[0]]
+
+    def solve_many(
+        self,
+        entry: tuple[int, int],
+        exits: list[tuple[int, int]]
+    ) -> list[list[tuple[int, int]]]:
+        """Finds the shortest path from one entry to each of many exits.
+
+        A single cached BFS from the entry answers every exit, each path
+        costing only its own length to rebuild.
+
+        Args:
+            entry (tuple[int, int]): The starting coordinates (x, y).
+            exits (list[tuple[int, int]]): The target coordinates (x, y).
+
+        Returns:
+            list[list[tuple[int, int]]]: The path to each exit, in order, or
+            an empty list for an exit that cannot be reached.
+        """
+        dist, parents = self._distance_field(entry)
+        start = entry[1] * self.width + entry[0]
+        paths: list[list[tuple[int, int]]] = []
+        for exit in exits:
+            goal = exit[1] * self.width + exit[0]
+            if dist[goal] < 0:
+                paths.append([])
+            else:
+                paths.append(self._trace(parents, start, goal))
+        return paths
+
+    def _tree_index(self) -> "tuple[array[int], list[array[int]]]":
+        """Builds (once per grid version) the LCA index of a perfect maze.
+
+        The maze is rooted at its first free cell. up[k][v] is the 2^k-th
+        ancestor of v (the root is its own parent), built level by level
+        with map() over the previous level.
+
+        Raises:
+            ValueError: If the maze has loops.
+        """
+        tree = self._tree
+        if tree is not None and tree[0] == self.grid.version:
+            return tree[1], tree[2]
+
+        cells = self.grid.cells
+        width = self.width
+        root = 0
+        while root < len(cells) - 1 and cells[root] == 31:
+            root += 1
+        depth, parents, loops = self._bfs_field(root)
+        if loops:
+            raise ValueError(
+                "ERROR: Tree queries need a perfect maze " +
+                f"({loops} loops found)."
+            )
+
+        steps = (-width, 1, width, -1)
+        parent = array("I", range(len(cells)))
+        for index, d in enumerate(depth):
+            if d > 0:
+                code = parents[index >> 2] >> ((index & 3) << 1) & 3
+                parent[index] = index + steps[code]
+        up = [parent]
+        while 1 << len(up) <= max(depth):
+            previous = up[-1]
+            up.append(array("I", map(previous.__getitem__, previous)))
+
+        self._tree = (self.grid.version, depth, up)
+        return depth, up
+
+    def _lca(self, a: int, b: int) -> int:
+        """Returns the lowest common ancestor of two cells in O(log n)."""
+        depth, up = self._tree_index()
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        level = 0
+        while diff:
+            if diff & 1:
+                a = up[level][a]
+            diff >>= 1
+            level += 1
+        if a == b:
+            return a
+        for level in range(len(up) - 1, -1, -1):
+            if up[level][a] != up[level][b]:
+                a, b = up[level][a], up[level][b]
+        return up[0][a]
+
+    def tree_distance(self, a: tuple[int, int], b: tuple[int, int]) -> int:
+        """Returns the path length between two cells of a perfect maze.
+
+        In a perfect maze the only path between two cells goes through
+        their lowest common ancestor, so after a one-time O(n log n) index
+        each query takes O(log n).
+
+        Args:
+            a (tuple[int, int]): The first coordinates (x, y).
+            b (tuple[int, int]): The second coordinates (x, y).
+
+        Returns:
+            int: The number of steps between a and b, or -1 if they are not
+            connected.
+
+        Raises:
+            ValueError: If the maze has loops.
+        """
+        depth, _ = self._tree_index()
+        u = a[1] * self.width + a[0]
+        v = b[1] * self.width + b[0]
+        if depth[u] < 0 or depth[v] < 0:
+            return -1
+        return depth[u] + depth[v] - 2 * depth[self._lca(u, v)]
+
+    def tree_path(
+        self,
+        a: tuple[int, int],
+        b: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Returns the path between two cells of a perfect maze.
+
+        The common ancestor is found in O(log n), then the path is walked
+        up from both ends, in time proportional to its length.
+
+        Args:
+            a (tuple[int, int]): The starting coordinates (x, y).
+            b (tuple[int, int]): The target coordinates (x, y).
+
+        Returns:
+            list[tuple[int, int]]: The path from a to b, or an empty list
+            if they are not connected.
+
+        Raises:
+            ValueError: If the maze has loops.
+        """
+        depth, up = self._tree_index()
+        width = self.width
+        u = a[1] * width + a[0]
+        v = b[1] * width + b[0]
+        if depth[u] < 0 or depth[v] < 0:
+            return []
+        top = self._lca(u, v)
+        parent = up[0]
+
+        head: list[tuple[int, int]] = []
+        while u != top:
+            head.append((u % width, u // width))
+            u = parent[u]
+        tail: list[tuple[int, int]] = []
+        while v != top:
+            tail.append((v % width, v // width))
+            v = parent[v]
+        head.append((top % width, top // width))
+        tail.reverse()
+        return head + tail
+
+    def _solve_bidirectional(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Finds the shortest path with a BFS from both ends at once.
+
+        Each round expands one whole layer of the smaller frontier. When a
+        layer touches a cell already reached from the other end, the best
+        meeting cell of that layer gives a shortest path, found after
+        exploring roughly two balls of half the path length instead of one
+        of the full length.
+        """
+        width = self.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        self.expanded = 0
+        if start == goal:
+            return [entry]
+
+        # Per side: predecessors, distance from its end, current layer
+        preds = ({start: -1}, {goal: -1})
+        dists = ({start: 0}, {goal: 0})
+        layers = ([start], [goal])
+        depths = [0, 0]
+
+        while layers[0] and layers[1]:
+            side = 0 if len(layers[0]) <= len(layers[1]) else 1
+            pred, dist = preds[side], dists[side]
+            other = dists[1 - side]
+            depth = depths[side] + 1
+            best = -1
+            best_len = 0
+            layer: list[int] = []
+
+            for curr in layers[side]:
+                self.expanded += 1
+                for nxt in self._neighbors(curr):
+                    if nxt in pred:
+                        continue
+                    pred[nxt] = curr
+                    dist[nxt] = depth
+                    layer.append(nxt)
+                    if nxt in other:
+                        length = depth + other[nxt]
+                        if best < 0 or length < best_len:
+                            best, best_len = nxt, length
+
+            if best >= 0:
+                path = self._build_path(preds[0], best)
+                node = preds[1][best]
+                while node != -1:
+                    path.append((node % width, node // width))
+                    node = preds[1][node]
+                return path
+
+            layers = (layer, layers[1]) if side == 0 else (layers[0], layer)
+            depths[side] = depth
+
+        return []
+
+    def _solve_astar(
+        self,
+        entry: tuple[int, int],
+        exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Finds the shortest path with A* and the Manhattan distance.
+
+        The open set is a binary heap ordered by the estimated total length,
+        then by the remaining distance so the search keeps going deep along
+        promising corridors. The Manhattan distance never overestimates a
+        grid path, so the first time the exit is taken from the heap its
+        path is a shortest one.
+        """
+        width = self.width
+        start = entry[1] * width + entry[0]
+        goal = exit[1] * width + exit[0]
+        goal_x, goal_y = exit
+
+        def estimate(index: int) -> int:
+            return (abs(index % width - goal_x) +
+                    abs(index // width - goal_y))
+
+        predecessors: dict[int, int] = {start: -1}
+        costs: dict[int, int] = {start: 0}
+        heap = [(estimate(start), estimate(start), start)]
+        self.expanded = 0
+
+        while heap:
+            _, _, curr = heappop(heap)
+            if curr == goal:
+                return self._build_path(predecessors, goal)
+            cost = costs[curr]
+            if cost < 0:  # Already expanded from a shorter path
+                continue
+            costs[curr] = -1
+            self.expanded += 1
+            for nxt in self._neighbors(curr):
+                known = costs.get(nxt)
+                if known is not None and (known < 0 or known <= cost + 1):
+                    continue
+                costs[nxt] = cost + 1
+                predecessors[nxt] = curr
+                remaining = estimate(nxt)
+                heappush(heap, (cost + 1 + remaining, remaining, nxt))
+
+        return []
@@ -2,7 +2,7 @@ from enum import IntEnum
 from typing import TypedDict
 
 
-class MazeConfig(TypedDict):
+class BaseMazeConfig(TypedDict):
     WIDTH: int
     HEIGHT: int
     ENTRY: tuple[int, int]
@@ -11,6 +11,16 @@ class MazeConfig(TypedDict):
     PERFECT: bool
 
 
+class MazeConfig(BaseMazeConfig, total=False):
+    SEED: int | str
+    ALGORITHM: str
+    WORKERS: int
+    IMPERFECT_RATIO: float
+    SOLVER: str
+    OUTPUT_FORMAT: str
+    RENDERER: str
+
+
 class Direction(IntEnum):
     NORTH = 1
     EAST = 2
@@ -24,3 +34,32 @@ DIRECTION_OFFSETS = {
     Direction.SOUTH: (0, 1),
     Direction.WEST: (-1, 0)
 }
+
+
+# Cells of the "42" stamp carved into the middle of every maze (value 31)
+PATTERN = [
+    [1, 0, 1, 0, 1, 1, 1],
+    [1, 0, 1, 0, 0, 0, 1],
+    [1, 1, 1, 0, 1, 1, 1],
+    [0, 0, 1, 0, 1, 0, 0],
+    [0, 0, 1, 0, 1, 1, 1]
+]
+
+
+def pattern_origin(width: int, height: int) -> tuple[int, int] | None:
+    """Returns where the 42 pattern is stamped in a maze of the given size.
+
+    The pattern is centered and needs a margin of at least one cell on
+    every side.
+
+    Args:
+        width (int): The width of the maze.
+        height (int): The height of the maze.
+
+    Returns:
+        tuple[int, int] | None: The (x, y) of the pattern's top-left cell,
+        or None if the maze is too small to hold it.
+    """
+    if width < len(PATTERN[0]) + 2 or height < len(PATTERN) + 2:
+        return None
+    return (width - len(PATTERN[0])) // 2, (height - len(PATTERN)) // 2
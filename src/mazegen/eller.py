@@ -0,0 +1,241 @@
+from array import array
+from typing import Iterator
+from mazegen.common import PATTERN, pattern_origin
+import random
+
+
+# Row masks around the pattern: free, can_down, pocket_entry, pocket
+RowMasks = tuple[bytes, bytes, bytes, bytes]
+
+
+def _runs(free: bytes | bytearray) -> Iterator[tuple[int, int]]:
+    """Yields the [start, end) bounds of each run of free cells in a row."""
+    x = 0
+    while x < len(free):
+        if not free[x]:
+            x += 1
+            continue
+        end = x
+        while end < len(free) and free[end]:
+            end += 1
+        yield x, end
+        x = end
+
+
+def pattern_rows(width: int, height: int) -> dict[int, RowMasks]:
+    """Precomputes the row masks needed to carve around the 42 pattern.
+
+    Outside the pattern every cell is free and may descend. Around it, a
+    set may only go down into cells that can still reach the rows below
+    the pattern, and runs boxed in by the pattern ("pockets") can only be
+    reached from above. For the row above the pattern and each pattern
+    row, four 0/1 masks are returned:
+
+    - free: cells that are not part of the pattern.
+    - can_down: free cells whose south neighbor is free and whose run can
+      reach the rows below the pattern.
+    - pocket_entry: the single cell chosen to descend into each pocket of
+      the next row.
+    - pocket: free cells of this row whose run cannot reach the rows below.
+
+    Args:
+        width (int): The width of the maze.
+        height (int): The height of the maze.
+
+    Returns:
+        dict[int, RowMasks]: The masks per row index, only for the rows
+        touched by the pattern (empty if the maze is too small for it).
+
+    Raises:
+        ValueError: If a pocket has no free cell above it.
+    """
+    origin = pattern_origin(width, height)
+    if origin is None:
+        return {}
+    start_x, start_y = origin
+    last = start_y + len(PATTERN)
+
+    free: dict[int, bytearray] = {}
+    for y in range(start_y - 1, last + 1):
+        free[y] = bytearray([1]) * width
+    for r_index, row_list in enumerate(PATTERN):
+        for c_index, value in enumerate(row_list):
+            if value == 1:
+                free[start_y + r_index][start_x + c_index] = 0
+
+    # The row below the pattern is fully free and reaches every row below
+    viable = {last: bytes(free[last])}
+    can_down: dict[int, bytes] = {}
+    for y in range(last - 1, start_y - 2, -1):
+        can_down[y] = bytes(
+            f & g & v for f, g, v in zip(free[y], free[y + 1], viable[y + 1])
+        )
+        row = bytearray(width)
+        for start, end in _runs(free[y]):
+            if any(can_down[y][start:end]):
+                row[start:end] = bytes([1]) * (end - start)
+        viable[y] = bytes(row)
+
+    rows: dict[int, RowMasks] = {}
+    for y in range(start_y - 1, last):
+        pocket = bytes(f & (v ^ 1) for f, v in zip(free[y], viable[y]))
+        below = bytes(
+            f & (v ^ 1) for f, v in zip(free[y + 1], viable[y + 1])
+        )
+        entries = bytearray(width)
+        for start, end in _runs(below):
+            for x in range(start, end):
+                if free[y][x]:
+                    entries[x] = 1
+                    break
+            else:
+                raise ValueError("ERROR: Pattern leaves unreachable cells.")
+        rows[y] = (bytes(free[y]), can_down[y], bytes(entries), pocket)
+    return rows
+
+
+def eller_rows(
+    width: int,
+    height: int,
+    entry: tuple[int, int],
+    exit: tuple[int, int],
+    rng: random.Random
+) -> Iterator[bytearray]:
+    """Streams a perfect maze one row at a time with Eller's algorithm.
+
+    Only O(width) state is kept: the set of each cell of the current row,
+    as a union-find over the row's columns, and the cells entered from
+    above. Each row randomly joins neighboring sets, then every set
+    carves at least one passage down so it is never cut off. The last row
+    joins every remaining set. The 42 pattern is stamped as rows pass,
+    exactly where MazeGenerator puts it.
+
+    Args:
+        width (int): The width of the maze (number of columns).
+        height (int): The height of the maze (number of rows).
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        exit (tuple[int, int]): Coordinates (x, y) of the exit.
+        rng (random.Random): The random source to draw from.
+
+    Returns:
+        Iterator[bytearray]: The wall bitmasks of each row, from top to
+        bottom.
+
+    Raises:
+        ValueError: If the entry or exit falls on the 42 pattern. This is
+        checked right away, before any row is produced or written.
+    """
+    pattern = pattern_rows(width, height)
+    if not pattern:
+        print("ERROR: Maze too small for 42 pattern.")
+    if entry[1] in pattern and not pattern[entry[1]][0][entry[0]]:
+        raise ValueError("ERROR: Impossible entry coordinates.")
+    elif exit[1] in pattern and not pattern[exit[1]][0][exit[0]]:
+        raise ValueError("ERROR: Impossible exit coordinates.")
+    return _carve_rows(width, height, pattern, rng)
+
+
+def _carve_rows(
+    width: int,
+    height: int,
+    pattern: dict[int, RowMasks],
+    rng: random.Random
+) -> Iterator[bytearray]:
+    """Runs Eller's algorithm, yielding each row once it is final."""
+    plain: RowMasks = (
+        bytes([1]) * width, bytes([1]) * width, bytes(width), bytes(width)
+    )
+    # labels[x] is the column representing x's set, or -1 if the cell was
+    # not entered from above
+    labels = array("i", [-1]) * width
+    parent = array("i", range(width))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for y in range(height):
+        free, can_down, pocket_entry, pocket = pattern.get(y, plain)
+        row = bytearray([15]) * width
+
+        for x in range(width):
+            if not free[x]:
+                row[x] = 31
+                parent[x] = x
+            elif labels[x] >= 0:
+                row[x] -= 1  # Entered from above
+                parent[x] = labels[x]
+            else:
+                parent[x] = x
+
+        # Join neighboring sets at random. The last row joins them all, and
+        # pockets are joined whole since their only way out is the top.
+        last_row = y == height - 1
+        bits = rng.randbytes((width + 7) >> 3)
+        for x in range(width - 1):
+            if not (free[x] and free[x + 1]):
+                continue
+            a, b = find(x), find(x + 1)
+            if a != b and (last_row or pocket[x] or
+                           bits[x >> 3] >> (x & 7) & 1):
+                parent[b] = a
+                row[x] -= 2
+                row[x + 1] -= 8
+
+        if last_row:
+            yield row
+            break
+
+        if y in pattern:
+            # A set with no cell able to descend would be cut off: join it
+            # with its neighbors until it reaches one that can
+            alive = bytearray(width)
+            for x in range(width):
+                if can_down[x]:
+                    alive[find(x)] = 1
+            for x in range(width - 1):
+                if not (free[x] and free[x + 1]) or pocket[x]:
+                    continue
+                a, b = find(x), find(x + 1)
+                if a != b and not (alive[a] and alive[b]):
+                    parent[b] = a
+                    alive[a] |= alive[b]
+                    row[x] -= 2
+                    row[x + 1] -= 8
+
+        # Carve down: each cell at random, then one more cell for every set
+        # that has none yet. Pockets below are always entered.
+        bits = rng.randbytes((width + 7) >> 3)
+        first = array("i", [-1]) * width
+        has_down = bytearray(width)
+        last_can = array("i", [-1]) * width
+        next_labels = array("i", [-1]) * width
+
+        def descend(x: int, root: int) -> None:
+            if first[root] < 0:
+                first[root] = x
+            next_labels[x] = first[root]
+            row[x] -= 4
+
+        for x in range(width):
+            if not free[x]:
+                continue
+            root = find(x)
+            if can_down[x]:
+                last_can[root] = x
+                if bits[x >> 3] >> (x & 7) & 1:
+                    has_down[root] = 1
+                    descend(x, root)
+            elif pocket_entry[x]:
+                descend(x, root)
+        for x in range(width):
+            if can_down[x]:
+                root = find(x)
+                if not has_down[root]:
+                    has_down[root] = 1
+                    descend(last_can[root], root)
+
+        labels = next_labels
+        yield row
@@ -0,0 +1,330 @@
+from array import array
+from time import perf_counter
+from typing import Any, Callable
+from mazegen.HalfEdgeGrid import HALF_EDGE, expand_half_edges
+from mazegen.MazeGrid import MazeGrid
+import random
+
+
+# Wall bits and their opposites, indexed N, E, S, W (the order in which
+# neighbors have always been offered to the random choice)
+WALL_BITS = (1, 2, 4, 8)
+OPPOSITE_BITS = (4, 8, 1, 2)
+
+# Each wall is stored once, as the EAST or SOUTH wall of one cell (see
+# mazegen.HalfEdgeGrid). Removing the wall in direction N, E, S or W means
+# clearing that bit of the cell at this offset from the current one, as a
+# multiple of (row stride, 1), and this bit
+HALF_OWNERS = ((-1, 0), (0, 0), (0, 0), (0, -1))
+HALF_BITS = (4, 2, 4, 2)
+
+# For every 4-bit mask of unvisited neighbors, the direction indexes it holds
+CHOICES = tuple(
+    tuple(d for d in range(4) if mask >> d & 1) for mask in range(16)
+)
+
+# For every mask, the direction picked by each possible random byte.
+# -1 marks the few bytes that must be redrawn to keep the pick unbiased.
+PICKS = tuple(
+    tuple(
+        options[r % len(options)]
+        if options and r < 256 - 256 % len(options) else -1
+        for r in range(256)
+    )
+    for options in CHOICES
+)
+
+# Maps a cell value to 1 if the cell is still unvisited (all walls closed)
+UNVISITED = bytes(1 if value == 15 else 0 for value in range(256))
+
+RANDOM_POOL_SIZE = 4096
+
+
+def backtracker(
+    grid: MazeGrid,
+    entry: tuple[int, int],
+    rng: random.Random,
+    compat: bool = False
+) -> None:
+    """Carves a perfect maze into the grid with the Recursive Backtracker.
+
+    The grid is copied into a work buffer padded with one ring of cells, so
+    the four neighbors of any cell are fixed flat offsets and never need a
+    bounds check. The buffer only holds the EAST and SOUTH wall of each
+    cell, so each carve is a single write; the full walls are rebuilt from
+    it once at the end. A separate visited map (0 for visited or blocked cells,
+    1 for unvisited) turns the neighbor scan into a 4-bit mask that indexes
+    precomputed direction tables. The stack is an array of flat indices.
+
+    Cells that are not 15 when the kernel starts (the 42 pattern, or cells
+    carved by a previous call) are treated as already visited.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        entry (tuple[int, int]): Coordinates (x, y) of the starting cell.
+        rng (random.Random): The random source to draw from.
+        compat (bool, optional): If True, draw each step with
+            rng.choice so a seed yields the same maze as the original
+            implementation. If False, random bytes are drawn in bulk.
+            Defaults to False.
+    """
+    width, height = grid.width, grid.height
+    cells = grid.cells
+    stride = width + 2
+    work = bytearray(stride * (height + 2))
+    unvisited = bytearray(len(work))
+
+    for y in range(height):
+        row = cells[y * width:(y + 1) * width]
+        start = (y + 1) * stride + 1
+        work[start:start + width] = row.translate(HALF_EDGE)
+        unvisited[start:start + width] = row.translate(UNVISITED)
+
+    offsets = (-stride, 1, stride, -1)
+    owners = tuple(dy * stride + dx for dy, dx in HALF_OWNERS)
+    first = (entry[1] + 1) * stride + entry[0] + 1
+    unvisited[first] = 0
+    stack = array("I", [first])
+
+    choice = rng.choice
+    pool = b""
+    pos = 0
+
+    while stack:
+        cell = stack[-1]
+        mask = (unvisited[cell - stride]
+                | unvisited[cell + 1] << 1
+                | unvisited[cell + stride] << 2
+                | unvisited[cell - 1] << 3)
+        if not mask:  # Dead end
+            stack.pop()  # Backtrack
+            continue
+
+        if compat:
+            direction = choice(CHOICES[mask])
+        elif mask & (mask - 1) == 0:  # A single way forward
+            direction = CHOICES[mask][0]
+        else:
+            picks = PICKS[mask]
+            direction = -1
+            while direction < 0:
+                if pos == len(pool):
+                    pool = rng.randbytes(RANDOM_POOL_SIZE)
+                    pos = 0
+                direction = picks[pool[pos]]
+                pos += 1
+
+        # Break walls between current cell and chosen neighbor
+        neighbor = cell + offsets[direction]
+        work[cell + owners[direction]] -= HALF_BITS[direction]
+        unvisited[neighbor] = 0
+        stack.append(neighbor)  # Move to neighbor
+
+    halves = b"".join(
+        work[(y + 1) * stride + 1:(y + 1) * stride + 1 + width]
+        for y in range(height)
+    )
+    cells[:] = expand_half_edges(halves, width)
+    grid.touch()
+
+
+def kruskal(
+    grid: MazeGrid,
+    entry: tuple[int, int],
+    rng: random.Random
+) -> None:
+    """Carves a perfect maze into the grid with randomized Kruskal.
+
+    Every wall between two free cells is listed once (as 2 * index for its
+    EAST wall, 2 * index + 1 for its SOUTH wall) and the list is shuffled.
+    Walls are then removed in that order whenever the cells on either side
+    are not yet connected, tracked with an array-backed union-find using
+    path halving. The entry is not needed: the result is a spanning tree
+    of every free cell.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        rng (random.Random): The random source to draw from.
+    """
+    width, height = grid.width, grid.height
+    cells = grid.cells
+    size = width * height
+
+    walls = array("I")
+    for index in range(size):
+        if cells[index] == 31:
+            continue
+        if index % width < width - 1 and cells[index + 1] != 31:
+            walls.append(index << 1)
+        if index + width < size and cells[index + width] != 31:
+            walls.append(index << 1 | 1)
+    rng.shuffle(walls)
+
+    parent = array("I", range(size))
+    for wall in walls:
+        a = wall >> 1
+        b = a + (width if wall & 1 else 1)
+        # Find both roots, halving the paths on the way
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+
+        index = wall >> 1
+        if wall & 1:
+            cells[index] -= 4
+            cells[index + width] -= 1
+        else:
+            cells[index] -= 2
+            cells[index + 1] -= 8
+    grid.touch()
+
+
+def prim(
+    grid: MazeGrid,
+    entry: tuple[int, int],
+    rng: random.Random
+) -> None:
+    """Carves a perfect maze into the grid with randomized Prim.
+
+    The maze grows from the entry. The frontier (cells next to the maze)
+    is an array of flat indices; a random one is taken out in O(1) by
+    swapping it with the last element, joined to a random neighbor that is
+    already in the maze, and its own new neighbors join the frontier.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        entry (tuple[int, int]): Coordinates (x, y) of the starting cell.
+        rng (random.Random): The random source to draw from.
+    """
+    width, height = grid.width, grid.height
+    cells = grid.cells
+    size = width * height
+    # 0 = untouched, 1 = in the frontier, 2 = in the maze (or blocked)
+    state = cells.translate(bytes(2 if v == 31 else 0 for v in range(256)))
+    frontier = array("I")
+
+    def grow(index: int) -> None:
+        state[index] = 2
+        x = index % width
+        for neighbor, inside in (
+            (index - width, index >= width),
+            (index + 1, x < width - 1),
+            (index + width, index + width < size),
+            (index - 1, x > 0),
+        ):
+            if inside and not state[neighbor]:
+                state[neighbor] = 1
+                frontier.append(neighbor)
+
+    grow(entry[1] * width + entry[0])
+    while frontier:
+        pick = rng.randrange(len(frontier))
+        index = frontier[pick]
+        frontier[pick] = frontier[-1]
+        frontier.pop()
+
+        # Join the cell to a random neighbor already in the maze
+        x = index % width
+        joins = [
+            (direction, neighbor)
+            for direction, neighbor, inside in (
+                (0, index - width, index >= width),
+                (1, index + 1, x < width - 1),
+                (2, index + width, index + width < size),
+                (3, index - 1, x > 0),
+            )
+            if inside and state[neighbor] == 2 and cells[neighbor] != 31
+        ]
+        direction, neighbor = rng.choice(joins)
+        cells[index] -= WALL_BITS[direction]
+        cells[neighbor] -= OPPOSITE_BITS[direction]
+        grow(index)
+    grid.touch()
+
+
+Engine = Callable[[MazeGrid, tuple[int, int], random.Random], None]
+
+# Maze generation engines by ALGORITHM name. Every engine carves a perfect
+# maze in place into a grid of closed cells, leaving PATTERN cells (31)
+# untouched, then calls grid.touch() so caches see the new walls.
+ENGINES: dict[str, Engine] = {
+    "backtracker": backtracker,
+    "kruskal": kruskal,
+    "prim": prim,
+}
+
+try:
+    from mazegen.vectorized import binary_tree, sidewinder
+except ImportError:  # NumPy is optional (pip install mazegen[fast])
+    pass
+else:
+    ENGINES["binary-tree"] = binary_tree
+    ENGINES["sidewinder"] = sidewinder
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    """Adds a generation engine to the registry under the given name.
+
+    Args:
+        name (str): The ALGORITHM value that selects the engine.
+        engine (Engine): A function carving a perfect maze into a grid.
+    """
+    ENGINES[name] = engine
+
+
+def get_engine(name: str) -> Engine:
+    """Looks up a generation engine by name.
+
+    Args:
+        name (str): The ALGORITHM value.
+
+    Returns:
+        Engine: The registered engine.
+
+    Raises:
+        ValueError: If no engine is registered under that name.
+    """
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"ERROR: Unknown ALGORITHM '{name}'. " +
+            f"Expected one of: {', '.join(ENGINES)}"
+        )
+
+
+def benchmark_engines(
+    width: int,
+    height: int,
+    seed: Any = None,
+    names: list[str] | None = None
+) -> dict[str, float]:
+    """Times each engine on the same maze size and seed.
+
+    Args:
+        width (int): The width of the benchmark maze.
+        height (int): The height of the benchmark maze.
+        seed (Any, optional): The seed given to every engine.
+                              Defaults to None.
+        names (list[str] | None, optional): The engines to time.
+                                            Defaults to all of them.
+
+    Returns:
+        dict[str, float]: The carving time of each engine, in seconds.
+    """
+    timings: dict[str, float] = {}
+    for name in names if names is not None else list(ENGINES):
+        engine = get_engine(name)
+        grid = MazeGrid(width, height, 15)
+        rng = random.Random(seed)
+        start = perf_counter()
+        engine(grid, (0, 0), rng)
+        timings[name] = perf_counter() - start
+    return timings
@@ -1,29 +1,101 @@
+from bisect import bisect_left
+from mazegen.interface.lod import density_mipmaps, shade, shade_tables
 from mazegen.interface.MazeInterface import MazeInterface
-from mazegen.common import Direction
+from mazegen.interface.TileCache import TileCache
+from mazegen.MazeGrid import MazeGrid, as_grid
+
+# Rendering back ends of MazeDraw, by RENDERER name
+RENDERERS: tuple[str, ...] = ("tiles",)
+
+try:
+    from mazegen.interface.rasterize import rasterize
+except ImportError:  # NumPy is optional (pip install mazegen[fast])
+    pass
+else:
+    RENDERERS += ("numpy",)
+
+
+# Colors of the maze elements, as 0xAARRGGBB
+DEFAULT_THEME = {
+    "entry": 0xFF00FF00,
+    "exit": 0xFFFF0000,
+    "path": 0xFFFFFFFF,
+    "wall": 0xFF000000,
+    "solution": 0xFF0000FF,
+}
+
+# Wall colors cycled by the C key
+WALL_COLORS = (0xFF000000, 0xFF3050A0, 0xFF806040, 0xFF208060)
+
+# Overlays drawn over the maze, in drawing order, that can be toggled
+LAYERS = ("markers", "solution")
+
+# Cells smaller than MIN_SIDE pixels are drawn from wall density mipmaps
+# instead of with their walls; zooming in stops at MAX_SIDE pixels
+MIN_SIDE = 3
+MAX_SIDE = 64
+
+# X11 key codes of the interactive actions
+KEY_C = 99
+KEY_M = 109
+KEY_S = 115
+KEY_ZOOM_IN = 61  # =, also + without shift
+KEY_ZOOM_OUT = 45  # -
+KEY_FIT = 48  # 0
+KEY_LEFT = 65361
+KEY_UP = 65362
+KEY_RIGHT = 65363
+KEY_DOWN = 65364
+
+# Mouse buttons of the wheel, which zooms around the pointer
+BUTTON_WHEEL_UP = 4
+BUTTON_WHEEL_DOWN = 5
 
 
 class MazeDraw:
     """
     Class for drawing the maze on the screen.
+
+    The picture is made of layers: the maze itself (walls and corridors),
+    the entry/exit markers and the solution path. The maze layer is kept
+    as a copy of the image, so showing, hiding or recoloring an overlay
+    only redraws the cells it covers: they are restored from that copy
+    and the visible overlays are drawn again over them.
+
+    The window shows a viewport of the maze: by default the whole maze
+    fits, and it can be zoomed and panned. Only visible cells are drawn.
+    When cells are smaller than MIN_SIDE pixels, each pixel block (a
+    texel) stands for 2^level x 2^level cells, shaded from a mipmap of
+    wall densities, so the cost of a frame follows the window size, not
+    the maze size.
     """
     def __init__(self, title: str,
-                 grid: list[list[int]],
+                 grid: MazeGrid | list[list[int]],
                  entry: tuple[int, int],
                  exit: tuple[int, int],
                  solution: list[tuple[int, int]] | None = None,
-                 screen_size: tuple[int, int] = (800, 800)) -> None:
+                 screen_size: tuple[int, int] = (800, 800),
+                 renderer: str = "tiles") -> None:
         """
         Initialize MazeDraw with grid and configuration.
 
         :param title: Title of the window.
-        :param grid: 2D list representing the maze.
+        :param grid: MazeGrid (or 2D list) representing the maze.
         :param entry: Coordinates of the entry point.
         :param exit: Coordinates of the exit point.
         :param solution: List of coordinates representing the solution path.
         :param screen_size: Tuple (width, height) of the screen.
+        :param renderer: Rendering back end, one of RENDERERS: "tiles"
+            (cached tiles, pure Python) or "numpy" (whole frame at once).
+        :raises ValueError: If the renderer is unknown or unavailable.
         """
+        if renderer not in RENDERERS:
+            raise ValueError(
+                f"ERROR: Unknown RENDERER '{renderer}'. " +
+                f"Available: {', '.join(RENDERERS)}"
+            )
         self._mlx: MazeInterface = MazeInterface()
-        self._grid = grid
+        self._grid = as_grid(grid)
         self._entry = entry
         self._exit = exit
         self.solution = solution
@@ -32,7 +104,41 @@ class MazeDraw:
         self.r_center: tuple[int, int] = (0, 0)
         self.r_w: int = 0
         self.r_h: int = 0
+        self.theme: dict[str, int] = dict(DEFAULT_THEME)
+        self._tiles = TileCache()
+        self.renderer = renderer
+        self.layers: dict[str, bool] = dict.fromkeys(LAYERS, True)
+        self._base: bytes = b""
+        # Pixels per cell (None fits the maze) and top-left visible cell
+        self.scale: float | None = None
+        self.view: tuple[int, int] = (0, 0)
+        # Visible cells (x0, y0, x1, y1), mipmap level (0 for cells drawn
+        # with walls too), and pixels per texel with the screen offsets
+        self._visible: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._level: int = 0
+        self._detail: bool = True
+        self._layout: tuple[int, int, int] = (0, 0, 0)
+        self._mipmaps: list[tuple[bytes, int, int]] = []
+        self._mipmaps_version = -1
+        self._path_rows: dict[int, dict[int, list[int]]] = {}
+        self._path_source: list[tuple[int, int]] | None = None
         self._mlx.init_screen(title, self.width, self.height)
+        self._mlx.key_actions.update({
+            KEY_S: lambda: self.toggle_layer("solution"),
+            KEY_M: lambda: self.toggle_layer("markers"),
+            KEY_C: self.cycle_wall_color,
+            KEY_ZOOM_IN: lambda: self.zoom(2),
+            KEY_ZOOM_OUT: lambda: self.zoom(0.5),
+            KEY_FIT: self.fit,
+            KEY_LEFT: lambda: self.pan(-1, 0),
+            KEY_RIGHT: lambda: self.pan(1, 0),
+            KEY_UP: lambda: self.pan(0, -1),
+            KEY_DOWN: lambda: self.pan(0, 1),
+        })
+        self._mlx.mouse_actions.update({
+            BUTTON_WHEEL_UP: lambda x, y: self.zoom(2, (x, y)),
+            BUTTON_WHEEL_DOWN: lambda x, y: self.zoom(0.5, (x, y)),
+        })
 
     def draw_rect(self, coords: tuple[int, int],
                   width: int, height: int, color: int) -> None:
@@ -44,10 +150,7 @@ class MazeDraw:
         :param height: Height of the rectangle.
         :param color: Color of the rectangle.
         """
-        for x in range(width):
-            for y in range(height):
-                self._mlx.my_mlx_put_pixel(
-                    (coords[0] + x, coords[1] + y), color)
+        self._mlx.fill_rect(coords, width, height, color)
 
     def draw_cube(self, coords: tuple[int, int],
                   side_len: int, color: int) -> None:
@@ -58,89 +161,298 @@ class MazeDraw:
         :param side_len: Length of the square side.
         :param color: Color of the square.
         """
+        self._mlx.fill_rect(coords, side_len, side_len, color)
 
-        for x in range(side_len):
-            for y in range(side_len):
-                self._mlx.my_mlx_put_pixel(
-                    (coords[0] + x, coords[1] + y), color)
+    def cell_rect(self, c: int, r: int) -> tuple[int, int, int] | None:
+        """
+        Return where a cell is drawn: its texel on screen.
 
-    def draw_solution(self, side_len: int,
-                      offset_x: int, offset_y: int) -> None:
+        :param c: Column of the cell.
+        :param r: Row of the cell.
+        :return: Top-left pixel (x, y) and side of the texel holding the
+            cell, or None if the cell is outside the viewport.
         """
-        Draw the solution path.
+        x0, y0, x1, y1 = self._visible
+        if not (x0 <= c < x1 and y0 <= r < y1):
+            return None
+        side, offset_x, offset_y = self._layout
+        return (offset_x + ((c - x0) >> self._level) * side,
+                offset_y + ((r - y0) >> self._level) * side,
+                side)
 
-        :param side_len: Length of the square side.
-        :param offset_x: X offset on screen.
-        :param offset_y: Y offset on screen.
+    def path_rows(self) -> dict[int, list[int]]:
+        """
+        Return the solution texels of the current level, row by row.
+
+        Built once per level (and per solution), so drawing the path only
+        walks the texel rows and columns inside the viewport.
+
+        :return: Sorted texel columns of the path, by texel row.
+        """
+        if self._path_source is not self.solution:
+            self._path_rows = {}
+            self._path_source = self.solution
+        rows = self._path_rows.get(self._level)
+        if rows is None:
+            level = self._level
+            texels: dict[int, set[int]] = {}
+            for c, r in self.solution or []:
+                texels.setdefault(r >> level, set()).add(c >> level)
+            rows = {ty: sorted(txs) for ty, txs in texels.items()}
+            self._path_rows[level] = rows
+        return rows
+
+    def overlay_rects(self, name: str) -> set[tuple[int, int, int]]:
+        """
+        Return the visible texels covered by an overlay.
+
+        :param name: One of LAYERS.
+        :return: The rectangles (x, y, side) the overlay draws on.
+        """
+        if name == "markers":
+            rects = (self.cell_rect(*self._entry),
+                     self.cell_rect(*self._exit))
+            return {rect for rect in rects if rect is not None}
+
+        side, offset_x, offset_y = self._layout
+        x0, y0, x1, y1 = self._visible
+        level = self._level
+        tx0, ty0 = x0 >> level, y0 >> level
+        tx1, ty1 = (x1 - 1 >> level) + 1, (y1 - 1 >> level) + 1
+        path = self.path_rows()
+        found = set()
+        for ty in range(ty0, ty1):
+            row = path.get(ty)
+            if not row:
+                continue
+            y = offset_y + (ty - ty0) * side
+            for tx in row[bisect_left(row, tx0):bisect_left(row, tx1)]:
+                found.add((offset_x + (tx - tx0) * side, y, side))
+        return found
+
+    def draw_solution(self,
+                      rects: set[tuple[int, int, int]] | None = None) -> None:
+        """
+        Draw the solution path, as a square in the middle of each texel.
+
+        :param rects: If given, only draw the path within these texels.
         """
         if not self.solution:
             return
 
-        color_solution = 0xFF0000FF  # Blue
-        solution_thick = max(1, side_len // 3)
-        margin = (side_len - solution_thick) // 2
+        color_solution = self.theme["solution"]
+        for x, y, side_len in self.overlay_rects("solution"):
+            if rects is not None and (x, y, side_len) not in rects:
+                continue
+            solution_thick = max(1, side_len // 3)
+            margin = (side_len - solution_thick) // 2
+            self.draw_cube((x + margin, y + margin), solution_thick,
+                           color_solution)
 
-        for (c, r) in self.solution:
-            x = offset_x + c * side_len + margin
-            y = offset_y + r * side_len + margin
+    def draw_markers(self,
+                     rects: set[tuple[int, int, int]] | None = None) -> None:
+        """
+        Draw the entry and exit cells in their colors.
 
-            self.draw_cube((x, y), solution_thick, color_solution)
+        :param rects: If given, only draw the markers within these texels.
+        """
+        for (c, r), name in ((self._entry, "entry"), (self._exit, "exit")):
+            rect = self.cell_rect(c, r)
+            if rect is None or rects is not None and rect not in rects:
+                continue
+            x, y, side_len = rect
+            if not self._detail:
+                self.draw_cube((x, y), side_len, self.theme[name])
+                continue
+            tile = self._tiles.tile(self._grid.get(c, r), self.theme[name])
+            for dy, line in enumerate(tile):
+                self._mlx.put_span((x, y + dy), line)
 
-    def draw_maze(self) -> None:
+    def draw_layers(self,
+                    rects: set[tuple[int, int, int]] | None = None) -> None:
         """
-        Draw the maze based on the grid and relative measures.
+        Draw the visible overlays over the maze, in LAYERS order.
+
+        :param rects: If given, only draw the overlays within these texels.
         """
-        rows = len(self._grid)
-        cols = len(self._grid[0])
+        if self.layers["markers"]:
+            self.draw_markers(rects)
+        if self.layers["solution"]:
+            self.draw_solution(rects)
 
-        cell_w = self.r_w // cols
-        cell_h = self.r_h // rows
-        side_len = min(cell_w, cell_h)
+    def refresh(self, rects: set[tuple[int, int, int]]) -> None:
+        """
+        Redraw some texels: restore the maze layer, redraw the overlays.
 
-        offset_x = self.r_center[0] + (self.r_w - side_len * cols) // 2
-        offset_y = self.r_center[1] + (self.r_h - side_len * rows) // 2
+        Only those rectangles are copied back from the saved maze layer,
+        row by row, then the image is pushed to the window.
 
-        color_entry = 0xFF00FF00
-        color_exit = 0xFFFF0000
-        color_path = 0xFFFFFFFF
-        color_wall = 0xFF000000
+        :param rects: The rectangles (x, y, side) to redraw.
+        """
+        if not self._base:
+            return
+        stride = self._mlx.line_lenght
+        base = memoryview(self._base)
+        image = self._mlx.img_data
+        for x, y, side_len in rects:
+            start = y * stride + x * 4
+            for offset in range(start, start + side_len * stride, stride):
+                end = offset + side_len * 4
+                image[offset:end] = base[offset:end]
+        self.draw_layers(rects)
+        self.put_image()
 
-        wall_thick = max(1, side_len // 8)
+    def toggle_layer(self, name: str) -> None:
+        """
+        Show or hide an overlay, redrawing only the texels it covers.
 
-        for r in range(rows):
-            for c in range(cols):
-                x = offset_x + c * side_len
-                y = offset_y + r * side_len
+        :param name: One of LAYERS.
+        """
+        self.layers[name] = not self.layers[name]
+        self.refresh(self.overlay_rects(name))
 
-                if (c, r) == self._entry:
-                    color = color_entry
-                elif (c, r) == self._exit:
-                    color = color_exit
-                else:
-                    color = color_path
+    def cycle_wall_color(self) -> None:
+        """
+        Switch the walls to the next color of WALL_COLORS.
+        """
+        wall = self.theme["wall"]
+        index = WALL_COLORS.index(wall) if wall in WALL_COLORS else -1
+        self.set_theme(wall=WALL_COLORS[(index + 1) % len(WALL_COLORS)])
 
-                self.draw_cube((x, y), side_len, color)
+    def set_theme(self, **colors: int) -> None:
+        """
+        Change some colors of the theme and redraw what they color.
 
-                cell_mask = self._grid[r][c]
+        The entry, exit and solution colors only belong to the overlays,
+        so changing them redraws the texels of those; other colors are
+        part of the maze layer, which is drawn again.
 
-                if cell_mask & Direction.NORTH:
-                    self.draw_rect((x, y), side_len, wall_thick, color_wall)
-                if cell_mask & Direction.SOUTH:
-                    self.draw_rect(
-                        (x, y + side_len - wall_thick),
-                        side_len, wall_thick, color_wall
-                    )
-                if cell_mask & Direction.WEST:
-                    self.draw_rect((x, y), wall_thick, side_len, color_wall)
-                if cell_mask & Direction.EAST:
-                    self.draw_rect(
-                        (x + side_len - wall_thick, y),
-                        wall_thick, side_len, color_wall
-                    )
+        :param colors: New colors by name (entry, exit, path, wall,
+            solution).
+        :raises ValueError: If a color name is not part of the theme.
+        """
+        unknown = set(colors) - set(DEFAULT_THEME)
+        if unknown:
+            raise ValueError(
+                f"ERROR: Unknown theme colors: {', '.join(sorted(unknown))}"
+            )
+        self.theme.update(colors)
+        if not self._base or not set(colors) <= {"entry", "exit", "solution"}:
+            self.draw_maze()
+            return
+        rects: set[tuple[int, int, int]] = set()
+        if "solution" in colors:
+            rects |= self.overlay_rects("solution")
+        if colors.keys() & {"entry", "exit"}:
+            rects |= self.overlay_rects("markers")
+        self.refresh(rects)
 
-        if self.solution:
-            self.draw_solution(side_len, offset_x, offset_y)
+    def fit_scale(self) -> float:
+        """
+        Return the scale (pixels per cell) that fits the whole maze.
+
+        Whole pixels are kept while cells get at least MIN_SIDE pixels,
+        so a fitted maze is drawn exactly as it always was.
+        """
+        cols, rows = self._grid.width, self._grid.height
+        side_len = min(self.r_w // cols, self.r_h // rows)
+        if side_len >= MIN_SIDE:
+            return float(side_len)
+        return min(self.r_w / cols, self.r_h / rows)
 
+    def zoom(self, factor: float,
+             anchor: tuple[int, int] | None = None) -> None:
+        """
+        Zoom in or out, keeping the cell under the anchor in place.
+
+        :param factor: Scale multiplier (2 zooms in, 0.5 zooms out).
+        :param anchor: Screen point (x, y) to zoom around. Defaults to
+            the center of the maze area.
+        """
+        fit = self.fit_scale()
+        scale = self.scale if self.scale is not None else fit
+        new_scale = min(max(scale * factor, fit), max(fit, MAX_SIDE))
+        if new_scale == scale:
+            return
+
+        if anchor is None:
+            anchor = (self.r_center[0] + self.r_w // 2,
+                      self.r_center[1] + self.r_h // 2)
+        side, offset_x, offset_y = self._layout
+        step = 1 << self._level
+        # Cell under the anchor, then the view that keeps it there
+        cell_x = self._visible[0] + (anchor[0] - offset_x) * step / side
+        cell_y = self._visible[1] + (anchor[1] - offset_y) * step / side
+        self.scale = None if new_scale == fit else new_scale
+        self.view = (
+            int(cell_x - (anchor[0] - self.r_center[0]) / new_scale),
+            int(cell_y - (anchor[1] - self.r_center[1]) / new_scale),
+        )
+        self.draw_maze()
+
+    def pan(self, dx: int, dy: int) -> None:
+        """
+        Move the viewport by a quarter of its size.
+
+        :param dx: Horizontal direction (-1 left, 1 right, 0 none).
+        :param dy: Vertical direction (-1 up, 1 down, 0 none).
+        """
+        x0, y0, x1, y1 = self._visible
+        view = (x0 + dx * max(1, (x1 - x0) // 4),
+                y0 + dy * max(1, (y1 - y0) // 4))
+        if view != self.view:
+            self.view = view
+            self.draw_maze()
+
+    def fit(self) -> None:
+        """
+        Show the whole maze again.
+        """
+        self.scale = None
+        self.view = (0, 0)
+        self.draw_maze()
+
+    def update_view(self) -> None:
+        """
+        Compute the visible cells, the level and the layout of the view.
+
+        The view is clamped to the maze. At MIN_SIDE pixels per cell or
+        more, cells are drawn with their walls; below, the smallest
+        mipmap level whose texels get at least one pixel is used, and the
+        view is aligned to whole texels.
+        """
+        cols, rows = self._grid.width, self._grid.height
+        scale = self.scale if self.scale is not None else self.fit_scale()
+
+        level = 0
+        while scale * (1 << level) < 1:
+            level += 1
+        side = int(scale * (1 << level))
+        self._detail = scale >= MIN_SIDE
+        self._level = level
+        step = 1 << level
+
+        across = (self.r_w // side) * step
+        down = (self.r_h // side) * step
+        x0 = min(max(self.view[0], 0), max(cols - across, 0))
+        y0 = min(max(self.view[1], 0), max(rows - down, 0))
+        x0, y0 = x0 // step * step, y0 // step * step
+        x1, y1 = min(cols, x0 + across), min(rows, y0 + down)
+        self.view = (x0, y0)
+        self._visible = (x0, y0, x1, y1)
+
+        texels_x = (x1 - x0 - 1) // step + 1
+        texels_y = (y1 - y0 - 1) // step + 1
+        self._layout = (
+            side,
+            self.r_center[0] + (self.r_w - side * texels_x) // 2,
+            self.r_center[1] + (self.r_h - side * texels_y) // 2,
+        )
+
+    def put_image(self) -> None:
+        """
+        Push the image to the window.
+        """
         self._mlx.mlx_put_image_to_window(
             self._mlx.mlx_ptr,
             self._mlx.win_ptr,
@@ -149,6 +461,138 @@ class MazeDraw:
             0
         )
 
+    def draw_maze(self) -> None:
+        """
+        Draw the visible part of the maze.
+
+        The maze layer is drawn first and saved, then the visible overlays
+        are drawn over it.
+        """
+        self.update_view()
+        side_len, offset_x, offset_y = self._layout
+        # A new size or wall color drops the tiles rendered so far
+        self._tiles.configure(
+            side_len, max(1, side_len // 8), self.theme["wall"]
+        )
+
+        if not self._detail:
+            self.draw_density(side_len, offset_x, offset_y)
+        elif self.renderer == "numpy":
+            self.draw_frame(side_len, offset_x, offset_y)
+        else:
+            self.draw_tiles(side_len, offset_x, offset_y)
+        self._base = bytes(self._mlx.img_data)
+
+        self.draw_layers()
+        self.put_image()
+
+    def clear(self) -> None:
+        """
+        Clear the whole image.
+        """
+        self._mlx.img_data[:] = bytes(len(self._mlx.img_data))
+
+    def draw_tiles(self, side_len: int,
+                   offset_x: int, offset_y: int) -> None:
+        """
+        Draw the maze layer from cached tiles.
+
+        Cells are taken from the tile cache, rendered once per wall mask
+        and color. Each row of cells is then drawn as whole scanlines: the
+        distinct rows of its tiles (at most three) are joined into full
+        lines, each copied with a single put_span call, so the work grows
+        with the number of cells rather than with their pixels.
+
+        :param side_len: Length of the square side.
+        :param offset_x: X offset on screen.
+        :param offset_y: Y offset on screen.
+        """
+        cols = self._grid.width
+        cells = self._grid.cells
+        x0, y0, x1, y1 = self._visible
+
+        color_path = self.theme["path"]
+        bands = self._tiles.bands
+
+        self.clear()
+        for r in range(y0, y1):
+            row = cells[r * cols + x0:r * cols + x1]
+            tiles = [self._tiles.tile(mask, color_path) for mask in row]
+            lines: dict[int, bytes] = {}
+            y = offset_y + (r - y0) * side_len
+            for dy, band in enumerate(bands):
+                if band not in lines:
+                    lines[band] = b"".join([tile[dy] for tile in tiles])
+                self._mlx.put_span((offset_x, y + dy), lines[band])
+
+    def draw_frame(self, side_len: int,
+                   offset_x: int, offset_y: int) -> None:
+        """
+        Draw the maze layer as one NumPy frame.
+
+        The visible cells are rendered by rasterize with the image stride
+        as the frame width, then copied into the image with a single
+        assignment.
+
+        :param side_len: Length of the square side.
+        :param offset_x: X offset on screen.
+        :param offset_y: Y offset on screen.
+        """
+        x0, y0, x1, y1 = self._visible
+        grid = self._grid
+        if (x1 - x0, y1 - y0) != (grid.width, grid.height):
+            grid = MazeGrid(x1 - x0, y1 - y0, 0)
+            grid.cells[:] = b"".join(
+                self._grid.cells[r * self._grid.width + x0:
+                                 r * self._grid.width + x1]
+                for r in range(y0, y1)
+            )
+        frame = rasterize(
+            grid,
+            (self._mlx.line_lenght // 4, self.height),
+            (offset_x, offset_y),
+            side_len,
+            # Markers and the solution are overlays, drawn separately
+            dict(self.theme, entry=self.theme["path"],
+                 exit=self.theme["path"]),
+            (0, 0),
+            (0, 0)
+        )
+        self._mlx.img_data[:] = frame.data.cast("B")
+
+    def draw_density(self, side_len: int,
+                     offset_x: int, offset_y: int) -> None:
+        """
+        Draw the maze layer from the wall density mipmap of the level.
+
+        Each texel is shaded between the path and the wall color by the
+        share of closed walls in the cells it covers. A row of texels is
+        a few translate passes, and is copied side_len times.
+
+        :param side_len: Pixels per texel.
+        :param offset_x: X offset on screen.
+        :param offset_y: Y offset on screen.
+        """
+        if self._mipmaps_version != self._grid.version or not self._mipmaps:
+            self._mipmaps = density_mipmaps(self._grid)
+            self._mipmaps_version = self._grid.version
+        data, width, _ = self._mipmaps[self._level]
+        tables = shade_tables(self.theme["path"], self.theme["wall"])
+
+        x0, y0, x1, y1 = self._visible
+        level = self._level
+        tx0, tx1 = x0 >> level, (x1 - 1 >> level) + 1
+        ty0, ty1 = y0 >> level, (y1 - 1 >> level) + 1
+
+        self.clear()
+        for ty in range(ty0, ty1):
+            line = shade(
+                data[ty * width + tx0:ty * width + tx1], tables, side_len
+            )
+            y = offset_y + (ty - ty0) * side_len
+            for dy in range(side_len):
+                self._mlx.put_span((offset_x, y + dy), line)
+
     def get_relative_measures(self) -> None:
         """
         Calculate relative screen measures for the maze area.
@@ -1,5 +1,5 @@
 from mlx import Mlx
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 import sys
 
 
@@ -12,6 +12,10 @@ class MazeInterface(Mlx):
         super().__init__()
         self.bpp: int = 0
         self.size_line: int = 0
+        # Actions run by the key hook, by key code
+        self.key_actions: dict[int, Callable[[], None]] = {}
+        # Actions run by the mouse hook with the pointer (x, y), by button
+        self.mouse_actions: dict[int, Callable[[int, int], None]] = {}
 
     def init_screen(self,
                     title: str,
@@ -74,11 +78,15 @@ class MazeInterface(Mlx):
         """
         def mymouse(button: int, x: int, y: int, param: Optional[Any]) -> None:
             print(f"Got mouse event! button {button} at {x},{y}.")
+            if button in self.mouse_actions:
+                self.mouse_actions[button](x, y)
 
         def mykey(keynum: int, param: Optional[Any]) -> None:
             print(f"Got key {keynum}")
             if keynum == 113 or keynum == 65307 or keynum == 53:
                 self.exit_window()
+            elif keynum in self.key_actions:
+                self.key_actions[keynum]()
 
         self.mlx_mouse_hook(self.win_ptr, mymouse, None)
         self.mlx_key_hook(self.win_ptr, mykey, None)
@@ -95,3 +103,48 @@ class MazeInterface(Mlx):
             if 0 <= y < self.height:
                 offset = (y * self.line_lenght) + (x * 4)
                 self.img_data[offset:offset+4] = color.to_bytes(4, 'little')
+
+    def put_span(self, coords: tuple[int, int], span: bytes) -> None:
+        """
+        Copy a row of pre-rendered pixels into the image in one slice.
+
+        :param coords: Coordinates (x, y) of the first pixel.
+        :param span: Pixels as 4 little-endian bytes each, clipped to
+            the image.
+        """
+        x, y = coords
+        if not 0 <= y < self.height:
+            return
+        if x < 0:
+            span = span[-x * 4:]
+            x = 0
+        span = span[:(self.width - x) * 4]
+        if span:
+            offset = (y * self.line_lenght) + (x * 4)
+            self.img_data[offset:offset + len(span)] = span
+
+    def fill_rect(self, coords: tuple[int, int],
+                  width: int, height: int, color: int) -> None:
+        """
+        Fill a rectangle, writing one pre-multiplied span per scanline.
+
+        :param coords: Top-left coordinates (x, y), clipped to the image.
+        :param width: Width of the rectangle.
+        :param height: Height of the rectangle.
+        :param color: Color of the rectangle.
+        """
+        x, y = max(coords[0], 0), max(coords[1], 0)
+        end_x = min(coords[0] + width, self.width)
+        end_y = min(coords[1] + height, self.height)
+        if x >= end_x or y >= end_y:
+            return
+
+        span = color.to_bytes(4, 'little') * (end_x - x)
+        start = (y * self.line_lenght) + (x * 4)
+        end = end_y * self.line_lenght
+        if len(span) == self.line_lenght:
+            # Whole scanlines are contiguous, so fill them in one go
+            self.img_data[start:end] = span * (end_y - y)
+            return
+        for offset in range(start, end, self.line_lenght):
+            self.img_data[offset:offset + len(span)] = span
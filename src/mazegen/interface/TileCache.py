@@ -0,0 +1,95 @@
+from mazegen.common import Direction
+
+
+class TileCache:
+    """
+    Pre-rendered pixels of maze cells, one tile per wall mask and color.
+
+    A cell only has 16 wall masks (plus 31 for the pattern) and a handful
+    of background colors (path, entry, exit), so each combination is
+    rendered once into rows of pixel bytes and reused for every cell that
+    shares it. Tiles depend on the cell size and the wall color: changing
+    either through configure drops them all.
+    """
+
+    def __init__(self) -> None:
+        self.side_len: int = 0
+        self.wall_thick: int = 0
+        self.color_wall: int = 0
+        # For each pixel row of a tile: 1 if it crosses the NORTH wall,
+        # 2 if it crosses the SOUTH wall, 3 for both, 0 for neither
+        self.bands: list[int] = []
+        self._tiles: dict[tuple[int, int], tuple[bytes, ...]] = {}
+
+    def configure(self, side_len: int, wall_thick: int,
+                  color_wall: int) -> None:
+        """
+        Set the tile geometry and wall color, clearing tiles on change.
+
+        :param side_len: Length of the square side, in pixels.
+        :param wall_thick: Thickness of the walls, in pixels.
+        :param color_wall: Color of the walls.
+        """
+        settings = (side_len, wall_thick, color_wall)
+        if settings == (self.side_len, self.wall_thick, self.color_wall):
+            return
+        self.side_len, self.wall_thick, self.color_wall = settings
+        self.bands = [
+            (dy < wall_thick) | (dy >= side_len - wall_thick) << 1
+            for dy in range(side_len)
+        ]
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Drop every rendered tile.
+        """
+        self._tiles.clear()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def tile(self, cell_mask: int, color: int) -> tuple[bytes, ...]:
+        """
+        Return the pixel rows of a cell, rendering them the first time.
+
+        Rows in the same band are the same bytes object, so callers can
+        join each distinct row of a line of tiles only once.
+
+        :param cell_mask: Bitmask of the closed walls of the cell.
+        :param color: Background color of the cell.
+        :return: side_len rows of side_len pixels, 4 bytes each.
+        """
+        key = (cell_mask, color)
+        tile = self._tiles.get(key)
+        if tile is None:
+            spans = {
+                band: self._render_row(band, cell_mask, color)
+                for band in set(self.bands)
+            }
+            tile = tuple(spans[band] for band in self.bands)
+            self._tiles[key] = tile
+        return tile
+
+    def _render_row(self, band: int, cell_mask: int, color: int) -> bytes:
+        """
+        Render one pixel row of a cell.
+
+        :param band: Which horizontal walls the row crosses (see bands).
+        :param cell_mask: Bitmask of the closed walls of the cell.
+        :param color: Background color of the cell.
+        :return: side_len pixels of 4 bytes each.
+        """
+        side_len = self.side_len
+        wall = self.color_wall.to_bytes(4, 'little')
+        if (band & 1 and cell_mask & Direction.NORTH
+                or band & 2 and cell_mask & Direction.SOUTH):
+            return wall * side_len
+
+        pixels = bytearray(color.to_bytes(4, 'little') * side_len)
+        thick = min(self.wall_thick, side_len)
+        if cell_mask & Direction.WEST:
+            pixels[:thick * 4] = wall * thick
+        if cell_mask & Direction.EAST:
+            pixels[(side_len - thick) * 4:] = wall * thick
+        return bytes(pixels)
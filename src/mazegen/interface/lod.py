@@ -0,0 +1,107 @@
+from mazegen.MazeGrid import MazeGrid
+
+
+# Wall density of a cell, 0 (no wall) to 255 (all walls or PATTERN)
+DENSITY = bytes(
+    255 if value == 31 else bin(value & 15).count("1") * 255 // 4
+    for value in range(256)
+)
+
+
+def _average(a: bytes, b: bytes) -> bytes:
+    """Returns the bytewise floor((a + b) / 2) of two byte strings.
+
+    Both strings are read as one big integer each (SWAR): a & b plus half
+    of a ^ b is the average without carries, and masking with 0x7F drops
+    the bit each byte shifts into its neighbor.
+    """
+    size = len(a)
+    x, y = int.from_bytes(a, "big"), int.from_bytes(b, "big")
+    low_bits = int.from_bytes(b"\x7f" * size, "big")
+    return ((x & y) + ((x ^ y) >> 1 & low_bits)).to_bytes(size, "big")
+
+
+def _halve(
+    data: bytes,
+    width: int,
+    height: int
+) -> tuple[bytes, int, int]:
+    """Averages 2x2 blocks of a density map (odd edges are repeated)."""
+    if width % 2:
+        data = b"".join(
+            data[start:start + width] + data[start + width - 1:start + width]
+            for start in range(0, width * height, width)
+        )
+        width += 1
+    if height % 2:
+        data += data[-width:]
+        height += 1
+
+    data = _average(data[0::2], data[1::2])
+    width //= 2
+    rows = [data[start:start + width] for start in range(0, len(data), width)]
+    data = _average(b"".join(rows[0::2]), b"".join(rows[1::2]))
+    return data, width, height // 2
+
+
+def density_mipmaps(grid: MazeGrid) -> list[tuple[bytes, int, int]]:
+    """Builds the wall density mipmaps of a maze.
+
+    Level 0 holds one byte per cell, the share of its closed walls. Each
+    next level averages the 2x2 blocks of the previous one, down to a
+    single texel, so a texel of level k covers 2^k x 2^k cells. Every
+    level is a few passes over byte strings.
+
+    Args:
+        grid (MazeGrid): The maze to summarize.
+
+    Returns:
+        list[tuple[bytes, int, int]]: The density bytes (row-major), width
+        and height of each level, from the finest to the coarsest.
+    """
+    level = (bytes(grid.cells.translate(DENSITY)), grid.width, grid.height)
+    levels = [level]
+    while level[1] > 1 or level[2] > 1:
+        level = _halve(*level)
+        levels.append(level)
+    return levels
+
+
+def shade_tables(light: int, dark: int) -> tuple[bytes, ...]:
+    """Returns, per pixel byte, the table from a density to that byte.
+
+    Args:
+        light (int): The color of density 0, as 0xAARRGGBB.
+        dark (int): The color of density 255, as 0xAARRGGBB.
+
+    Returns:
+        tuple[bytes, ...]: Four translate tables, one for each byte of a
+        little-endian pixel, blending linearly between both colors.
+    """
+    tables = []
+    for shift in (0, 8, 16, 24):
+        start, end = light >> shift & 255, dark >> shift & 255
+        tables.append(bytes(
+            start + (end - start) * density // 255 for density in range(256)
+        ))
+    return tuple(tables)
+
+
+def shade(densities: bytes, tables: tuple[bytes, ...], repeat: int) -> bytes:
+    """Turns a row of densities into pixels, each repeated a few times.
+
+    Args:
+        densities (bytes): The densities of a row of texels.
+        tables (tuple[bytes, ...]): The tables returned by shade_tables.
+        repeat (int): How many pixels each texel covers.
+
+    Returns:
+        bytes: 4 * repeat * len(densities) bytes of pixels.
+    """
+    stride = 4 * repeat
+    pixels = bytearray(stride * len(densities))
+    for channel, table in enumerate(tables):
+        values = densities.translate(table)
+        for copy in range(channel, stride, 4):
+            pixels[copy::stride] = values
+    return bytes(pixels)
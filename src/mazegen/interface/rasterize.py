@@ -0,0 +1,77 @@
+from mazegen.common import Direction
+from mazegen.MazeGrid import MazeGrid
+import numpy as np
+import numpy.typing as npt
+
+
+def rasterize(
+    grid: MazeGrid,
+    frame_size: tuple[int, int],
+    origin: tuple[int, int],
+    side_len: int,
+    theme: dict[str, int],
+    entry: tuple[int, int],
+    exit: tuple[int, int],
+    solution: list[tuple[int, int]] | None = None
+) -> npt.NDArray[np.uint32]:
+    """Renders a whole maze frame with NumPy, in a few array operations.
+
+    The maze area of the frame is viewed as a (rows, side, cols, side)
+    array, one side x side block per cell, without copying. Cell colors
+    are broadcast over their blocks in one assignment, then each wall
+    strip (the first or last wall_thick rows or columns of a block) is
+    painted for every cell with that wall closed at once, through a
+    boolean mask over the cells. The solution squares are painted last
+    with an index array. The pixels are the same as MazeDraw's.
+
+    Args:
+        grid (MazeGrid): The maze to render.
+        frame_size (tuple[int, int]): Width and height of the frame, in
+                                      pixels. The width may exceed the
+                                      image width to match its stride.
+        origin (tuple[int, int]): Top-left pixel (x, y) of the maze.
+        side_len (int): Length of the side of a cell, in pixels.
+        theme (dict[str, int]): Colors of the entry, exit, path, wall and
+                                solution, as 0xAARRGGBB.
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        exit (tuple[int, int]): Coordinates (x, y) of the exit.
+        solution (list[tuple[int, int]] | None, optional): The path to
+                                                           overlay.
+                                                           Defaults to None.
+
+    Returns:
+        npt.NDArray[np.uint32]: A (height, width) frame of little-endian
+        0xAARRGGBB pixels, 0 outside the maze.
+    """
+    width, height = frame_size
+    frame = np.zeros((height, width), dtype="<u4")
+    rows, cols = grid.height, grid.width
+    if side_len <= 0:
+        return frame
+
+    x, y = origin
+    area = frame[y:y + rows * side_len, x:x + cols * side_len]
+    # Cell (c, r) is blocks[r, c]: a view, so writes land in the frame
+    blocks = area.reshape(rows, side_len, cols, side_len).transpose(0, 2, 1, 3)
+
+    colors = np.full((rows, cols), theme["path"], dtype="<u4")
+    colors[entry[1], entry[0]] = theme["entry"]
+    colors[exit[1], exit[0]] = theme["exit"]
+    blocks[...] = colors[:, :, None, None]
+
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(rows, cols)
+    thick = max(1, side_len // 8)
+    wall = theme["wall"]
+    blocks[(cells & Direction.NORTH) > 0, :thick, :] = wall
+    blocks[(cells & Direction.SOUTH) > 0, side_len - thick:, :] = wall
+    blocks[(cells & Direction.WEST) > 0, :, :thick] = wall
+    blocks[(cells & Direction.EAST) > 0, :, side_len - thick:] = wall
+
+    if solution:
+        path = np.array(solution, dtype=np.intp)
+        solution_thick = max(1, side_len // 3)
+        margin = (side_len - solution_thick) // 2
+        square = slice(margin, margin + solution_thick)
+        blocks[path[:, 1], path[:, 0], square, square] = theme["solution"]
+
+    return frame
@@ -3,6 +3,10 @@ from mazegen.common import MazeConfig
 import sys
 
 MANDATORY_KEYS = ["WIDTH", "HEIGHT", "ENTRY", "EXIT", "OUTPUT_FILE", "PERFECT"]
+# Integer keys that must be strictly positive (SEED can be any integer)
+POSITIVE_KEYS = ["WIDTH", "HEIGHT", "WORKERS"]
+# Keys holding a share, from 0 to 1 (both included)
+RATIO_KEYS = ["IMPERFECT_RATIO"]
 
 
 def contains_negative(value: int | tuple[int, int]) -> bool:
@@ -56,13 +60,26 @@ def validate_config(config: dict[str, Any]) -> None:
             # isinstance() doesn't support generics like tuple[int, int]
             if expected_type == tuple[int, int]:
                 expected_type = tuple
-            if not isinstance(value, expected_type):
+            # Whole numbers are valid ratios too (e.g. IMPERFECT_RATIO=1)
+            elif expected_type is float:
+                expected_type = (int, float)
+            # bool is an int subclass, but only valid for bool keys
+            if not isinstance(value, expected_type) or (
+                    isinstance(value, bool) and schema[key] is not bool):
                 raise ValueError(
                     f"ERROR: Invalid value for {key} in config. " +
                     f"Expected: {expected_type}   Got: {type(value)}"
                 )
 
-        # Validate numeric value
+        # Validate ratio range
+        if key in RATIO_KEYS and not 0 <= value <= 1:
+            raise ValueError(
+                f"ERROR: {key} must be between 0 and 1 in config."
+            )
+
+        # Validate numeric value (sizes and coordinates only)
+        if isinstance(value, int) and key not in POSITIVE_KEYS:
+            continue
         if isinstance(value, (int, tuple)) and not isinstance(value, bool):
             if contains_negative(cast(tuple[int, int] | int, value)):
                 raise ValueError(
@@ -79,15 +96,16 @@ def validate_config(config: dict[str, Any]) -> None:
 
 
 def parse_value(value: str) -> Any:
-    """Parses a string value into a specific type (int, bool, or tuple).
+    """Parses a string value into a specific type (int, float, bool, tuple).
 
     Args:
         value (str): The string value to be parsed.
 
     Returns:
         Any: The parsed value. It returns an int if the string is numeric,
-        a bool if it is 'True' or 'False', a tuple of ints if it is a
-        coordinate pair (e.g., '1,2'), or the original string otherwise.
+        a float if it is a decimal number (e.g., '0.05'), a bool if it is
+        'True' or 'False', a tuple of ints if it is a coordinate pair
+        (e.g., '1,2'), or the original string otherwise.
     """
     # Try to convert to int first.
     # This will convert "-5" to -5 successfully. We allow this here
@@ -97,6 +115,10 @@ def parse_value(value: str) -> Any:
     except ValueError:
         pass
 
+    # Only plain decimals, so names like "inf" stay strings
+    if value.replace(".", "", 1).isdigit():
+        return float(value)
+
     if value == "True":
         return True
     elif value == "False":
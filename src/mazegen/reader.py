@@ -0,0 +1,268 @@
+from mmap import ACCESS_READ, mmap
+from typing import Iterator, NamedTuple
+from mazegen.common import PATTERN, pattern_origin
+from mazegen.MazeGrid import MazeGrid
+from mazegen.writer import HEADER, MAGIC, unpack_nibbles, unpack_path
+import struct
+
+
+# Cell value of every hex digit (upper or lower case), 0 for other bytes
+HEX_VALUES = bytes(
+    int(chr(byte), 16) if chr(byte) in "0123456789ABCDEFabcdef" else 0
+    for byte in range(256)
+)
+HEX_CHARS = b"0123456789ABCDEFabcdef"
+
+
+class SavedMaze(NamedTuple):
+    """A maze read back from a file written by save_maze."""
+    grid: MazeGrid
+    entry: tuple[int, int]
+    exit: tuple[int, int]
+    path: bytes
+
+
+def _parse_coords(line: bytes) -> tuple[int, int]:
+    """Parses an "x,y" line of a maze file."""
+    try:
+        x, y = line.split(b",")
+        return int(x), int(y)
+    except ValueError:
+        raise ValueError(f"ERROR: Invalid coordinates in maze file: {line!r}")
+
+
+def _to_cells(digits: bytes) -> bytes:
+    """Converts hex digits to cell values, rejecting any other byte."""
+    if digits.translate(None, HEX_CHARS):
+        raise ValueError("ERROR: Invalid hex digit in maze file.")
+    return digits.translate(HEX_VALUES)
+
+
+def restore_pattern(grid: MazeGrid) -> None:
+    """Marks the 42 pattern cells of a loaded grid as PATTERN cells (31).
+
+    Files store pattern cells as F, like fully closed cells. Where the
+    pattern sits, closed cells are turned back into 31 so solvers and
+    renderers treat them as they did before saving.
+
+    Args:
+        grid (MazeGrid): The loaded grid, modified in place.
+    """
+    origin = pattern_origin(grid.width, grid.height)
+    if origin is None:
+        return
+    start_x, start_y = origin
+    for r_index, row_list in enumerate(PATTERN):
+        for c_index, value in enumerate(row_list):
+            index = grid.index(start_x + c_index, start_y + r_index)
+            if value == 1 and grid.cells[index] == 15:
+                grid.cells[index] = 31
+    grid.touch()
+
+
+class MazeFile:
+    """
+    Random access to a saved maze file through a memory map.
+
+    Opening only locates the layout (the first newline gives the width,
+    the blank line after the grid gives the height) and reads the short
+    trailing lines; the grid itself is never parsed up front. Row y
+    starts at byte y * (width + 1), so any cell or row is read in O(1).
+
+    Binary files (OUTPUT_FORMAT=bin, recognised by their MAGIC) carry the
+    layout in their header instead; cell i is then the nibble of byte
+    i // 2 of the cell section, so access stays O(1).
+
+    Attributes:
+        width (int): The width of the maze.
+        height (int): The height of the maze.
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        exit (tuple[int, int]): Coordinates (x, y) of the exit.
+        path (bytes): The solution as direction letters (empty if the file
+                      has none, as with save_maze_stream).
+        seed (str | None): The seed stored in a binary file (None for hex
+                           files, or if the maze had no seed).
+        algorithm (str | None): The generation algorithm stored in a binary
+                                file (None for hex files).
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open and map a maze file.
+
+        Args:
+            path (str): The file written by save_maze or save_maze_stream.
+
+        Raises:
+            ValueError: If the file does not have the maze file layout.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"ERROR: Empty maze file: {path}")
+
+        self.seed: str | None = None
+        self.algorithm: str | None = None
+        self._cells_at = -1
+        if self._data[:len(MAGIC)] == MAGIC:
+            self._open_binary(path)
+            return
+
+        data = self._data
+        self.width = data.find(b"\n")
+        grid_end = data.find(b"\n\n")
+        if self.width <= 0 or grid_end < 0 or (
+                (grid_end + 1) % (self.width + 1)):
+            self.close()
+            raise ValueError(f"ERROR: Invalid maze file layout: {path}")
+        self.height = (grid_end + 1) // (self.width + 1)
+        self._grid_size = grid_end + 1
+
+        lines = data[grid_end + 2:].split(b"\n")
+        if len(lines) < 2:
+            self.close()
+            raise ValueError(f"ERROR: Missing entry or exit in: {path}")
+        self.entry = _parse_coords(lines[0])
+        self.exit = _parse_coords(lines[1])
+        self.path = lines[2] if len(lines) > 2 else b""
+
+    def _open_binary(self, path: str) -> None:
+        """Read the header of a binary maze file and locate its sections."""
+        data = self._data
+        try:
+            (_, self.width, self.height, entry_x, entry_y, exit_x, exit_y,
+             steps) = HEADER.unpack_from(data)
+            offset = HEADER.size
+            texts = []
+            for _ in range(2):
+                (length,) = struct.unpack_from("<H", data, offset)
+                offset += 2
+                texts.append(data[offset:offset + length].decode())
+                offset += length
+        except (struct.error, UnicodeDecodeError):
+            self.close()
+            raise ValueError(f"ERROR: Invalid binary maze header: {path}")
+
+        cells_size = (self.width * self.height + 1) // 2
+        path_at = offset + cells_size
+        if len(data) != path_at + (steps + 3) // 4:
+            self.close()
+            raise ValueError(f"ERROR: Invalid binary maze size: {path}")
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self.seed = texts[0] or None
+        self.algorithm = texts[1]
+        self.path = unpack_path(data[path_at:], steps)
+        self._cells_at = offset
+
+    def cell(self, x: int, y: int) -> int:
+        """Return the wall bitmask of cell (x, y), read from the file."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("MazeFile cell out of range")
+        if self._cells_at >= 0:
+            index = y * self.width + x
+            byte = self._data[self._cells_at + (index >> 1)]
+            return byte & 15 if index & 1 else byte >> 4
+        return HEX_VALUES[self._data[y * (self.width + 1) + x]]
+
+    def row(self, y: int) -> bytes:
+        """Return the wall bitmasks of row y, read from the file."""
+        if not 0 <= y < self.height:
+            raise IndexError("MazeFile row index out of range")
+        if self._cells_at >= 0:
+            return bytes(self._unpack(y * self.width, self.width))
+        start = y * (self.width + 1)
+        return _to_cells(self._data[start:start + self.width])
+
+    def iter_rows(self) -> Iterator[bytes]:
+        """Yield the wall bitmasks of each row, from top to bottom."""
+        for y in range(self.height):
+            yield self.row(y)
+
+    def to_grid(self) -> MazeGrid:
+        """Parse the whole grid into a MazeGrid, pattern cells restored.
+
+        Raises:
+            ValueError: If a row is not exactly width hex digits long.
+        """
+        grid = MazeGrid(self.width, self.height, 0)
+        if self._cells_at >= 0:
+            grid.cells[:] = self._unpack(0, self.width * self.height)
+            restore_pattern(grid)
+            return grid
+        digits = bytearray(self._data[:self._grid_size])
+        # Every (width + 1)-th byte ends a row; anything else is misaligned
+        if digits[self.width::self.width + 1] != b"\n" * self.height:
+            raise ValueError(
+                f"ERROR: Maze file rows are not {self.width} digits long."
+            )
+        del digits[self.width::self.width + 1]
+        grid.cells[:] = _to_cells(bytes(digits))
+        restore_pattern(grid)
+        return grid
+
+    def _unpack(self, start: int, count: int) -> bytearray:
+        """Unpack count cells from cell index start of a binary file."""
+        first = self._cells_at + (start >> 1)
+        end = self._cells_at + ((start + count + 1) >> 1)
+        cells = unpack_nibbles(self._data[first:end], 2 * (end - first))
+        return cells[start & 1:(start & 1) + count]
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> "MazeFile":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def load_maze(path: str) -> SavedMaze:
+    """Reads a maze file written by save_maze back into memory.
+
+    Args:
+        path (str): The maze file.
+
+    Returns:
+        SavedMaze: The grid (with pattern cells restored to 31), the entry
+        and exit coordinates, and the solution as direction letters.
+
+    Raises:
+        ValueError: If the file is not a valid maze file.
+    """
+    with MazeFile(path) as maze:
+        return SavedMaze(maze.to_grid(), maze.entry, maze.exit, maze.path)
+
+
+def iter_rows(path: str) -> Iterator[bytes]:
+    """Streams the rows of a maze file without loading or mapping it.
+
+    Lines are read one at a time through a buffered file, so a one-pass
+    consumer only ever holds a single row. Binary files are read row by
+    row through their memory map instead.
+
+    Args:
+        path (str): The maze file.
+
+    Returns:
+        Iterator[bytes]: The wall bitmasks of each row, from top to bottom
+        (pattern cells read as 15).
+
+    Raises:
+        ValueError: If a row holds something other than hex digits.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) == MAGIC:
+            with MazeFile(path) as maze:
+                yield from maze.iter_rows()
+            return
+        file.seek(0)
+        for line in file:
+            line = line.rstrip(b"\n")
+            if not line:
+                return
+            yield _to_cells(line)
@@ -0,0 +1,213 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Any, cast
+from mazegen.engines import backtracker
+from mazegen.MazeGrid import MazeGrid
+import random
+
+
+# A tile to carve: shared memory name, grid width, x, y, width, height, seed
+TileTask = tuple[str, int, int, int, int, int, int]
+
+
+def _carve_tile(task: TileTask) -> tuple[int, "array[int] | None"]:
+    """Carves one tile of the shared grid into a spanning forest.
+
+    Runs in a worker process. The tile is copied out of shared memory,
+    carved with the backtracker kernel from every cell still closed (the
+    42 pattern can split a tile into several regions), and copied back.
+
+    Args:
+        task (TileTask): The tile to carve.
+
+    Returns:
+        tuple[int, array[int] | None]: The number of regions in the tile, and
+        the region of each of its cells (None when there is only one).
+    """
+    name, width, x0, y0, tile_w, tile_h, seed = task
+    shm = SharedMemory(name=name)
+    try:
+        buf = cast(memoryview, shm.buf)
+        tile = MazeGrid(tile_w, tile_h)
+        for y in range(tile_h):
+            start = (y0 + y) * width + x0
+            tile.cells[y * tile_w:(y + 1) * tile_w] = buf[start:start + tile_w]
+
+        rng = random.Random(seed)
+        regions = 0
+        pos = tile.cells.find(15)
+        while pos >= 0:
+            backtracker(tile, (pos % tile_w, pos // tile_w), rng)
+            regions += 1
+            pos = tile.cells.find(15, pos + 1)
+
+        for y in range(tile_h):
+            start = (y0 + y) * width + x0
+            buf[start:start + tile_w] = tile.cells[y * tile_w:(y + 1) * tile_w]
+        del buf
+    finally:
+        shm.close()
+
+    if regions <= 1:
+        return regions, None
+    return regions, _label_regions(tile)
+
+
+def _label_regions(tile: MazeGrid) -> "array[int]":
+    """Numbers the connected regions of a carved tile (-1 for pattern)."""
+    width = tile.width
+    cells = tile.cells
+    labels = array("i", [-1]) * len(cells)
+    region = 0
+    for first in range(len(cells)):
+        if labels[first] >= 0 or cells[first] == 31:
+            continue
+        labels[first] = region
+        queue = deque([first])
+        while queue:
+            index = queue.popleft()
+            for bit, step in ((1, -width), (2, 1), (4, width), (8, -1)):
+                neighbor = index + step
+                if not cells[index] & bit and labels[neighbor] < 0:
+                    labels[neighbor] = region
+                    queue.append(neighbor)
+        region += 1
+    return labels
+
+
+def carve_tiled(
+    grid: MazeGrid,
+    rng: random.Random,
+    tile_size: int = 512,
+    workers: int | None = None
+) -> None:
+    """Carves a perfect maze by generating tiles in parallel processes.
+
+    The grid is placed in shared memory and split into square tiles.
+    Each worker carves the spanning forest of its tiles straight into the
+    shared buffer. The tiles are then joined by shuffling every wall on a
+    tile border and opening it only when the regions on both sides are
+    not yet connected (a union-find over regions), which opens exactly
+    enough border walls for the maze to stay perfect.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        rng (random.Random): The random source; it seeds each tile and
+                             orders the border walls, so the result does
+                             not depend on how tiles are scheduled.
+        tile_size (int, optional): The side of a tile, in cells.
+                                   Defaults to 512.
+        workers (int | None, optional): The number of worker processes.
+                                        Defaults to the number of CPUs.
+    """
+    width, height = grid.width, grid.height
+    tiles = [
+        (x0, y0, min(tile_size, width - x0), min(tile_size, height - y0))
+        for y0 in range(0, height, tile_size)
+        for x0 in range(0, width, tile_size)
+    ]
+
+    shm = SharedMemory(create=True, size=len(grid.cells))
+    try:
+        buf = cast(memoryview, shm.buf)
+        buf[:len(grid.cells)] = grid.cells
+        tasks = [
+            (shm.name, width, x0, y0, tile_w, tile_h, rng.getrandbits(64))
+            for x0, y0, tile_w, tile_h in tiles
+        ]
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_carve_tile, tasks))
+        grid.cells[:] = buf[:len(grid.cells)]
+        del buf
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Give every region of every tile its own node in the union-find
+    tiles_x = (width + tile_size - 1) // tile_size
+    first_node = array("I", [0])
+    for regions, _ in results:
+        first_node.append(first_node[-1] + regions)
+
+    def node(x: int, y: int) -> int:
+        tile = (y // tile_size) * tiles_x + x // tile_size
+        labels = results[tile][1]
+        if labels is None:
+            return first_node[tile]
+        tile_w = tiles[tile][2]
+        local = (y % tile_size) * tile_w + x % tile_size
+        return first_node[tile] + labels[local]
+
+    cells = grid.cells
+    walls = array("I")
+    for x in range(tile_size, width, tile_size):
+        for y in range(height):
+            index = y * width + x - 1
+            if cells[index] != 31 and cells[index + 1] != 31:
+                walls.append(index << 1)
+    for y in range(tile_size, height, tile_size):
+        for x in range(width):
+            index = (y - 1) * width + x
+            if cells[index] != 31 and cells[index + width] != 31:
+                walls.append(index << 1 | 1)
+    rng.shuffle(walls)
+
+    parent = array("I", range(first_node[-1]))
+    for wall in walls:
+        index = wall >> 1
+        neighbor = index + (width if wall & 1 else 1)
+        a = node(index % width, index // width)
+        b = node(neighbor % width, neighbor // width)
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+        if wall & 1:
+            cells[index] -= 4
+            cells[neighbor] -= 1
+        else:
+            cells[index] -= 2
+            cells[neighbor] -= 8
+    grid.touch()
+
+
+def benchmark_tiled(
+    width: int,
+    height: int,
+    seed: Any = None,
+    tile_size: int = 512,
+    workers: int | None = None
+) -> dict[str, float]:
+    """Times tiled generation against the single-process backtracker.
+
+    Args:
+        width (int): The width of the benchmark maze.
+        height (int): The height of the benchmark maze.
+        seed (Any, optional): The seed for both runs. Defaults to None.
+        tile_size (int, optional): The side of a tile. Defaults to 512.
+        workers (int | None, optional): The number of worker processes.
+                                        Defaults to the number of CPUs.
+
+    Returns:
+        dict[str, float]: The "single" and "tiled" times in seconds, and
+        the "speedup" of the tiled run.
+    """
+    grid = MazeGrid(width, height)
+    start = perf_counter()
+    backtracker(grid, (0, 0), random.Random(seed))
+    single = perf_counter() - start
+
+    grid = MazeGrid(width, height)
+    start = perf_counter()
+    carve_tiled(grid, random.Random(seed), tile_size, workers)
+    tiled = perf_counter() - start
+
+    return {"single": single, "tiled": tiled, "speedup": single / tiled}
@@ -0,0 +1,242 @@
+from array import array
+from mazegen.common import Direction
+from mazegen.MazeGrid import MazeGrid, as_grid
+from mazegen.reader import load_maze
+
+
+# 0/1 flags of a cell value: wall closed on each side, free cell, bad value
+CLOSED = {
+    direction: bytes(
+        1 if value & direction else 0 for value in range(256)
+    )
+    for direction in Direction
+}
+FREE_FLAG = bytes(0 if value == 31 else 1 for value in range(256))
+INVALID_FLAG = bytes(0 if value < 16 or value == 31 else 1
+                     for value in range(256))
+DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _row_boards(grid: MazeGrid, table: bytes) -> list[int]:
+    """Returns one bitboard per row: bit x is the flag of cell (x, y)."""
+    flags = grid.cells.translate(table).translate(DIGITS)
+    width = grid.width
+    return [
+        int(flags[start:start + width][::-1], 2)
+        for start in range(0, len(flags), width)
+    ]
+
+
+def _first(board: int) -> int:
+    """Returns the position of the lowest set bit of a bitboard."""
+    return (board & -board).bit_length() - 1
+
+
+def _check_walls(grid: MazeGrid) -> None:
+    """Checks cell values, the outer border and wall symmetry, by rows."""
+    width, height = grid.width, grid.height
+    full = (1 << width) - 1
+    invalid = _row_boards(grid, INVALID_FLAG)
+    north = _row_boards(grid, CLOSED[Direction.NORTH])
+    east = _row_boards(grid, CLOSED[Direction.EAST])
+    south = _row_boards(grid, CLOSED[Direction.SOUTH])
+    west = _row_boards(grid, CLOSED[Direction.WEST])
+
+    for y in range(height):
+        if invalid[y]:
+            x = _first(invalid[y])
+            raise ValueError(
+                f"ERROR: Invalid cell value {grid.get(x, y)} at ({x}, {y})."
+            )
+        # The border: WEST of column 0, EAST of the last one, NORTH of
+        # row 0 and SOUTH of the last row
+        border = ~west[y] & 1 | ~east[y] & (1 << (width - 1))
+        if y == 0:
+            border |= ~north[y] & full
+        if y == height - 1:
+            border |= ~south[y] & full
+        if border:
+            x = _first(border)
+            raise ValueError(f"ERROR: Open outer wall at ({x}, {y}).")
+        # EAST of x against WEST of x + 1, SOUTH of y against NORTH of y + 1
+        mismatch = (east[y] ^ west[y] >> 1) & (full >> 1)
+        if mismatch:
+            x = _first(mismatch)
+            raise ValueError(
+                f"ERROR: Wall mismatch between ({x}, {y}) and ({x + 1}, {y})."
+            )
+        if y + 1 < height and south[y] ^ north[y + 1]:
+            x = _first(south[y] ^ north[y + 1])
+            raise ValueError(
+                f"ERROR: Wall mismatch between ({x}, {y}) and ({x}, {y + 1})."
+            )
+
+
+def _flood(
+    free: list[int],
+    open_east: list[int],
+    open_south: list[int],
+    width: int
+) -> list[int]:
+    """Floods the free cells from the first one, one row at a time.
+
+    Each row is a bitboard. Reaching new cells in a row first spreads them
+    along the row with a Kogge-Stone fill (log2(width) shifts cover every
+    run of open EAST walls at once), then hands the cells under an open
+    wall to the rows above and below. Rows are kept on a stack and only
+    processed while they receive new cells, so each row costs a few big
+    integer operations per visit, whatever its width.
+
+    Returns:
+        list[int]: The reached cells of each row.
+    """
+    height = len(free)
+    shifts = []
+    shift = 1
+    while shift < width:
+        shifts.append(shift)
+        shift <<= 1
+
+    reached = [0] * height
+    pending = [0] * height
+    start = next((y for y in range(height) if free[y]), None)
+    if start is None:
+        return reached
+    pending[start] = free[start] & -free[start]
+    stack = [start]
+
+    while stack:
+        y = stack.pop()
+        board, pending[y] = pending[y], 0
+        # Spread east then west through open EAST walls
+        through = open_east[y] << 1
+        for shift in shifts:
+            board |= through & (board << shift)
+            through &= through << shift
+        through = open_east[y]
+        for shift in shifts:
+            board |= through & (board >> shift)
+            through &= through >> shift
+
+        new = board & ~reached[y]
+        reached[y] |= new
+        for ny, gate in ((y + 1, open_south[y]), (y - 1, open_south[y - 1])):
+            if 0 <= ny < height:
+                enter = new & gate & ~reached[ny]
+                if enter:
+                    if not pending[ny]:
+                        stack.append(ny)
+                    pending[ny] |= enter
+    return reached
+
+
+def _find_loop(grid: MazeGrid) -> tuple[int, int, Direction]:
+    """Returns the first open wall, in row-major order, closing a loop."""
+    width = grid.width
+    cells = grid.cells
+    parent = array("I", range(len(cells)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for index, value in enumerate(cells):
+        if value == 31:
+            continue
+        for direction, step in ((Direction.EAST, 1),
+                                (Direction.SOUTH, width)):
+            if value & direction:
+                continue
+            a, b = find(index), find(index + step)
+            if a == b:
+                return index % width, index // width, direction
+            parent[b] = a
+    raise ValueError("ERROR: No loop found in maze.")
+
+
+def validate_maze(
+    grid: MazeGrid | list[list[int]],
+    perfect: bool = True
+) -> None:
+    """Checks that a maze is well formed, connected and (if asked) perfect.
+
+    The checks run in this order and the first violation is raised:
+
+    1. Every cell is a 4-bit wall mask, or 31 for a PATTERN cell.
+    2. The outer border is closed.
+    3. Walls are symmetric: a cell's EAST/SOUTH wall is its neighbor's
+       WEST/NORTH wall.
+    4. Every free (non-PATTERN) cell is reachable from every other one.
+    5. If perfect, there are no loops: with the maze connected, that is
+       exactly when the open walls number one less than the free cells.
+
+    Each row is turned into bitboards (one bit per cell) with a couple of
+    translate passes, so the wall checks are a few big integer operations
+    per row and the flood fill moves whole runs of cells at a time. Only
+    when the edge count shows a loop is a union-find pass run to locate it.
+
+    Args:
+        grid (MazeGrid | list[list[int]]): The maze to check.
+        perfect (bool, optional): If True, also require exactly one path
+                                  between any two cells. Defaults to True.
+
+    Raises:
+        ValueError: On the first violation, with the coordinates (x, y) of
+                    the offending cell.
+    """
+    grid = as_grid(grid)
+    _check_walls(grid)
+
+    free = _row_boards(grid, FREE_FLAG)
+    # Walls are symmetric from here on, so EAST and SOUTH cover them all
+    open_east = [
+        row & ~closed
+        for row, closed in zip(free, _row_boards(grid, CLOSED[Direction.EAST]))
+    ]
+    open_south = [
+        row & ~closed for row, closed in
+        zip(free, _row_boards(grid, CLOSED[Direction.SOUTH]))
+    ]
+    reached = _flood(free, open_east, open_south, grid.width)
+    for y, (row, seen) in enumerate(zip(free, reached)):
+        if row & ~seen:
+            x = _first(row & ~seen)
+            raise ValueError(f"ERROR: Cell ({x}, {y}) is not connected.")
+
+    if not perfect:
+        return
+    cells = sum(row.bit_count() for row in free)
+    edges = sum(row.bit_count() for row in open_east + open_south)
+    if edges != cells - 1:
+        x, y, direction = _find_loop(grid)
+        raise ValueError(
+            f"ERROR: Maze is not perfect, the {direction.name} wall of "
+            f"({x}, {y}) closes a loop."
+        )
+
+
+def validate_file(path: str, perfect: bool = True) -> None:
+    """Checks a maze file written by save_maze (hex or binary format).
+
+    The file is loaded with mazegen.reader.load_maze, so PATTERN cells are
+    restored before validate_maze runs. The entry and exit must also be
+    free cells inside the maze.
+
+    Args:
+        path (str): The maze file.
+        perfect (bool, optional): If True, also require a perfect maze.
+                                  Defaults to True.
+
+    Raises:
+        ValueError: If the file cannot be read or the maze is invalid.
+    """
+    saved = load_maze(path)
+    grid = saved.grid
+    for name, (x, y) in (("entry", saved.entry), ("exit", saved.exit)):
+        if not (0 <= x < grid.width and 0 <= y < grid.height):
+            raise ValueError(f"ERROR: The {name} ({x}, {y}) is outside.")
+        if grid.get(x, y) == 31:
+            raise ValueError(f"ERROR: The {name} ({x}, {y}) is blocked.")
+    validate_maze(grid, perfect)
@@ -0,0 +1,206 @@
+from collections import deque
+from mazegen.MazeGrid import MazeGrid
+import numpy as np
+import numpy.typing as npt
+import random
+
+
+# Direction from a cell to its parent in the carved forest
+PARENT_NORTH = 0
+PARENT_WEST = 1
+PARENT_EAST = 2
+PARENT_ROOT = 3
+
+
+def binary_tree(
+    grid: MazeGrid,
+    entry: tuple[int, int],
+    rng: random.Random
+) -> None:
+    """Carves a perfect maze into the grid with a vectorized Binary Tree.
+
+    Every free cell opens either its NORTH or its WEST wall, picked with a
+    coin flip over the whole grid at once (or the only one available when
+    the border or the 42 pattern blocks the other side). Cells where both
+    sides are blocked become extra roots, joined afterwards by
+    _join_forest.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        rng (random.Random): The random source to draw from.
+    """
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(
+        grid.height, grid.width
+    )
+    coins = np.random.default_rng(rng.getrandbits(64))
+    free = cells != 31
+
+    can_north = free.copy()
+    can_north[0, :] = False
+    can_north[1:, :] &= free[:-1, :]
+    can_west = free.copy()
+    can_west[:, 0] = False
+    can_west[:, 1:] &= free[:, :-1]
+
+    heads = coins.integers(0, 2, size=cells.shape, dtype=np.bool_)
+    north = can_north & (heads | ~can_west)
+    west = can_west & ~north
+
+    north_bits = north.view(np.uint8)
+    west_bits = west.view(np.uint8)
+    cells -= north_bits
+    cells[:-1, :] -= north_bits[1:, :] << 2
+    cells -= west_bits << 3
+    cells[:, :-1] -= west_bits[:, 1:] << 1
+
+    parent = np.full(cells.shape, PARENT_ROOT, dtype=np.uint8)
+    parent[north] = PARENT_NORTH
+    parent[west] = PARENT_WEST
+    _join_forest(grid, parent)
+    grid.touch()
+
+
+def sidewinder(
+    grid: MazeGrid,
+    entry: tuple[int, int],
+    rng: random.Random
+) -> None:
+    """Carves a perfect maze into the grid with a vectorized Sidewinder.
+
+    The first row is one open corridor. In every other row, coin flips
+    split the cells into runs of open EAST walls, and each run opens the
+    NORTH wall of one random cell. Runs are found for the whole grid at
+    once by a cumulative sum over run starts, and the cell of each run is
+    picked by ranking its candidates. Runs with no cell that can go north
+    (cut off by the 42 pattern) become extra roots, joined afterwards by
+    _join_forest.
+
+    Args:
+        grid (MazeGrid): The grid to carve, modified in place.
+        entry (tuple[int, int]): Coordinates (x, y) of the entrance.
+        rng (random.Random): The random source to draw from.
+    """
+    height, width = grid.height, grid.width
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(height, width)
+    coins = np.random.default_rng(rng.getrandbits(64))
+    free = cells != 31
+
+    # EAST walls opened inside runs; the first row never closes its run
+    east = np.zeros(cells.shape, dtype=np.bool_)
+    east[:, :-1] = free[:, :-1] & free[:, 1:]
+    east[1:, :] &= coins.integers(0, 2, size=(height - 1, width),
+                                  dtype=np.bool_)
+    east_bits = east.view(np.uint8)
+    cells -= east_bits << 1
+    cells[:, 1:] -= east_bits[:, :-1] << 3
+
+    # Number the runs in row-major order
+    starts = free.copy()
+    starts[:, 1:] &= ~east[:, :-1]
+    run_of = (np.cumsum(starts.ravel(), dtype=np.int64) - 1).reshape(
+        cells.shape
+    )
+    run_count = int(starts.sum())
+    run_first = np.flatnonzero(starts.ravel())
+
+    # Pick one random cell per run among those that can go north
+    can_north = np.zeros(cells.shape, dtype=np.bool_)
+    can_north[1:, :] = free[1:, :] & free[:-1, :]
+    candidates = np.flatnonzero(can_north.ravel())
+    candidate_runs = run_of.ravel()[candidates]
+    counts = np.bincount(candidate_runs, minlength=run_count)
+    offsets = np.cumsum(counts) - counts
+    ranks = (coins.random(run_count) * counts).astype(np.int64)
+    linked = counts > 0
+    link = run_first.copy()
+    link[linked] = candidates[offsets[linked] + ranks[linked]]
+
+    flat = cells.ravel()
+    north_cells = link[linked]
+    flat[north_cells] -= 1
+    flat[north_cells - width] -= 4
+
+    # Parents point along the run towards its link cell
+    run_link = link[run_of.ravel()]
+    index = np.arange(flat.size)
+    parent = np.where(index < run_link, PARENT_EAST, PARENT_WEST)
+    parent[north_cells] = PARENT_NORTH
+    parent[run_first[~linked]] = PARENT_ROOT
+    parent = parent.astype(np.uint8).reshape(cells.shape)
+    parent[~free] = PARENT_ROOT
+    _join_forest(grid, parent)
+    grid.touch()
+
+
+def _join_forest(grid: MazeGrid, parent: npt.NDArray[np.uint8]) -> None:
+    """Joins the trees of a carved forest into a single spanning tree.
+
+    Both vectorized engines carve every free cell into a tree whose root
+    is the first free cell, except where the 42 pattern leaves a few cells
+    with no way towards it; those start trees of their own. Each extra
+    tree is walked through its open walls until a closed wall leading to a
+    different tree is found, which is then opened. A union-find over the
+    roots guarantees no loop is created. Only the small cut-off trees are
+    visited, so this stays negligible next to the vectorized carving.
+
+    Args:
+        grid (MazeGrid): The carved grid, modified in place.
+        parent (npt.NDArray[np.uint8]): The direction from every cell to
+            its parent (PARENT_ROOT for roots and blocked cells).
+    """
+    width = grid.width
+    cells = grid.cells
+    parents = parent.ravel().tobytes()
+    free_roots = [
+        int(index) for index in np.flatnonzero(parent.ravel() == PARENT_ROOT)
+        if cells[index] != 31
+    ]
+    if len(free_roots) < 2:
+        return
+
+    steps = (-width, -1, 1)
+    union: dict[int, int] = {root: root for root in free_roots}
+
+    def find(root: int) -> int:
+        while union[root] != root:
+            union[root] = union[union[root]]
+            root = union[root]
+        return root
+
+    def root_of(index: int) -> int:
+        while parents[index] != PARENT_ROOT:
+            index += steps[parents[index]]
+        return find(index)
+
+    main = free_roots[0]
+    for root in free_roots[1:]:
+        while find(root) != find(main):
+            own = find(root)
+            seen = {root}
+            queue = deque([root])
+            joined = False
+            while queue and not joined:
+                index = queue.popleft()
+                x = index % width
+                for bit, opposite, step, inside in (
+                    (1, 4, -width, index >= width),
+                    (2, 8, 1, x < width - 1),
+                    (4, 1, width, index + width < len(cells)),
+                    (8, 2, -1, x > 0),
+                ):
+                    neighbor = index + step
+                    if not inside or cells[neighbor] == 31:
+                        continue
+                    if not cells[index] & bit:
+                        if neighbor not in seen:
+                            seen.add(neighbor)
+                            queue.append(neighbor)
+                    elif root_of(neighbor) != own:
+                        union[own] = root_of(neighbor)
+                        cells[index] -= bit
+                        cells[neighbor] -= opposite
+                        joined = True
+                        break
+            if not joined:
+                raise ValueError("ERROR: Pattern leaves unreachable cells.")
@@ -1,10 +1,141 @@
-from mazegen.common import DIRECTION_OFFSETS
+from typing import BinaryIO, Iterable, Iterator
 from mazegen.common import MazeConfig
+from mazegen.HalfEdgeGrid import HalfEdgeGrid
+from mazegen.MazeGrid import MazeGrid, as_grid
+from mazegen.MazeSolver import path_to_directions
+import struct
+
+
+# Uppercase hex digit of every cell value; PATTERN cells (31) are written
+# as F, like a fully closed cell
+HEX_DIGITS = bytes(b"0123456789ABCDEF"[value & 15] for value in range(256))
+
+# About how many bytes of grid are converted and written at once
+CHUNK_SIZE = 1 << 20
+
+# Binary format (OUTPUT_FORMAT=bin): magic, width, height, entry x/y,
+# exit x/y and number of path steps, little-endian; then the seed and the
+# algorithm as UTF-8 strings prefixed by their 2-byte length; then the
+# cells, two per byte (first cell in the high nibble); then the path, four
+# steps per byte (first step in the top two bits, N=0, E=1, S=2, W=3)
+MAGIC = b"AMZ1"
+HEADER = struct.Struct("<4sIIIIIIQ")
+OUTPUT_FORMATS = ("hex", "bin")
+
+# Nibble and 2-bit packing tables, indexed by byte value
+HIGH_NIBBLE = bytes((value & 15) << 4 for value in range(256))
+LOW_NIBBLE = bytes(value & 15 for value in range(256))
+UPPER_NIBBLE = bytes(value >> 4 for value in range(256))
+PATH_CODES = bytes.maketrans(b"NESW", b"\x00\x01\x02\x03")
+PATH_LETTERS = bytes.maketrans(b"\x00\x01\x02\x03", b"NESW")
+# Code shifted into slot k of a path byte, and back out of it
+CODE_SHIFTS = tuple(
+    bytes((value & 3) << (6 - 2 * slot) for value in range(256))
+    for slot in range(4)
+)
+CODE_SLOTS = tuple(
+    bytes(value >> (6 - 2 * slot) & 3 for value in range(256))
+    for slot in range(4)
+)
+
+
+def _or_bytes(parts: list[bytes]) -> bytes:
+    """Returns the bytewise OR of equally long byte strings."""
+    total = 0
+    for part in parts:
+        total |= int.from_bytes(part, "big")
+    return total.to_bytes(len(parts[0]), "big")
+
+
+def pack_nibbles(cells: bytes | bytearray) -> bytes:
+    """Packs cell values two per byte, the first in the high nibble.
+
+    Pattern cells (31) keep only their low nibble (15), like in hex files.
+    """
+    cells = bytes(cells) + bytes(len(cells) % 2)
+    return _or_bytes([
+        cells[0::2].translate(HIGH_NIBBLE), cells[1::2].translate(LOW_NIBBLE)
+    ])
+
+
+def unpack_nibbles(packed: bytes, count: int) -> bytearray:
+    """Unpacks the first count cell values of nibble-packed bytes."""
+    cells = bytearray(2 * len(packed))
+    cells[0::2] = packed.translate(UPPER_NIBBLE)
+    cells[1::2] = packed.translate(LOW_NIBBLE)
+    del cells[count:]
+    return cells
+
+
+def pack_path(letters: bytes) -> bytes:
+    """Packs direction letters four per byte, as 2-bit codes."""
+    codes = letters.translate(PATH_CODES)
+    codes += bytes(-len(codes) % 4)
+    if not codes:
+        return b""
+    return _or_bytes([
+        codes[slot::4].translate(CODE_SHIFTS[slot]) for slot in range(4)
+    ])
+
+
+def unpack_path(packed: bytes, steps: int) -> bytes:
+    """Unpacks the first steps direction letters of a packed path."""
+    codes = bytearray(4 * len(packed))
+    for slot in range(4):
+        codes[slot::4] = packed.translate(CODE_SLOTS[slot])
+    del codes[steps:]
+    return bytes(codes.translate(PATH_LETTERS))
+
+
+def _write_header(file: BinaryIO, config: MazeConfig, steps: int) -> None:
+    """Writes the header of a binary maze file."""
+    file.write(HEADER.pack(
+        MAGIC, config["WIDTH"], config["HEIGHT"],
+        *config["ENTRY"], *config["EXIT"], steps
+    ))
+    seed = config.get("SEED")
+    for text in ("" if seed is None else str(seed),
+                 config.get("ALGORITHM", "backtracker")):
+        data = text.encode()
+        file.write(struct.pack("<H", len(data)) + data)
+
+
+def _output_format(config: MazeConfig) -> str:
+    """Returns the OUTPUT_FORMAT of a configuration, checking it."""
+    output_format = config.get("OUTPUT_FORMAT", "hex")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"ERROR: Unknown OUTPUT_FORMAT '{output_format}'. " +
+            f"Expected one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+    return output_format
+
+
+def hex_rows(cells: bytes | bytearray, width: int) -> Iterator[bytes]:
+    """Converts a flat grid buffer to hex lines, in large chunks.
+
+    Each chunk of whole rows is translated to hex digits with one
+    bytes.translate call, then split into lines with a join over views.
+
+    Args:
+        cells (bytes | bytearray): The flat grid buffer, row by row.
+        width (int): The number of cells per row.
+
+    Returns:
+        Iterator[bytes]: Blocks of complete lines, each line ending with a
+        newline.
+    """
+    step = max(1, CHUNK_SIZE // (width + 1)) * width
+    for start in range(0, len(cells), step):
+        digits = memoryview(cells[start:start + step].translate(HEX_DIGITS))
+        yield b"\n".join(
+            digits[i:i + width] for i in range(0, len(digits), width)
+        ) + b"\n"
 
 
 def save_maze(
-    grid: list[list[int]],
-    path: list[tuple[int, int]],
+    grid: MazeGrid | HalfEdgeGrid | list[list[int]],
+    path: list[tuple[int, int]] | bytes | bytearray,
     config: MazeConfig
 ) -> None:
     """Writes the maze grid, entry/exit, and solution path to a file.
@@ -16,40 +147,86 @@ def save_maze(
     4. The Exit coordinates (x,y).
     5. The solution path as a sequence of directional letters (N, E, S, W).
 
+    With OUTPUT_FORMAT=bin, the same data is written in the binary format
+    instead (see MAGIC and HEADER), about half the size of the hex grid.
+
     Args:
-        grid (list[list[int]]): The maze grid bitmasks.
-        path (list[tuple[int, int]]): The solution path coordinates.
+        grid (MazeGrid | HalfEdgeGrid | list[list[int]]): The maze grid
+            bitmasks. A HalfEdgeGrid is expanded to 4-bit cells first.
+        path (list[tuple[int, int]] | bytes | bytearray): The solution
+            path, as coordinates or as direction letters already encoded
+            (see MazeSolver.solve_directions), which are written with a
+            single call.
         config (MazeConfig): The configuration containing output filename
                                 and entry/exit points.
+
+    Raises:
+        ValueError: If OUTPUT_FORMAT is unknown.
     """
-    # Reverse lookup to find the Direction Enum from a coordinate tuple
-    reversed_offsets = {v: k for k, v in DIRECTION_OFFSETS.items()}
-
-    with open(config["OUTPUT_FILE"], "w") as file:
-        # Write the Grid
-        for row in grid:
-            for col in row:
-                # Use f-string with :X to format integer as uppercase Hex
-                if col == 31:
-                    file.write(f"{col-16:X}")
-                else:
-                    file.write(f"{col:X}")
-            file.write("\n")
-        file.write("\n")
-
-        file.write(f"{config['ENTRY'][0]},{config['ENTRY'][1]}\n")
-        file.write(f"{config['EXIT'][0]},{config['EXIT'][1]}\n")
-
-        for i in range(len(path) - 1):
-            curr = path[i]
-            next_cell = path[i + 1]
-
-            # Calculate the direction vector (dx, dy)
-            dx = next_cell[0] - curr[0]
-            dy = next_cell[1] - curr[1]
-
-            # Look up the Direction enum and get its name (e.g., "NORTH")
-            direction_enum = reversed_offsets[(dx, dy)]
-
-            # Write the first letter of the name (e.g., "N")
-            file.write(direction_enum.name[0])
+    if isinstance(grid, HalfEdgeGrid):
+        grid = grid.to_grid()
+    grid = as_grid(grid)
+    if isinstance(path, list):
+        path = path_to_directions(path)
+
+    if _output_format(config) == "bin":
+        with open(config["OUTPUT_FILE"], "wb") as file:
+            _write_header(file, config, len(path))
+            file.write(pack_nibbles(grid.cells))
+            file.write(pack_path(bytes(path)))
+        return
+
+    # Binary mode: the hex chunks and the path letters go out as they are
+    with open(config["OUTPUT_FILE"], "wb") as file:
+        for block in hex_rows(grid.cells, grid.width):
+            file.write(block)
+        file.write(b"\n")
+
+        file.write(f"{config['ENTRY'][0]},{config['ENTRY'][1]}\n".encode())
+        file.write(f"{config['EXIT'][0]},{config['EXIT'][1]}\n".encode())
+
+        # The letters are ASCII, so the whole path is one write
+        file.write(path)
+
+
+def save_maze_stream(
+    rows: Iterable[bytes | bytearray],
+    config: MazeConfig
+) -> None:
+    """Writes a maze produced row by row, such as by eller_rows.
+
+    Each row is written as soon as it is received, so only one row is ever
+    held in memory. The format is the same as save_maze, except that the
+    solution line is left empty: solving needs the whole maze, so a
+    streamed maze is solved later from the saved file.
+
+    Args:
+        rows (Iterable[bytes | bytearray]): The wall bitmasks of each row,
+                                            from top to bottom.
+        config (MazeConfig): The configuration containing output filename
+                                and entry/exit points.
+
+    Raises:
+        ValueError: If OUTPUT_FORMAT is unknown.
+    """
+    if _output_format(config) == "bin":
+        with open(config["OUTPUT_FILE"], "wb") as file:
+            _write_header(file, config, 0)
+            # Rows of odd width share a byte with the next row
+            carry = b""
+            for row in rows:
+                cells = carry + bytes(row)
+                even = len(cells) & ~1
+                file.write(pack_nibbles(cells[:even]))
+                carry = cells[even:]
+            file.write(pack_nibbles(carry))
+        return
+
+    with open(config["OUTPUT_FILE"], "wb") as file:
+        for row in rows:
+            # Pattern cells (31) are written as F, like in save_maze
+            file.write(bytes(row).translate(HEX_DIGITS) + b"\n")
+        file.write(b"\n")
+
+        file.write(f"{config['ENTRY'][0]},{config['ENTRY'][1]}\n".encode())
+        file.write(f"{config['EXIT'][0]},{config['EXIT'][1]}\n".encode())
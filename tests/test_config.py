@@ -197,3 +197,67 @@ def test_load_config_bad_syntax() -> None:
         with patch("builtins.open", new=mock_open(read_data=mock_data)):
             with pytest.raises(ValueError):
                 load_config()
+
+
+def test_load_config_imperfect_ratio() -> None:
+    """Tests that IMPERFECT_RATIO is parsed as a float."""
+    test_args = ["prog_name", "fake_config.txt"]
+
+    mock_data = (
+        "WIDTH=20\n"
+        "HEIGHT=15\n"
+        "ENTRY=0,0\n"
+        "EXIT=19,14\n"
+        "OUTPUT_FILE=maze.txt\n"
+        "PERFECT=False\n"
+        "IMPERFECT_RATIO=0.2"
+    )
+    with patch.object(sys, 'argv', test_args):
+        with patch("builtins.open", new=mock_open(read_data=mock_data)):
+            assert load_config()["IMPERFECT_RATIO"] == 0.2
+
+
+@pytest.mark.parametrize("seed", [0, -3])
+def test_load_config_seed(seed: int) -> None:
+    """Tests that zero and negative seeds are valid."""
+    test_args = ["prog_name", "fake_config.txt"]
+
+    mock_data = (
+        "WIDTH=20\n"
+        "HEIGHT=15\n"
+        "ENTRY=0,0\n"
+        "EXIT=19,14\n"
+        "OUTPUT_FILE=maze.txt\n"
+        "PERFECT=True\n"
+        f"SEED={seed}"
+    )
+    with patch.object(sys, 'argv', test_args):
+        with patch("builtins.open", new=mock_open(read_data=mock_data)):
+            assert load_config()["SEED"] == seed
+
+
+def test_load_config_imperfect_ratio_range() -> None:
+    """Tests that IMPERFECT_RATIO=0 is valid, but not above 1 or a bool."""
+    test_args = ["prog_name", "fake_config.txt"]
+
+    mock_data = (
+        "WIDTH=20\n"
+        "HEIGHT=15\n"
+        "ENTRY=0,0\n"
+        "EXIT=19,14\n"
+        "OUTPUT_FILE=maze.txt\n"
+        "PERFECT=False\n"
+        "IMPERFECT_RATIO="
+    )
+    with patch.object(sys, 'argv', test_args):
+        with patch("builtins.open", new=mock_open(read_data=mock_data + "0")):
+            assert load_config()["IMPERFECT_RATIO"] == 0
+        with patch("builtins.open",
+                   new=mock_open(read_data=mock_data + "True")):
+            with pytest.raises(ValueError, match="Invalid value"):
+                load_config()
+        for ratio in ("1.5", "2"):
+            with patch("builtins.open",
+                       new=mock_open(read_data=mock_data + ratio)):
+                with pytest.raises(ValueError, match="between 0 and 1"):
+                    load_config()
@@ -0,0 +1,42 @@
+from mazegen.CorridorGraph import CorridorGraph
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeGrid import MazeGrid
+from mazegen.MazeSolver import MazeSolver
+
+
+def test_corridor_graph_contracts_maze() -> None:
+    """Tests that a backtracker maze keeps few cells as graph nodes."""
+    gen = MazeGenerator(height=30, width=40, seed=8)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(39, 29))
+
+    graph = CorridorGraph(gen.grid)
+
+    assert graph.cell_count == 40 * 30 - 20
+    assert graph.contraction_ratio < 0.5
+    # A tree: one edge less than nodes
+    assert graph.edge_count == graph.node_count - 1
+
+
+def test_corridor_solve_matches_bfs() -> None:
+    """Tests corridor solves against BFS, including on the same corridor."""
+    gen = MazeGenerator(height=30, width=40, seed=8)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(39, 29))
+    solver = MazeSolver(gen.grid)
+
+    for a, b in (((0, 0), (39, 29)), ((12, 3), (30, 25)), ((5, 5), (5, 5))):
+        path = solver.solve_maze(a, b, "corridor")
+        assert len(path) == len(solver.solve_maze(a, b))
+        assert path[0] == a and path[-1] == b
+    assert solver.corridor_graph() is solver.corridor_graph()
+
+
+def test_corridor_graph_pure_loop() -> None:
+    """Tests a maze that is a single loop with no junction.
+
+    Layout: a 2x2 ring, every cell open to its two ring neighbors.
+    (0,0): 9 (N, W), (1,0): 3 (N, E), (0,1): 12 (S, W), (1,1): 6 (E, S)
+    """
+    graph = CorridorGraph(MazeGrid.from_rows([[9, 3], [12, 6]]))
+
+    assert graph.node_count == 1
+    assert graph.solve((1, 0), (0, 1)) == [(1, 0), (1, 1), (0, 1)]
@@ -0,0 +1,62 @@
+from unittest.mock import patch, mock_open
+from mazegen.eller import eller_rows
+from mazegen.writer import save_maze_stream
+from mazegen.common import MazeConfig
+import random
+import pytest
+
+
+def test_eller_rows_form_perfect_maze() -> None:
+    """Tests that the streamed rows form a perfect maze around the 42."""
+    width, height = 21, 13
+    rows = list(eller_rows(width, height, (0, 0), (20, 12), random.Random(1)))
+
+    assert len(rows) == height
+    assert all(len(row) == width for row in rows)
+    assert sum(row.count(31) for row in rows) == 20
+
+    # Walls are symmetric and every free cell is reached exactly once
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    passages = 0
+    while stack:
+        x, y = stack.pop()
+        for bit, dx, dy in ((1, 0, -1), (2, 1, 0), (4, 0, 1), (8, -1, 0)):
+            if rows[y][x] & bit:
+                continue
+            nx, ny = x + dx, y + dy
+            assert rows[ny][nx] != 31
+            passages += 1
+            if (nx, ny) not in seen:
+                seen.add((nx, ny))
+                stack.append((nx, ny))
+    free_cells = width * height - 20
+    assert len(seen) == free_cells
+    assert passages == 2 * (free_cells - 1)
+
+
+def test_eller_rejects_entry_on_pattern() -> None:
+    """Tests that the ENTRY check runs before any row is produced."""
+    with pytest.raises(ValueError):
+        eller_rows(20, 15, (6, 5), (19, 14), random.Random(0))
+
+
+def test_save_maze_stream() -> None:
+    """Tests that streamed rows are written one line at a time."""
+    config: MazeConfig = {
+        "WIDTH": 2,
+        "HEIGHT": 1,
+        "OUTPUT_FILE": "test_maze.txt",
+        "ENTRY": (0, 0),
+        "EXIT": (1, 0),
+        "PERFECT": True,
+    }
+
+    m = mock_open()
+    with patch("builtins.open", m):
+        save_maze_stream(iter([bytearray([13, 7])]), config)
+
+    handle = m()
+    handle.write.assert_any_call(b"D7\n")
+    handle.write.assert_any_call(b"0,0\n")
+    handle.write.assert_any_call(b"1,0\n")
@@ -0,0 +1,40 @@
+from mazegen.engines import ENGINES, get_engine
+from mazegen.MazeGenerator import MazeGenerator
+import pytest
+
+
+def is_spanning_tree(generator: MazeGenerator) -> bool:
+    """Checks that every free cell is reached exactly once from (0, 0)."""
+    grid = generator.grid
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    passages = 0
+    while stack:
+        x, y = stack.pop()
+        for bit, dx, dy in ((1, 0, -1), (2, 1, 0), (4, 0, 1), (8, -1, 0)):
+            if grid.get(x, y) & bit:
+                continue
+            passages += 1
+            if (x + dx, y + dy) not in seen:
+                seen.add((x + dx, y + dy))
+                stack.append((x + dx, y + dy))
+    free_cells = sum(1 for value in grid.cells if value != 31)
+    return len(seen) == free_cells and passages == 2 * (free_cells - 1)
+
+
+@pytest.mark.parametrize("algorithm", sorted(ENGINES))
+def test_engine_generates_perfect_maze(algorithm: str) -> None:
+    """Tests that every engine carves a spanning tree around the 42."""
+    gen = MazeGenerator(height=15, width=20, seed=5, algorithm=algorithm)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(19, 14))
+
+    assert gen.grid.cells.count(31) == 20
+    assert is_spanning_tree(gen)
+
+
+def test_unknown_engine() -> None:
+    """Tests that an unknown ALGORITHM is rejected."""
+    with pytest.raises(ValueError):
+        get_engine("nope")
+    with pytest.raises(ValueError):
+        MazeGenerator(height=5, width=5, algorithm="nope")
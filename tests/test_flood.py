@@ -0,0 +1,40 @@
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeGrid import MazeGrid
+from mazegen.MazeSolver import MazeSolver
+import pytest
+
+pytest.importorskip("numpy")
+
+from mazegen.flood import distance_map, maze_diameter  # noqa: E402
+
+
+def test_distance_map_matches_bfs() -> None:
+    """Tests the NumPy flood fill against BFS path lengths."""
+    gen = MazeGenerator(height=20, width=30, seed=4, imperfect_ratio=0.3)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(29, 19))
+    solver = MazeSolver(gen.grid)
+
+    dist = distance_map(gen.grid, (0, 0))
+
+    assert dist.shape == (20, 30)
+    for x, y in ((29, 19), (0, 19), (15, 3)):
+        assert dist[y, x] == len(solver.solve_maze((0, 0), (x, y))) - 1
+    assert (dist == -1).sum() == 20  # Only the 42 pattern
+
+
+def test_distance_map_unreachable() -> None:
+    """Tests that closed cells stay at -1."""
+    grid = MazeGrid.from_rows([[13, 7, 15]])
+
+    assert distance_map(grid, (0, 0)).tolist() == [[0, 1, -1]]
+
+
+def test_maze_diameter_perfect() -> None:
+    """Tests that the diameter ends are that far apart in a tree."""
+    gen = MazeGenerator(height=20, width=30, seed=4)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(29, 19))
+
+    length, a, b = maze_diameter(gen.grid)
+
+    assert length == len(MazeSolver(gen.grid).solve_maze(a, b)) - 1
+    assert length == distance_map(gen.grid, a).max()
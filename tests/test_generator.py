@@ -1,4 +1,5 @@
-from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeGenerator import MazeGenerator, derive_seed
+import random
 
 
 def test_maze_dimensions() -> None:
@@ -43,3 +44,113 @@ def test_maze_randomness() -> None:
 
     # There is a tiny statistical chance this fails, but it's vanishingly small
     assert gen1.grid != gen2.grid
+
+
+# Rows of a 10x10 maze generated with seed 42 by the original nested-list
+# implementation, in two-digit hex per cell
+SEED_42_ROWS = [
+    "0D050309050503090503", "0907080609070C060B0A",
+    "0A1F0A1F0A1F1F1F0A0A", "0A1F0E1F0805071F0806",
+    "0A1F1F1F0A1F1F1F0C03", "0805031F0A1F0D050106",
+    "0A0D061F0A1F1F1F0C03", "0A09050500050505070A",
+    "0A0C030B0C050309030A", "0C05040405070C060C06",
+]
+
+# Imperfect maze of earlier releases for seed 42 (pattern walls included)
+SEED_42_IMPERFECT_ROWS = [
+    "0D050309050503090503", "0907080609070C060B0A",
+    "0A1F0A1F0A1F1F1B0A0A", "0A1F0A1F0805071E0806",
+    "0A1F1E1F0A1F1F1F0C03", "0805031F0A1F0D050106",
+    "0A0D04170A1F1F1F0C03", "0A090501000505050502",
+    "0A0C030A0C050309030A", "0C05040405070C060C06",
+]
+
+
+def count_passages(generator: MazeGenerator) -> int:
+    """Counts the open walls between neighboring cells."""
+    grid = generator.grid
+    passages = 0
+    for y in range(grid.height):
+        for x in range(grid.width):
+            passages += not grid.get(x, y) & 2
+            passages += not grid.get(x, y) & 4
+    return passages
+
+
+def test_maze_compat_mode() -> None:
+    """Tests that compat mode reproduces the original maze for a seed."""
+    gen = MazeGenerator(height=10, width=10, seed=42, compat=True)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(9, 9))
+
+    rows = ["".join(f"{v:02X}" for v in row) for row in gen.grid]
+    assert rows == SEED_42_ROWS
+
+
+def test_maze_compat_mode_imperfect() -> None:
+    """Tests that compat mode reproduces the original loops for a seed."""
+    gen = MazeGenerator(height=10, width=10, seed=42, compat=True)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+
+    rows = ["".join(f"{v:02X}" for v in row) for row in gen.grid]
+    assert rows == SEED_42_IMPERFECT_ROWS
+
+
+def test_maze_fast_kernel_is_perfect() -> None:
+    """Tests that the bulk-random kernel carves a spanning tree."""
+    gen = MazeGenerator(height=15, width=20, seed=7)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(19, 14))
+
+    free_cells = sum(1 for value in gen.grid.cells if value != 31)
+    assert 15 not in gen.grid.cells
+    assert count_passages(gen) == free_cells - 1
+
+
+def test_maze_generators_are_independent() -> None:
+    """Tests that interleaved generators keep their own random streams."""
+    solo = MazeGenerator(height=10, width=10, seed=3)
+    solo.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+
+    gen1 = MazeGenerator(height=10, width=10, seed=3)
+    gen2 = MazeGenerator(height=10, width=10, seed=4)
+    random.seed(0)
+    gen2.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+    random.random()
+    gen1.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+
+    assert gen1.grid == solo.grid
+
+
+def test_derive_seed_is_stable() -> None:
+    """Tests that batch seeds only depend on the batch seed and index."""
+    seeds = [derive_seed("batch", i) for i in range(4)]
+
+    assert seeds == [derive_seed("batch", i) for i in range(4)]
+    assert len(set(seeds)) == 4
+    assert derive_seed("batch", 0) != derive_seed("other", 0)
+
+
+def test_maze_imperfect_removes_exact_walls() -> None:
+    """Tests that an imperfect maze opens exactly the requested walls."""
+    gen = MazeGenerator(height=15, width=20, seed=5, imperfect_ratio=0.1)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(19, 14))
+
+    free_cells = sum(1 for value in gen.grid.cells if value != 31)
+    assert gen.grid.cells.count(31) == 20
+    assert count_passages(gen) == free_cells - 1 + 30
+
+
+def test_maze_imperfect_ratio_capped() -> None:
+    """Tests that a ratio of 1 opens every wall between free cells."""
+    gen = MazeGenerator(height=20, width=20, seed=5, imperfect_ratio=1.0)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(19, 19))
+
+    free = [value != 31 for value in gen.grid.cells]
+    pairs = sum(
+        free[i] and free[i + 1] for i in range(400) if i % 20 != 19
+    ) + sum(free[i] and free[i + 20] for i in range(380))
+    assert count_passages(gen) == pairs
+
+    compat = MazeGenerator(height=10, width=10, seed=5, compat=True,
+                           imperfect_ratio=5.0)
+    compat.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+    assert count_passages(compat) == 2 * 9 * 10
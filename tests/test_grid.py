@@ -0,0 +1,38 @@
+from mazegen.MazeGrid import MazeGrid, as_grid
+from mazegen.MazeSolver import MazeSolver
+
+
+def test_grid_flat_buffer() -> None:
+    """Tests that cells are stored row-major in a single byte buffer."""
+    grid = MazeGrid(width=3, height=2)
+
+    grid.set(2, 1, 9)
+
+    assert isinstance(grid.cells, bytearray)
+    assert len(grid.cells) == 6
+    assert grid.cells[grid.index(2, 1)] == 9
+    assert grid.get(2, 1) == 9
+
+
+def test_grid_nested_list_adapter() -> None:
+    """Tests the grid[y][x] compatibility view and list conversions."""
+    rows = [[13, 7], [15, 31]]
+    grid = as_grid(rows)
+
+    assert grid == rows
+    assert grid.to_rows() == rows
+    assert len(grid) == 2
+
+    # Row views write straight through to the flat buffer
+    grid[1][0] -= 8
+    assert grid.get(0, 1) == 7
+
+
+def test_solver_accepts_grid() -> None:
+    """Tests that MazeSolver works directly on a MazeGrid."""
+    grid = MazeGrid.from_rows([[13, 7]])
+
+    solver = MazeSolver(grid)
+
+    assert solver.grid is grid
+    assert solver.solve_maze((0, 0), (1, 0)) == [(0, 0), (1, 0)]
@@ -0,0 +1,34 @@
+from mazegen.common import Direction
+from mazegen.HalfEdgeGrid import HalfEdgeGrid, expand_half_edges
+from mazegen.MazeGenerator import MazeGenerator
+
+
+def test_half_edge_round_trip() -> None:
+    """Tests that a carved maze converts to half edges and back."""
+    gen = MazeGenerator(height=20, width=25, seed=8, imperfect_ratio=0.2)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(24, 19))
+
+    edges = HalfEdgeGrid.from_grid(gen.grid)
+
+    assert edges.to_grid() == gen.grid
+    for x, y in ((0, 0), (24, 19), (7, 13), (12, 9)):
+        assert edges.get(x, y) == gen.grid.get(x, y)
+
+
+def test_half_edge_carve_single_bit() -> None:
+    """Tests that carving NORTH clears the SOUTH bit of the cell above."""
+    edges = HalfEdgeGrid(3, 2)
+
+    edges.carve(1, 1, Direction.NORTH)
+    edges.carve(1, 1, Direction.WEST)
+
+    assert edges.south == bytearray([0xFD])
+    assert edges.east == bytearray([0xF7])
+    assert edges.to_cells() == bytearray([15, 11, 15, 13, 6, 15])
+
+
+def test_expand_half_edges_pattern() -> None:
+    """Tests that blocked cells and their neighbors keep closed walls."""
+    halves = bytes([2, 22, 6, 0, 4, 6])
+
+    assert expand_half_edges(halves, 3) == bytearray([11, 31, 15, 8, 5, 7])
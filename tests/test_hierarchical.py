@@ -0,0 +1,46 @@
+from mazegen.HierarchicalSolver import HierarchicalSolver
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeSolver import MazeSolver
+
+
+def make_maze() -> MazeGenerator:
+    """Generates the imperfect maze shared by these tests."""
+    gen = MazeGenerator(height=30, width=45, seed=11, imperfect_ratio=0.2)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(44, 29))
+    return gen
+
+
+def test_hierarchical_exact_matches_bfs() -> None:
+    """Tests that exact queries return a shortest path."""
+    gen = make_maze()
+    solver = MazeSolver(gen.grid)
+    hierarchy = HierarchicalSolver(gen.grid, cluster_size=8, workers=1)
+
+    for a, b in (((0, 0), (44, 29)), ((3, 25), (40, 2)), ((9, 9), (12, 9))):
+        path = hierarchy.solve(a, b)
+        assert len(path) == len(solver.solve_maze(a, b))
+        assert path[0] == a and path[-1] == b
+
+
+def test_hierarchical_near_optimal() -> None:
+    """Tests that near-optimal queries stay within twice the optimum."""
+    gen = make_maze()
+    hierarchy = HierarchicalSolver(gen.grid, cluster_size=8, workers=1)
+
+    exact = hierarchy.solve((0, 0), (44, 29))
+    exact_expanded = hierarchy.expanded
+    near = hierarchy.solve((0, 0), (44, 29), exact=False)
+
+    assert near[0] == (0, 0) and near[-1] == (44, 29)
+    assert len(exact) <= len(near) <= 2 * len(exact)
+    assert hierarchy.expanded <= exact_expanded
+
+
+def test_hierarchical_parallel_build() -> None:
+    """Tests that measuring clusters in processes gives the same graph."""
+    gen = make_maze()
+
+    local = HierarchicalSolver(gen.grid, cluster_size=8, workers=1)
+    parallel = HierarchicalSolver(gen.grid, cluster_size=8, workers=2)
+
+    assert parallel.graph == local.graph
@@ -0,0 +1,27 @@
+from mazegen.interface.lod import density_mipmaps, shade, shade_tables
+from mazegen.MazeGrid import MazeGrid
+
+
+def test_density_mipmaps() -> None:
+    """Tests the densities of each level, odd edges included."""
+    grid = MazeGrid.from_rows([[15, 0, 3], [5, 1, 31]])
+
+    levels = density_mipmaps(grid)
+
+    assert levels[0] == (bytes([255, 0, 127, 127, 63, 255]), 3, 2)
+    # Pairs of columns, then of rows: (127 + 95) // 2, (127 + 255) // 2
+    assert levels[1] == (bytes([111, 191]), 2, 1)
+    assert levels[2] == (bytes([151]), 1, 1)
+    assert len(levels) == 3
+
+
+def test_shade() -> None:
+    """Tests the colors of densities 0, 255 and in between."""
+    tables = shade_tables(0xFFFFFFFF, 0xFF000000)
+
+    pixels = shade(bytes([0, 255, 102]), tables, 2)
+
+    assert len(pixels) == 24
+    assert pixels[:8] == b"\xff\xff\xff\xff" * 2
+    assert pixels[8:16] == b"\x00\x00\x00\xff" * 2
+    assert pixels[16:20] == b"\x99\x99\x99\xff"
@@ -0,0 +1,46 @@
+from mazegen.interface.TileCache import TileCache
+from mazegen.MazeGrid import MazeGrid
+import pytest
+
+pytest.importorskip("numpy")
+
+from mazegen.interface.rasterize import rasterize  # noqa: E402
+
+THEME = {
+    "entry": 0xFF00FF00,
+    "exit": 0xFFFF0000,
+    "path": 0xFFFFFFFF,
+    "wall": 0xFF000000,
+    "solution": 0xFF0000FF,
+}
+
+
+def test_rasterize_matches_tiles() -> None:
+    """Tests the NumPy frame against the cached tile rows."""
+    grid = MazeGrid.from_rows([[9, 5, 3], [12, 5, 6]])
+    frame = rasterize(grid, (40, 20), (2, 1), 8, THEME,
+                      (0, 0), (2, 1))
+    tiles = TileCache()
+    tiles.configure(8, 1, THEME["wall"])
+
+    for r in range(2):
+        for c in range(3):
+            color = THEME["path"]
+            if (c, r) in ((0, 0), (2, 1)):
+                color = THEME["entry" if r == 0 else "exit"]
+            tile = tiles.tile(grid.get(c, r), color)
+            block = frame[1 + 8 * r:9 + 8 * r, 2 + 8 * c:10 + 8 * c]
+            assert [row.tobytes() for row in block] == list(tile)
+    assert frame[0].sum() == 0 and frame[:, :2].sum() == 0
+
+
+def test_rasterize_solution() -> None:
+    """Tests that solution squares are painted in the middle of cells."""
+    grid = MazeGrid.from_rows([[13, 7]])
+    frame = rasterize(grid, (16, 8), (0, 0), 8, THEME,
+                      (0, 0), (1, 0), [(0, 0), (1, 0)])
+
+    solution = THEME["solution"]
+    assert (frame[3:5, 3:5] == solution).all()
+    assert (frame[3:5, 11:13] == solution).all()
+    assert (frame[:, 8:] == solution).sum() == 4
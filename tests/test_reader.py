@@ -0,0 +1,118 @@
+from pathlib import Path
+from mazegen.common import MazeConfig
+from mazegen.eller import eller_rows
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeSolver import MazeSolver, directions_to_path
+from mazegen.reader import MazeFile, iter_rows, load_maze
+from mazegen.writer import save_maze, save_maze_stream
+import pytest
+import random
+
+
+def make_config(tmp_path: Path) -> MazeConfig:
+    """Returns the configuration of a 25x20 maze saved under tmp_path."""
+    return {
+        "WIDTH": 25,
+        "HEIGHT": 20,
+        "ENTRY": (0, 0),
+        "EXIT": (24, 19),
+        "OUTPUT_FILE": str(tmp_path / "maze.txt"),
+        "PERFECT": False,
+    }
+
+
+def test_load_maze_round_trip(tmp_path: Path) -> None:
+    """Tests that a saved maze loads back with its grid, ends and path."""
+    config = make_config(tmp_path)
+    gen = MazeGenerator(height=20, width=25, seed=12)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(24, 19))
+    path = MazeSolver(gen.grid).solve_maze((0, 0), (24, 19))
+    save_maze(gen.grid, path, config)
+
+    saved = load_maze(config["OUTPUT_FILE"])
+
+    assert saved.grid == gen.grid
+    assert saved.entry == (0, 0) and saved.exit == (24, 19)
+    assert directions_to_path(saved.entry, saved.path) == path
+
+
+def test_maze_file_random_access(tmp_path: Path) -> None:
+    """Tests O(1) cell and row reads through the memory map."""
+    config = make_config(tmp_path)
+    gen = MazeGenerator(height=20, width=25, seed=12)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(24, 19))
+    save_maze(gen.grid, [], config)
+
+    with MazeFile(config["OUTPUT_FILE"]) as maze:
+        assert (maze.width, maze.height) == (25, 20)
+        assert maze.cell(24, 19) == gen.grid.get(24, 19)
+        assert maze.row(3) == bytes(gen.grid.row(3))
+        assert maze.path == b""
+        with pytest.raises(IndexError):
+            maze.cell(25, 0)
+
+
+def test_iter_rows_streamed_file(tmp_path: Path) -> None:
+    """Tests streaming the rows of a file written row by row."""
+    config = make_config(tmp_path)
+    rows = list(eller_rows(25, 20, (0, 0), (24, 19), random.Random(5)))
+    save_maze_stream(iter(rows), config)
+
+    read = list(iter_rows(config["OUTPUT_FILE"]))
+
+    assert read == [bytes(value & 15 for value in row) for row in rows]
+
+
+def test_load_maze_invalid_file(tmp_path: Path) -> None:
+    """Tests that a file without the maze layout raises a ValueError."""
+    bad = tmp_path / "bad.txt"
+    bad.write_text("hello\nworld\n")
+
+    with pytest.raises(ValueError):
+        load_maze(str(bad))
+
+
+def test_load_maze_uneven_rows(tmp_path: Path) -> None:
+    """Tests that rows of uneven length are rejected, not re-flowed."""
+    bad = tmp_path / "uneven.txt"
+    # 3 rows of 3 digits in total size, but the second and third are 2 and 4
+    bad.write_text("9C5\nA6\n3F5C\n\n0,0\n2,2\n")
+
+    with MazeFile(str(bad)) as maze:
+        with pytest.raises(ValueError, match="not 3 digits long"):
+            maze.to_grid()
+        with pytest.raises(ValueError):
+            maze.row(1)
+
+
+def test_load_maze_binary_round_trip(tmp_path: Path) -> None:
+    """Tests that a binary maze loads back with its header and path."""
+    config = make_config(tmp_path)
+    config.update({"OUTPUT_FORMAT": "bin", "SEED": 12})
+    gen = MazeGenerator(height=20, width=25, seed=12)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(24, 19))
+    path = MazeSolver(gen.grid).solve_maze((0, 0), (24, 19))
+    save_maze(gen.grid, path, config)
+
+    saved = load_maze(config["OUTPUT_FILE"])
+    with MazeFile(config["OUTPUT_FILE"]) as maze:
+        assert (maze.seed, maze.algorithm) == ("12", "backtracker")
+        assert maze.cell(24, 19) == gen.grid.get(24, 19)
+        assert maze.row(3) == bytes(gen.grid.row(3))
+
+    assert saved.grid == gen.grid
+    assert saved.entry == (0, 0) and saved.exit == (24, 19)
+    assert directions_to_path(saved.entry, saved.path) == path
+
+
+def test_iter_rows_binary_stream(tmp_path: Path) -> None:
+    """Tests rows of odd width written to a binary file one at a time."""
+    config = make_config(tmp_path)
+    config["OUTPUT_FORMAT"] = "bin"
+    rows = list(eller_rows(25, 20, (0, 0), (24, 19), random.Random(5)))
+    save_maze_stream(iter(rows), config)
+
+    read = list(iter_rows(config["OUTPUT_FILE"]))
+
+    assert read == [bytes(value & 15 for value in row) for row in rows]
+    assert load_maze(config["OUTPUT_FILE"]).path == b""
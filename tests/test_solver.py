@@ -1,4 +1,6 @@
-from mazegen.MazeSolver import MazeSolver
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeSolver import MazeSolver, SOLVERS, path_to_directions
+import pytest
 
 
 def test_solve_simple_path() -> None:
@@ -35,3 +37,112 @@ def test_solve_no_path() -> None:
     path = solver.solve_maze(entry, exit)
 
     assert path == []
+
+
+def test_solvers_agree_on_length() -> None:
+    """Tests that every solver finds a valid path of the same length."""
+    gen = MazeGenerator(height=30, width=40, seed=9, imperfect_ratio=0.2)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(39, 29))
+    solver = MazeSolver(gen.grid)
+
+    paths = {}
+    expanded = {}
+    for name in SOLVERS:
+        paths[name] = solver.solve_maze((0, 0), (39, 29), name)
+        expanded[name] = solver.expanded
+
+    for path in paths.values():
+        assert len(path) == len(paths["bfs"])
+        assert path[0] == (0, 0) and path[-1] == (39, 29)
+        for (x, y), (nx, ny) in zip(path, path[1:]):
+            wall = {(0, -1): 1, (1, 0): 2, (0, 1): 4, (-1, 0): 8}
+            assert not solver.grid.get(x, y) & wall[(nx - x, ny - y)]
+    assert expanded["bidirectional"] < expanded["bfs"]
+    assert expanded["astar"] < expanded["bfs"]
+
+
+def test_solve_unknown_solver() -> None:
+    """Tests that an unknown SOLVER name raises a ValueError."""
+    solver = MazeSolver([[13, 7]])
+
+    with pytest.raises(ValueError):
+        solver.solve_maze((0, 0), (1, 0), "dfs")
+
+
+def test_solve_many_matches_solve_maze() -> None:
+    """Tests that cached multi-exit queries match single BFS solves."""
+    gen = MazeGenerator(height=20, width=25, seed=2)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(24, 19))
+    solver = MazeSolver(gen.grid)
+    exits = [(24, 19), (0, 19), (24, 0), (3, 4)]
+
+    paths = solver.solve_many((0, 0), exits)
+
+    for exit, path in zip(exits, paths):
+        assert len(path) == len(solver.solve_maze((0, 0), exit))
+        assert solver.distance((0, 0), exit) == len(path) - 1
+
+
+def test_distance_cache_invalidated() -> None:
+    """Tests that the cached distances follow changes to the grid."""
+    solver = MazeSolver([[13, 7]])
+    assert solver.distance((0, 0), (1, 0)) == 1
+
+    solver.grid.set(0, 0, 15)
+    solver.grid.set(1, 0, 15)
+
+    assert solver.distance((0, 0), (1, 0)) == -1
+    assert solver.solve_many((0, 0), [(1, 0)]) == [[]]
+
+
+def test_cache_invalidated_by_row_view() -> None:
+    """Tests that writes through grid[y][x] and touched cells drop caches."""
+    solver = MazeSolver([[13, 7]])
+    assert solver.distance((0, 0), (1, 0)) == 1
+    assert solver.tree_distance((0, 0), (1, 0)) == 1
+
+    solver.grid[0][0] = 15
+    assert solver.distance((0, 0), (1, 0)) == -1
+
+    solver.grid.cells[:] = bytes([13, 7])
+    solver.grid.touch()
+    assert solver.distance((0, 0), (1, 0)) == 1
+    solver.grid.cells[:] = bytes([15, 15])
+    solver.grid.touch()
+
+    assert solver.distance((0, 0), (1, 0)) == -1
+    assert solver.solve_maze((0, 0), (1, 0), solver="corridor") == []
+
+
+def test_tree_queries_perfect_maze() -> None:
+    """Tests LCA path queries against BFS on a perfect maze."""
+    gen = MazeGenerator(height=20, width=25, seed=6)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(24, 19))
+    solver = MazeSolver(gen.grid)
+
+    for a, b in (((0, 0), (24, 19)), ((5, 17), (20, 2)), ((3, 3), (3, 3))):
+        path = solver.solve_maze(a, b)
+        assert solver.tree_path(a, b) == path
+        assert solver.tree_distance(a, b) == len(path) - 1
+
+
+def test_tree_queries_need_perfect_maze() -> None:
+    """Tests that tree queries reject a maze with loops."""
+    gen = MazeGenerator(height=10, width=10, seed=6)
+    gen.generate_maze(is_perfect=False, entry=(0, 0), exit=(9, 9))
+
+    with pytest.raises(ValueError):
+        MazeSolver(gen.grid).tree_distance((0, 0), (9, 9))
+
+
+def test_solve_directions_matches_path() -> None:
+    """Tests that the letters encode the same path as solve_maze."""
+    gen = MazeGenerator(height=20, width=25, seed=3)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(24, 19))
+    solver = MazeSolver(gen.grid)
+
+    letters = solver.solve_directions((0, 0), (24, 19))
+
+    assert letters == path_to_directions(solver.solve_maze((0, 0), (24, 19)))
+    assert letters == solver.solve_directions((0, 0), (24, 19), "astar")
+    assert solver.solve_directions((0, 0), (0, 0)) == b""
@@ -0,0 +1,31 @@
+from mazegen.interface.TileCache import TileCache
+
+WALL = (0xFF000000).to_bytes(4, "little")
+PATH = (0xFFFFFFFF).to_bytes(4, "little")
+
+
+def test_tile_pixels() -> None:
+    """Tests the rows of a tile with NORTH and EAST walls closed."""
+    cache = TileCache()
+    cache.configure(4, 1, 0xFF000000)
+
+    tile = cache.tile(3, 0xFFFFFFFF)
+
+    assert cache.bands == [1, 0, 0, 2]
+    assert tile[0] == WALL * 4
+    assert tile[1] == PATH * 3 + WALL
+    assert tile[1] is tile[2] and tile[3] == tile[1]
+
+
+def test_tile_cache_invalidation() -> None:
+    """Tests that tiles are reused, and dropped when the size changes."""
+    cache = TileCache()
+    cache.configure(4, 1, 0xFF000000)
+    first = cache.tile(15, 0xFFFFFFFF)
+    assert cache.tile(15, 0xFFFFFFFF) is first
+
+    cache.configure(4, 1, 0xFF000000)
+    assert len(cache) == 1
+    cache.configure(8, 1, 0xFF000000)
+    assert len(cache) == 0
+    assert len(cache.tile(15, 0xFFFFFFFF)) == 8
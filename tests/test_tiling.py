@@ -0,0 +1,48 @@
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeGrid import MazeGrid
+from mazegen.tiling import carve_tiled
+import random
+import pytest
+
+
+def test_tiled_maze_is_perfect() -> None:
+    """Tests that joined tiles form a single spanning tree.
+
+    Tiles of 4 cells cut through the 42 pattern, so some tiles hold
+    several separate regions that can only be joined across borders.
+    """
+    gen = MazeGenerator(height=15, width=20, seed=2, workers=2, tile_size=4)
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(19, 14))
+
+    grid = gen.grid
+    seen = {(0, 0)}
+    stack = [(0, 0)]
+    passages = 0
+    while stack:
+        x, y = stack.pop()
+        for bit, dx, dy in ((1, 0, -1), (2, 1, 0), (4, 0, 1), (8, -1, 0)):
+            if not grid.get(x, y) & bit:
+                passages += 1
+                if (x + dx, y + dy) not in seen:
+                    seen.add((x + dx, y + dy))
+                    stack.append((x + dx, y + dy))
+    free_cells = 20 * 15 - 20
+    assert len(seen) == free_cells
+    assert passages == 2 * (free_cells - 1)
+
+
+def test_tiled_result_ignores_worker_count() -> None:
+    """Tests that the maze only depends on the seed, not on scheduling."""
+    grid1 = MazeGrid(30, 20)
+    carve_tiled(grid1, random.Random(8), tile_size=8, workers=1)
+
+    grid2 = MazeGrid(30, 20)
+    carve_tiled(grid2, random.Random(8), tile_size=8, workers=3)
+
+    assert grid1 == grid2
+
+
+def test_tiled_requires_backtracker() -> None:
+    """Tests that tiling is refused for other engines."""
+    with pytest.raises(ValueError):
+        MazeGenerator(height=10, width=10, algorithm="prim", workers=2)
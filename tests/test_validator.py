@@ -0,0 +1,68 @@
+from pathlib import Path
+from mazegen.common import MazeConfig
+from mazegen.MazeGenerator import MazeGenerator
+from mazegen.MazeGrid import MazeGrid
+from mazegen.validator import validate_file, validate_maze
+from mazegen.writer import save_maze
+import pytest
+
+
+def make_maze(perfect: bool) -> MazeGenerator:
+    """Generates a 25x20 maze with the 42 pattern."""
+    gen = MazeGenerator(height=20, width=25, seed=6)
+    gen.generate_maze(is_perfect=perfect, entry=(0, 0), exit=(24, 19))
+    return gen
+
+
+def test_validate_generated_mazes() -> None:
+    """Tests that generated mazes pass, and loops fail perfectness."""
+    validate_maze(make_maze(True).grid)
+    imperfect = make_maze(False).grid
+    validate_maze(imperfect, perfect=False)
+
+    with pytest.raises(ValueError, match="closes a loop"):
+        validate_maze(imperfect)
+
+
+def test_validate_wall_mismatch() -> None:
+    """Tests that a wall open on one side only is reported."""
+    grid = make_maze(True).grid
+    x = next(x for x in range(25) if not grid.get(x, 3) & 2)
+    grid.cells[grid.index(x, 3)] |= 2  # Close EAST, WEST of x + 1 stays
+
+    with pytest.raises(ValueError, match=rf"\({x}, 3\) and \({x + 1}, 3\)"):
+        validate_maze(grid)
+
+
+def test_validate_border_and_values() -> None:
+    """Tests open outer walls and invalid cell values."""
+    with pytest.raises(ValueError, match=r"Open outer wall at \(1, 0\)"):
+        validate_maze([[13, 6]])
+    with pytest.raises(ValueError, match=r"value 20 at \(0, 0\)"):
+        validate_maze([[20, 15]])
+
+
+def test_validate_disconnected() -> None:
+    """Tests that a closed-off cell is reported as not connected."""
+    validate_maze([[9, 5, 7], [12, 5, 7]])
+    grid = MazeGrid.from_rows([[9, 5, 7], [12, 7, 15]])
+
+    with pytest.raises(ValueError, match=r"\(2, 1\) is not connected"):
+        validate_maze(grid)
+
+
+def test_validate_file(tmp_path: Path) -> None:
+    """Tests checking saved files, pattern cells included."""
+    gen = make_maze(True)
+    config: MazeConfig = {
+        "WIDTH": 25,
+        "HEIGHT": 20,
+        "ENTRY": (0, 0),
+        "EXIT": (24, 19),
+        "OUTPUT_FILE": str(tmp_path / "maze.bin"),
+        "PERFECT": True,
+        "OUTPUT_FORMAT": "bin",
+    }
+    save_maze(gen.grid, [], config)
+
+    validate_file(config["OUTPUT_FILE"])
@@ -0,0 +1,30 @@
+from mazegen.MazeGenerator import MazeGenerator
+import pytest
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("algorithm", ["binary-tree", "sidewinder"])
+def test_vectorized_reproducibility(algorithm: str) -> None:
+    """Tests that the NumPy engines are reproducible for a seed."""
+    gen1 = MazeGenerator(height=30, width=40, seed=9, algorithm=algorithm)
+    gen1.generate_maze(is_perfect=True, entry=(0, 0), exit=(39, 29))
+
+    gen2 = MazeGenerator(height=30, width=40, seed=9, algorithm=algorithm)
+    gen2.generate_maze(is_perfect=True, entry=(0, 0), exit=(39, 29))
+
+    assert gen1.grid == gen2.grid
+    assert gen1.grid.cells.count(31) == 20
+
+
+def test_binary_tree_joins_cut_off_cells() -> None:
+    """Tests that cells walled in on their NORTH and WEST still connect.
+
+    Below the 42, some cells have the pattern both above and to the left,
+    so the Binary Tree cannot link them; they must be joined afterwards.
+    """
+    gen = MazeGenerator(height=7, width=9, seed=0, algorithm="binary-tree")
+    gen.generate_maze(is_perfect=True, entry=(0, 0), exit=(8, 6))
+
+    # (6, 4) has the pattern at (6, 3) and (5, 4)
+    assert gen.grid.get(6, 4) != 15
@@ -1,6 +1,9 @@
+from pathlib import Path
 from unittest.mock import patch, mock_open
 from mazegen.writer import save_maze
 from mazegen.common import MazeConfig
+from mazegen.MazeSolver import MazeSolver
+import pytest
 
 
 def test_save_maze_content() -> None:
@@ -29,18 +32,90 @@ def test_save_maze_content() -> None:
     with patch("builtins.open", m):
         save_maze(grid, path, config)
 
-    handle = m()
+    m.assert_called_once_with("test_maze.txt", "wb")
+    written = b"".join(call.args[0] for call in m().write.call_args_list)
 
-    # Check all write calls
-    # 1. Grid
-    handle.write.assert_any_call("F")
-    handle.write.assert_any_call("0")
-    handle.write.assert_any_call("\n")
+    # The direction from (0,0) to (1,0) is East
+    assert written == b"F0\n\n0,0\n1,0\nE"
 
-    # 2. Config
-    handle.write.assert_any_call("0,0\n")
-    handle.write.assert_any_call("1,0\n")
 
-    # 3. Path
-    # The direction from (0,0) to (1,0) is East
-    handle.write.assert_any_call("E")
+def test_save_maze_pattern_and_chunks(tmp_path: Path) -> None:
+    """Tests that pattern cells are F and rows survive chunking."""
+    grid = [[31, 1, 10], [15, 12, 6]] * 3
+    config: MazeConfig = {
+        "WIDTH": 3,
+        "HEIGHT": 6,
+        "OUTPUT_FILE": str(tmp_path / "maze.txt"),
+        "ENTRY": (0, 0),
+        "EXIT": (2, 5),
+        "PERFECT": True,
+    }
+
+    # Two rows per chunk, so the grid is written in three blocks
+    with patch("mazegen.writer.CHUNK_SIZE", 8):
+        save_maze(grid, b"", config)
+
+    content = (tmp_path / "maze.txt").read_bytes()
+    assert content == b"F1A\nFC6\n" * 3 + b"\n0,0\n2,5\n"
+
+
+def test_save_maze_direction_bytes() -> None:
+    """Tests that an encoded path is written with a single call."""
+    grid = [[13, 7]]
+    config: MazeConfig = {
+        "WIDTH": 2,
+        "HEIGHT": 1,
+        "OUTPUT_FILE": "test_maze.txt",
+        "ENTRY": (1, 0),
+        "EXIT": (0, 0),
+        "PERFECT": True,
+    }
+    path = MazeSolver(grid).solve_directions((1, 0), (0, 0))
+    assert path == b"W"
+
+    m = mock_open()
+    with patch("builtins.open", m):
+        save_maze(grid, path, config)
+
+    m().write.assert_any_call(b"W")
+
+
+def test_save_maze_binary_layout(tmp_path: Path) -> None:
+    """Tests the header, nibble-packed cells and 2-bit path of bin files."""
+    grid = [[31, 1, 10], [15, 12, 6]]
+    config: MazeConfig = {
+        "WIDTH": 3,
+        "HEIGHT": 2,
+        "OUTPUT_FILE": str(tmp_path / "maze.bin"),
+        "ENTRY": (0, 0),
+        "EXIT": (2, 1),
+        "PERFECT": True,
+        "OUTPUT_FORMAT": "bin",
+    }
+
+    save_maze(grid, b"ESSWN", config)
+
+    content = (tmp_path / "maze.bin").read_bytes()
+    header = b"AMZ1" + bytes.fromhex(
+        "03000000 02000000 00000000 00000000 02000000 01000000"
+        "0500000000000000 0000 0b00"
+    )
+    assert content == (
+        header + b"backtracker" + b"\xF1\xAF\xC6" + b"\x6B\x00"
+    )
+
+
+def test_save_maze_unknown_format(tmp_path: Path) -> None:
+    """Tests that an unknown OUTPUT_FORMAT raises a ValueError."""
+    config: MazeConfig = {
+        "WIDTH": 1,
+        "HEIGHT": 1,
+        "OUTPUT_FILE": str(tmp_path / "maze.txt"),
+        "ENTRY": (0, 0),
+        "EXIT": (0, 0),
+        "PERFECT": True,
+        "OUTPUT_FORMAT": "png",
+    }
+
+    with pytest.raises(ValueError):
+        save_maze([[15]], b"", config)